@@ -5,9 +5,27 @@ import seaborn as sns
 import missingno as msno
 from sklearn.impute import KNNImputer
 import warnings
+import io
 import os
+import sys
 warnings.filterwarnings('ignore')
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src.artifact_writer import ArtifactWriter, print_artifact_stats
+from src.render_profiles import save_figure, print_render_stats
+from src.data_loader import load_preview
+from src.sampling import sample_dataframe
+
+# 渲染配置: draft / screen / print (print = 300 dpi)
+RENDER_PROFILE = os.environ.get('RENDER_PROFILE', 'print')
+
+# 预览模式: PREVIEW_ROWS > 0 时只读取按 Neighborhood 分层的蓄水池样本 (单次扫描, 固定种子)
+PREVIEW_ROWS = int(os.environ.get('PREVIEW_ROWS', '0'))
+render_stats = []
+
+# 所有输出文件由后台线程写入 (原子重命名)，计算与磁盘 I/O 重叠
+writer = ArtifactWriter(max_pending=4)
+
 # 创建必要的输出目录
 os.makedirs("missing_visualizations", exist_ok=True)
 os.makedirs("output", exist_ok=True)
@@ -23,7 +41,10 @@ print("=" * 60)
 
 # 从data文件夹加载数据
 try:
-    df = pd.read_csv('data/train.csv')
+    if PREVIEW_ROWS > 0:
+        df = load_preview('data/train.csv', n=PREVIEW_ROWS, stratify='Neighborhood').frame
+    else:
+        df = pd.read_csv('data/train.csv')
     print("✓ 从 data/train.csv 加载数据")
 except FileNotFoundError:
     try:
@@ -61,15 +82,14 @@ print("=" * 60)
 
 # 3.1 矩阵图 (Matrix) - 单独保存
 plt.figure(figsize=(12, 8))
-msno.matrix(df.sample(min(500, len(df))), fontsize=10)
+msno.matrix(sample_dataframe(df, 500, stratify='Neighborhood', seed=42).frame, fontsize=10)
 plt.title('缺失值矩阵图 (Missing Data Matrix)', fontsize=14, fontweight='bold')
 plt.xlabel('数据字段', fontsize=12)
 plt.ylabel('样本索引', fontsize=12)
 plt.tight_layout()
 matrix_path = os.path.join("missing_visualizations", "1_missing_matrix.png")
-plt.savefig(matrix_path, dpi=300, bbox_inches='tight')
-plt.close()
-print(f"✓ 矩阵图已保存为: {matrix_path}")
+render_stats.append(save_figure(plt.gcf(), matrix_path, profile=RENDER_PROFILE, fixed_layout=True, writer=writer))
+print(f"✓ 矩阵图已加入写出队列: {matrix_path}")
 
 # 3.2 条形图 (Bar Chart) - 单独保存
 plt.figure(figsize=(12, 8))
@@ -79,9 +99,8 @@ plt.xlabel('数据字段', fontsize=12)
 plt.ylabel('完整度 (%)', fontsize=12)
 plt.tight_layout()
 bar_path = os.path.join("missing_visualizations", "2_missing_bar.png")
-plt.savefig(bar_path, dpi=300, bbox_inches='tight')
-plt.close()
-print(f"✓ 条形图已保存为: {bar_path}")
+render_stats.append(save_figure(plt.gcf(), bar_path, profile=RENDER_PROFILE, fixed_layout=True, writer=writer))
+print(f"✓ 条形图已加入写出队列: {bar_path}")
 
 # 3.3 热力图 (Heatmap) - 单独保存
 plt.figure(figsize=(10, 8))
@@ -89,9 +108,8 @@ msno.heatmap(df, cmap='RdYlGn_r', fontsize=10)
 plt.title('缺失值相关性热力图 (Missing Data Heatmap)', fontsize=14, fontweight='bold')
 plt.tight_layout()
 heatmap_path = os.path.join("missing_visualizations", "3_missing_heatmap.png")
-plt.savefig(heatmap_path, dpi=300, bbox_inches='tight')
-plt.close()
-print(f"✓ 热力图已保存为: {heatmap_path}")
+render_stats.append(save_figure(plt.gcf(), heatmap_path, profile=RENDER_PROFILE, fixed_layout=True, writer=writer))
+print(f"✓ 热力图已加入写出队列: {heatmap_path}")
 
 # 3.4 树状图 (Dendrogram) - 单独保存
 plt.figure(figsize=(10, 8))
@@ -99,9 +117,8 @@ msno.dendrogram(df, fontsize=10)
 plt.title('缺失值聚类树状图 (Missing Data Dendrogram)', fontsize=14, fontweight='bold')
 plt.tight_layout()
 dendrogram_path = os.path.join("missing_visualizations", "4_missing_dendrogram.png")
-plt.savefig(dendrogram_path, dpi=300, bbox_inches='tight')
-plt.close()
-print(f"✓ 树状图已保存为: {dendrogram_path}")
+render_stats.append(save_figure(plt.gcf(), dendrogram_path, profile=RENDER_PROFILE, fixed_layout=True, writer=writer))
+print(f"✓ 树状图已加入写出队列: {dendrogram_path}")
 
 # 3.5 额外：缺失统计条形图（按缺失比例排序）
 plt.figure(figsize=(14, 8))
@@ -121,10 +138,9 @@ for i, (idx, row) in enumerate(missing_stats_sorted.iterrows()):
 
 plt.tight_layout()
 sorted_bar_path = os.path.join("missing_visualizations", "5_missing_sorted_bar.png")
-plt.savefig(sorted_bar_path, dpi=300, bbox_inches='tight')
-plt.close()
-print(f"✓ 缺失比例排序图已保存为: {sorted_bar_path}")
-print("所有可视化图表已保存在 'missing_visualizations' 文件夹中")
+render_stats.append(save_figure(plt.gcf(), sorted_bar_path, profile=RENDER_PROFILE, fixed_layout=True, writer=writer))
+print(f"✓ 缺失比例排序图已加入写出队列: {sorted_bar_path}")
+print("所有可视化图表将写入 'missing_visualizations' 文件夹 (后台写出, 见最后的写出统计)")
 
 # ==================== 4. 实施插补策略 ====================
 print("\n" + "=" * 60)
@@ -204,12 +220,12 @@ print("=" * 60)
 
 # 保存插补后的数据到output文件夹
 output_csv = os.path.join("output", "train_imputed.csv")
-df_filled.to_csv(output_csv, index=False)
-print(f"✓ 插补后的数据已保存为: {os.path.abspath(output_csv)}")
+writer.write_csv(df_filled, output_csv, index=False)
+print(f"✓ 插补后的数据已加入写出队列: {os.path.abspath(output_csv)}")
 
 # 生成详细报告到output文件夹
 output_txt = os.path.join("output", "imputation_report.txt")
-with open(output_txt, 'w', encoding='utf-8') as f:
+with io.StringIO() as f:
     f.write("=" * 60 + "\n")
     f.write("        数据插补处理报告\n")
     f.write("=" * 60 + "\n\n")
@@ -249,8 +265,9 @@ with open(output_txt, 'w', encoding='utf-8') as f:
     f.write("4. 4_missing_dendrogram.png - 缺失聚类树状图\n")
     f.write("5. 5_missing_sorted_bar.png - 缺失比例排序图\n")
     f.write("\n所有图表保存在 'missing_visualizations' 文件夹中\n")
+    writer.write_text(output_txt, f.getvalue())
 
-print(f"✓ 处理报告已保存为: {os.path.abspath(output_txt)}")
+print(f"✓ 处理报告已加入写出队列: {os.path.abspath(output_txt)}")
 
 # ==================== 6. 完成信息 ====================
 print("\n" + "=" * 60)
@@ -266,6 +283,12 @@ print(f"  原始缺失值: {df.isnull().sum().sum()}")
 print(f"  处理后缺失值: {df_filled.isnull().sum().sum()}")
 print(f"  处理完成率: {(df.isnull().sum().sum() - df_filled.isnull().sum().sum()) / df.isnull().sum().sum() * 100:.1f}%")
 
+# 等待所有后台写出完成; 写出失败会在这里抛出
+print("\n" + "=" * 60)
+print_render_stats(render_stats)
+print_artifact_stats(writer.close())
+print("✓ 所有图表、数据与报告已写入磁盘")
+
 print("\n" + "=" * 60)
 print("所有任务已完成！可以开始录制口頭報告。")
 
@@ -2,12 +2,29 @@
 House Prices EDA Project - Source Modules
 """
 
-from .data_loader import load_dataset, get_data_info
+from .data_loader import load_dataset, get_data_info, iter_dataset_chunks, validate_csv, load_preview
 from .data_cleaner import check_missing_data, remove_high_missing_columns
 from .visualization import plot_price_distribution, plot_correlation_analysis
 from .feature_engineering import create_new_features, apply_log_transform
 from .utils import setup_environment, detect_outliers_iqr
 from .pdf_report import create_pdf_report
+from .encoding import encode_categoricals, one_hot_sparse, target_encode_columns, build_encoded_frame
+from .association import compute_feature_associations
+from .distribution import StreamingDistribution, accumulate_distribution
+from .artifact_writer import ArtifactWriter, print_artifact_stats
+from .render_profiles import RENDER_PROFILES, save_figure, benchmark_render_profiles
+from .pdf_writer import PdfDocument
+from .pdf_composer import ReportComposer
+from .imputation_eval import evaluate_imputation
+from .validation import AMES_SCHEMA, validate_dataframe, validate_chunks
+from .dedup import deduplicate_listings, find_exact_duplicates, find_near_duplicates
+from .sampling import DataSample, reservoir_sample, sample_dataframe
+from .memoize import memoize, fingerprint_frame, configure_memo_cache, clear_memo_cache, memo_cache_info
+from .sweep import SweepStats, run_sweep, plot_sweep_sensitivity
+from .drift import DriftBaseline, build_drift_baseline, score_drift, score_drift_csv, write_drift_json
+from .eda_result import EDAResult, summarize_eda
+from .report_exports import export_eda_result, save_analysis_results, generate_summary_report, render_html
+from .html_dashboard import DashboardData, build_dashboard_payload, create_html_dashboard, lttb
 
 __version__ = "1.0.0"
 __author__ = "Your Name"
@@ -0,0 +1,144 @@
+import io
+import os
+import queue
+import threading
+import time
+import pandas as pd
+
+class ArtifactWriter:
+    """
+    Write report artifacts (CSV, text, figures, PDF) on a background thread
+
+    Each artifact is written to a temporary file next to its target and
+    renamed into place once complete, so readers never see a partial file.
+    The queue is bounded: when `max_pending` artifacts are waiting, the
+    producer blocks until the writer catches up.
+
+    Figures are rendered to bytes on the calling thread because matplotlib is
+    not thread-safe; CSV serialization runs on the writer thread, so a frame
+    passed to write_csv must not be modified until flush() returns.
+    """
+
+    def __init__(self, max_pending=8):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._stats = []
+        self._errors = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='artifact-writer', daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(raise_errors=exc_type is None)
+
+    def _submit(self, path, kind, write_fn):
+        if self._closed:
+            raise RuntimeError("ArtifactWriter is closed")
+        self._queue.put((os.fspath(path), kind, write_fn, time.perf_counter()))
+
+    def write_bytes(self, path, data, kind='bytes'):
+        """Queue raw bytes"""
+        self._submit(path, kind, lambda f: f.write(data))
+
+    def write_text(self, path, text, encoding='utf-8'):
+        """Queue a text file"""
+        self.write_bytes(path, text.encode(encoding), kind='text')
+
+    def write_csv(self, df, path, **to_csv_kwargs):
+        """Queue a dataframe; serialization happens on the writer thread"""
+        to_csv_kwargs.setdefault('index', False)
+        encoding = to_csv_kwargs.pop('encoding', 'utf-8')
+
+        def write(f):
+            wrapper = io.TextIOWrapper(f, encoding=encoding, newline='')
+            df.to_csv(wrapper, **to_csv_kwargs)
+            wrapper.flush()
+            wrapper.detach()
+
+        self._submit(path, 'csv', write)
+
+    def write_figure(self, fig, path, close=True, **savefig_kwargs):
+        """Render a figure to bytes now and queue the file write"""
+        import matplotlib.pyplot as plt
+
+        buffer = io.BytesIO()
+        savefig_kwargs.setdefault('format', os.path.splitext(os.fspath(path))[1].lstrip('.') or 'png')
+        fig.savefig(buffer, **savefig_kwargs)
+        if close:
+            plt.close(fig)
+        self.write_bytes(path, buffer.getvalue(), kind='figure')
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            path, kind, write_fn, queued_at = item
+            started = time.perf_counter()
+            directory = os.path.dirname(path) or '.'
+            tmp_path = os.path.join(directory, f'.{os.path.basename(path)}.{os.getpid()}.tmp')
+            try:
+                os.makedirs(directory, exist_ok=True)
+                with open(tmp_path, 'wb') as f:
+                    write_fn(f)
+                os.replace(tmp_path, path)
+                n_bytes = os.path.getsize(path)
+                error = None
+            except Exception as e:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                n_bytes = 0
+                error = e
+            finished = time.perf_counter()
+            with self._lock:
+                self._stats.append({
+                    'Path': path,
+                    'Kind': kind,
+                    'Bytes': n_bytes,
+                    'Wait_Seconds': started - queued_at,
+                    'Write_Seconds': finished - started,
+                    'Error': None if error is None else repr(error),
+                })
+                if error is not None:
+                    self._errors.append((path, error))
+            self._queue.task_done()
+
+    def flush(self, raise_errors=True):
+        """
+        Block until every queued artifact is on disk and return per-artifact stats
+        """
+        self._queue.join()
+        with self._lock:
+            stats = pd.DataFrame(self._stats, columns=['Path', 'Kind', 'Bytes', 'Wait_Seconds',
+                                                       'Write_Seconds', 'Error'])
+            errors, self._errors = self._errors, []
+        if raise_errors and errors:
+            path, error = errors[0]
+            raise IOError(f"Failed to write {path}: {error}") from error
+        return stats
+
+    def close(self, raise_errors=True):
+        """Flush pending artifacts and stop the writer thread"""
+        if self._closed:
+            return self.flush(raise_errors)
+        stats = self.flush(raise_errors)
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        return stats
+
+def print_artifact_stats(stats):
+    """
+    Print a short summary of artifact writer stats
+    """
+    print(f"💾 Artifacts written: {len(stats)}")
+    for _, row in stats.iterrows():
+        status = '❌' if row['Error'] else '✅'
+        print(f"  {status} {row['Path']}: {row['Bytes'] / 1024:.1f} KB in {row['Write_Seconds'] * 1000:.1f} ms")
+    if len(stats):
+        print(f"  Total: {stats['Bytes'].sum() / 1024**2:.2f} MB, "
+              f"{stats['Write_Seconds'].sum():.2f} s of background I/O")
@@ -0,0 +1,205 @@
+import pandas as pd
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from .encoding import encode_categoricals, get_categorical_columns, ORDINAL_MAPS
+from .memoize import memoize
+
+def _pearson_block(X, y):
+    """Pairwise-complete Pearson correlation of every column of X with y"""
+    mask = ~np.isnan(X) & ~np.isnan(y)[:, None]
+    n = mask.sum(axis=0).astype(np.float64)
+    Xm = np.where(mask, X, 0.0)
+    ym = np.where(mask, y[:, None], 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_x = Xm.sum(axis=0) / n
+        mean_y = ym.sum(axis=0) / n
+        dx = np.where(mask, X - mean_x, 0.0)
+        dy = np.where(mask, y[:, None] - mean_y, 0.0)
+        cov = (dx * dy).sum(axis=0)
+        r = cov / np.sqrt((dx * dx).sum(axis=0) * (dy * dy).sum(axis=0))
+    r[n < 3] = np.nan
+    return r
+
+def _quantile_bins(X, bins):
+    """Equal-frequency bin index per column, -1 for missing values"""
+    ranks = pd.DataFrame(X).rank(method='average', pct=True).to_numpy()
+    valid = ~np.isnan(ranks)
+    binned = np.full(ranks.shape, -1, dtype=np.int64)
+    binned[valid] = np.clip(np.floor(ranks[valid] * bins).astype(np.int64), 0, bins - 1)
+    return binned
+
+def _eta_block(codes, y, n_levels):
+    """Correlation ratio of each categorical code column with y"""
+    valid_y = ~np.isnan(y)
+    eta = np.full(codes.shape[1], np.nan)
+    for j in range(codes.shape[1]):
+        keep = valid_y & (codes[:, j] >= 0)
+        if keep.sum() < 3:
+            continue
+        c = codes[keep, j]
+        yy = y[keep]
+        counts = np.bincount(c, minlength=n_levels[j])
+        sums = np.bincount(c, weights=yy, minlength=n_levels[j])
+        present = counts > 0
+        grand = yy.mean()
+        between = (counts[present] * (sums[present] / counts[present] - grand) ** 2).sum()
+        total = ((yy - grand) ** 2).sum()
+        eta[j] = np.sqrt(between / total) if total > 0 else np.nan
+    return eta
+
+def _mutual_info_block(binned, y_binned, n_x_bins, n_y_bins):
+    """Histogram mutual information (nats) of each binned column with binned y"""
+    n_cols = binned.shape[1]
+    width = n_x_bins * n_y_bins
+    valid = (binned >= 0) & (y_binned >= 0)[:, None]
+    col_index = np.broadcast_to(np.arange(n_cols), binned.shape)
+    flat = col_index * width + binned * n_y_bins + y_binned[:, None]
+    joint = np.bincount(flat[valid], minlength=n_cols * width).reshape(n_cols, n_x_bins, n_y_bins)
+    joint = joint.astype(np.float64)
+    totals = joint.sum(axis=(1, 2), keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        p_xy = joint / totals
+        p_x = p_xy.sum(axis=2, keepdims=True)
+        p_y = p_xy.sum(axis=1, keepdims=True)
+        terms = np.where(p_xy > 0, p_xy * np.log(p_xy / (p_x * p_y)), 0.0)
+    mi = terms.sum(axis=(1, 2))
+    mi[totals.ravel() == 0] = np.nan
+    return mi
+
+def _score_block(block, y, y_rank, y_binned, bins):
+    """Compute every association measure for one block of columns"""
+    numeric, codes, n_levels, has_order = block
+
+    pearson = _pearson_block(numeric, y)
+    # Ranks are taken over each column's own non-missing values
+    spearman = _pearson_block(pd.DataFrame(numeric).rank().to_numpy(), y_rank)
+    pearson[~has_order] = np.nan
+    spearman[~has_order] = np.nan
+
+    eta = np.full(numeric.shape[1], np.nan)
+    is_cat = n_levels > 0
+    if is_cat.any():
+        eta[is_cat] = _eta_block(codes[:, is_cat], y, n_levels[is_cat])
+
+    # Categorical codes are their own bins, numeric columns use quantile bins
+    binned = _quantile_bins(numeric, bins)
+    if is_cat.any():
+        binned[:, is_cat] = codes[:, is_cat]
+    n_x_bins = max(bins, int(n_levels.max()) if len(n_levels) else 0)
+    mutual_info = _mutual_info_block(binned, y_binned, n_x_bins, bins)
+
+    return pearson, spearman, eta, mutual_info
+
+def _prepare_columns(df, target_col):
+    """Stack numeric values and categorical codes into aligned float/int matrices"""
+    categorical = [col for col in get_categorical_columns(df) if col != target_col]
+    numeric_cols = [col for col in df.columns
+                    if col not in categorical and col != target_col]
+
+    codes_df, categories = encode_categoricals(df, categorical)
+    features = numeric_cols + categorical
+    numeric = np.empty((len(df), len(features)), dtype=np.float64)
+    numeric[:, :len(numeric_cols)] = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    codes = np.full((len(df), len(features)), -1, dtype=np.int64)
+    codes[:, len(numeric_cols):] = codes_df.to_numpy(dtype=np.int64)
+    numeric[:, len(numeric_cols):] = np.where(codes[:, len(numeric_cols):] >= 0,
+                                              codes[:, len(numeric_cols):], np.nan)
+
+    n_levels = np.array([0] * len(numeric_cols) + [len(categories[col]) for col in categorical])
+    types = ['numeric'] * len(numeric_cols) + [
+        'ordinal' if col in ORDINAL_MAPS else 'nominal' for col in categorical
+    ]
+    has_order = np.array([t != 'nominal' for t in types])
+    return features, types, numeric, codes, n_levels, has_order
+
+def _compute(numeric, codes, n_levels, has_order, y, bins, block_size, n_jobs):
+    """Run the measures over column blocks, in parallel when n_jobs > 1"""
+    y_rank = pd.Series(y).rank().to_numpy()
+    y_binned = _quantile_bins(y[:, None], bins)[:, 0]
+
+    blocks = [
+        (numeric[:, start:start + block_size], codes[:, start:start + block_size],
+         n_levels[start:start + block_size], has_order[start:start + block_size])
+        for start in range(0, numeric.shape[1], block_size)
+    ]
+
+    if n_jobs is not None and n_jobs > 1 and len(blocks) > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(
+                lambda block: _score_block(block, y, y_rank, y_binned, bins), blocks))
+    else:
+        results = [_score_block(block, y, y_rank, y_binned, bins) for block in blocks]
+
+    return [np.concatenate(parts) for parts in zip(*results)]
+
+def _association_score(pearson, spearman, eta):
+    """Common 0-1 ranking scale: |Pearson| for numeric columns, eta for categoricals"""
+    score = np.where(np.isnan(eta), np.abs(pearson), eta)
+    sign = np.sign(np.where(np.isnan(pearson), spearman, pearson))
+    sign = np.where(np.isnan(sign) | (sign == 0), 1.0, sign)
+    return score, sign * score
+
+@memoize
+def compute_feature_associations(df, target_col='SalePrice', bins=32, block_size=16,
+                                 n_jobs=None, sample_size=None, n_bootstrap=200,
+                                 confidence=0.95, seed=42, preview=None):
+    """
+    Rank numeric and categorical features by association with the target
+
+    Computes Pearson and Spearman correlation (numeric and ordinal columns),
+    the correlation ratio eta (categorical columns) and histogram mutual
+    information (all columns) in vectorized passes over column blocks. The
+    'Association' column puts every feature on one 0-1 scale (|Pearson| for
+    numeric columns, eta for categoricals) and 'Correlation' carries its sign.
+
+    When sample_size is set and the frame is larger, the measures are
+    computed on a uniform row sample and bootstrap percentile intervals are
+    added for the association score. With preview=DataSample (see
+    sampling.py) the measures come from the preview sample and the intervals
+    from a bootstrap within its strata.
+    """
+    rng = np.random.default_rng(seed)
+    if preview is not None:
+        df = preview.frame
+        sampled = True
+    elif sample_size is not None and len(df) > sample_size:
+        rows = np.sort(rng.choice(len(df), size=sample_size, replace=False))
+        df = df.iloc[rows]
+        sampled = True
+    else:
+        sampled = False
+
+    features, types, numeric, codes, n_levels, has_order = _prepare_columns(df, target_col)
+    y = df[target_col].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    pearson, spearman, eta, mutual_info = _compute(
+        numeric, codes, n_levels, has_order, y, bins, block_size, n_jobs)
+    score, signed = _association_score(pearson, spearman, eta)
+
+    result = pd.DataFrame({
+        'Feature': features,
+        'Type': types,
+        'Pearson': pearson,
+        'Spearman': spearman,
+        'Eta': eta,
+        'MutualInfo': mutual_info,
+        'Association': score,
+        'Correlation': signed,
+    })
+
+    if sampled and n_bootstrap > 0:
+        boot_scores = np.empty((n_bootstrap, len(features)))
+        if preview is not None:
+            replicates = preview.bootstrap_indices(n_bootstrap, seed)
+        else:
+            replicates = (rng.integers(0, len(y), size=len(y)) for _ in range(n_bootstrap))
+        for b, idx in enumerate(replicates):
+            p, s, e, _ = _compute(numeric[idx], codes[idx], n_levels, has_order,
+                                  y[idx], bins, block_size, n_jobs)
+            boot_scores[b], _ = _association_score(p, s, e)
+        alpha = (1 - confidence) / 2
+        result['Association_Low'] = np.nanquantile(boot_scores, alpha, axis=0)
+        result['Association_High'] = np.nanquantile(boot_scores, 1 - alpha, axis=0)
+
+    result = result.sort_values('Association', ascending=False, na_position='last')
+    return result.reset_index(drop=True)
@@ -1,11 +1,25 @@
 import pandas as pd
 import numpy as np
+from .memoize import memoize
 
-def check_missing_data(df, show_top=15):
+@memoize
+def _missing_counts(df, preview=None):
     """
-    Check data missing status
+    Missing-value table behind check_missing_data and the total count,
+    cached; the report is printed on every call
     """
+    if preview is not None:
+        estimates = preview.estimate_missing()
+        estimates = estimates[estimates['Missing_Percent'] > 0].sort_values('Missing_Percent', ascending=False)
+        missing_df = pd.DataFrame({
+            'Missing_Count': (estimates['Missing_Percent'] / 100 * preview.n_population).round().astype(int),
+            'Missing_Percent': estimates['Missing_Percent'].round(2),
+            'Std_Error': estimates['Std_Error'].round(2)
+        })
+        return missing_df, missing_df['Missing_Count'].sum()
+    
     missing = df.isnull().sum().sort_values(ascending=False)
+    total = missing.sum()
     missing = missing[missing > 0]
     missing_pct = (missing / len(df)) * 100
     
@@ -13,10 +27,25 @@ def check_missing_data(df, show_top=15):
         'Missing_Count': missing, 
         'Missing_Percent': missing_pct.round(2)
     })
-    
-    print(f"🔍 Missing Values Analysis:")
-    print(f"Columns with missing values: {len(missing_df)}")
-    print(f"Total missing values: {df.isnull().sum().sum()}")
+    return missing_df, total
+
+def check_missing_data(df, show_top=15, preview=None):
+    """
+    Check data missing status
+
+    With preview=DataSample the counts are estimated for the full data from
+    the preview sample and a Std_Error column gives the error bar of the
+    missing percent.
+    """
+    missing_df, total = _missing_counts(df, preview)
+    if preview is not None:
+        print(f"🔍 Missing Values Analysis (preview: {preview.describe()}):")
+        print(f"Columns with missing values: {len(missing_df)}")
+        print(f"Estimated total missing values: {total:,.0f}")
+    else:
+        print(f"🔍 Missing Values Analysis:")
+        print(f"Columns with missing values: {len(missing_df)}")
+        print(f"Total missing values: {total}")
     
     if len(missing_df) > 0:
         print(f"\nTop {show_top} columns with most missing values:")
@@ -1,18 +1,66 @@
 import pandas as pd
 import os
+from .validation import AMES_SCHEMA, validate_dataframe, validate_chunks, print_validation_report
+from .sampling import reservoir_sample
 
-def load_dataset(data_path="../data"):
+def load_dataset(data_path="../data", validate=False):
     """
     Load training and test datasets
+
+    With validate=True both frames are checked against the Ames schema, the
+    violations are printed and a third value is returned:
+    {'train': report, 'test': report}.
     """
     try:
         train = pd.read_csv(f"{data_path}/train.csv")
         test = pd.read_csv(f"{data_path}/test.csv")
         print("✅ Datasets loaded successfully")
-        return train, test
     except FileNotFoundError as e:
         print(f"❌ File not found: {e}")
-        return None, None
+        return (None, None, None) if validate else (None, None)
+    
+    if validate:
+        reports = {
+            'train': validate_dataframe(train),
+            'test': validate_dataframe(test, require_target=False)
+        }
+        print_validation_report(reports['train'], 'train.csv')
+        print_validation_report(reports['test'], 'test.csv')
+        return train, test, reports
+    
+    return train, test
+
+def iter_dataset_chunks(csv_path, chunksize=100_000, **read_csv_kwargs):
+    """
+    Stream a CSV file as dataframe chunks with a continuous row index
+    """
+    return pd.read_csv(csv_path, chunksize=chunksize, **read_csv_kwargs)
+
+def validate_csv(csv_path, chunksize=100_000, require_target=True):
+    """
+    Validate a CSV file chunk by chunk without loading it whole
+
+    Schema categoricals are read as category dtype, so the level check only
+    looks at each chunk's distinct values.
+    """
+    dtypes = {col: 'category' for col, spec in AMES_SCHEMA.items() if spec['kind'] == 'categorical'}
+    chunks = iter_dataset_chunks(csv_path, chunksize, dtype=dtypes)
+    report = validate_chunks(chunks, require_target=require_target)
+    print_validation_report(report, os.path.basename(csv_path))
+    return report
+
+def load_preview(csv_path, n=10_000, stratify='Neighborhood', chunksize=100_000, seed=42,
+                 **read_csv_kwargs):
+    """
+    Single-pass stratified reservoir sample of a CSV file for preview mode
+
+    Returns a DataSample; pass it as preview= to the analysis functions and
+    create_pdf_report to work on the sample with error bars.
+    """
+    chunks = iter_dataset_chunks(csv_path, chunksize, **read_csv_kwargs)
+    sample = reservoir_sample(chunks, n, stratify, seed=seed)
+    print(f"✅ Preview sample loaded: {sample.describe()}")
+    return sample
 
 def get_data_info(train_df, test_df):
     """
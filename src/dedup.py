@@ -0,0 +1,190 @@
+import time
+import pandas as pd
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from .encoding import encode_categoricals, get_categorical_columns
+
+# LotArea and LotFrontage pin the parcel: rows on different lots are never
+# the same property, however similar the houses on them are
+BLOCK_COLUMNS = ['Neighborhood', 'YearBuilt', 'GrLivArea', 'LotArea', 'LotFrontage']
+
+# Columns describing the sale rather than the property; a relisted house
+# differs in these and still is the same house
+SALE_COLUMNS = ['Id', 'SalePrice', 'MoSold', 'YrSold', 'SaleType', 'SaleCondition']
+
+def row_hashes(df, columns=None):
+    """
+    64-bit hash of every row over `columns` (vectorized, index ignored)
+    """
+    if columns is None:
+        columns = [col for col in df.columns if col != 'Id']
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+def find_exact_duplicates(df, columns=None):
+    """
+    Boolean mask of rows that repeat an earlier row over `columns`
+
+    Rows are compared by their 64-bit hash, so the cost is one hashing pass
+    plus a hash-table lookup per row.
+    """
+    return pd.Series(row_hashes(df, columns)).duplicated(keep='first').to_numpy()
+
+def _comparison_matrix(df, columns):
+    """Numeric values and categorical codes side by side, NaN for missing"""
+    categorical = [col for col in columns if col in get_categorical_columns(df)]
+    numeric = [col for col in columns if col not in categorical]
+    values = df[numeric].to_numpy(dtype=np.float64, na_value=np.nan)
+    if categorical:
+        codes_df, _ = encode_categoricals(df, categorical, ordinal_maps={})
+        codes = codes_df.to_numpy(dtype=np.float64, copy=True)
+        codes[codes < 0] = np.nan
+        values = np.concatenate([values, codes], axis=1)
+    return values
+
+def find_near_duplicates(df, block_cols=None, compare_cols=None, threshold=0.97,
+                         window=50, area_tolerance=0):
+    """
+    Candidate pairs of the same property listed more than once
+
+    Rows are blocked on Neighborhood + YearBuilt + GrLivArea + LotArea +
+    LotFrontage (GrLivArea bucketed by `area_tolerance` square feet when it
+    is > 0; the lot always matches exactly) and only rows of the same block
+    are compared: after sorting by block, row p is paired with rows p+1 ...
+    p+window, keeping the pairs that share a block. The share of
+    `compare_cols` on which a pair agrees (both missing counts as agreeing)
+    is its similarity; pairs at or above `threshold` are returned as
+    (Row_A, Row_B, Similarity) positions into df, plus the number of pairs
+    compared.
+    """
+    if block_cols is None:
+        block_cols = BLOCK_COLUMNS
+    if compare_cols is None:
+        compare_cols = [col for col in df.columns if col not in SALE_COLUMNS and col not in block_cols]
+
+    keys = df[block_cols].copy()
+    if area_tolerance > 0 and 'GrLivArea' in keys.columns:
+        keys['GrLivArea'] = keys['GrLivArea'] // area_tolerance
+    blocks = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    order = np.argsort(blocks, kind='stable')
+    sorted_blocks = blocks[order]
+
+    values = _comparison_matrix(df, compare_cols)
+    missing = np.isnan(values)
+
+    pairs, n_compared = [], 0
+    for lag in range(1, min(window, len(df) - 1) + 1):
+        same = np.nonzero(sorted_blocks[:-lag] == sorted_blocks[lag:])[0]
+        if len(same) == 0:
+            break
+        a, b = order[same], order[same + lag]
+        agree = (values[a] == values[b]) | (missing[a] & missing[b])
+        similarity = agree.mean(axis=1) if values.shape[1] else np.ones(len(a))
+        keep = similarity >= threshold
+        pairs.append(pd.DataFrame({'Row_A': a[keep], 'Row_B': b[keep], 'Similarity': similarity[keep]}))
+        n_compared += len(same)
+
+    if pairs:
+        pairs = pd.concat(pairs, ignore_index=True)
+    else:
+        pairs = pd.DataFrame({'Row_A': pd.Series(dtype=np.int64), 'Row_B': pd.Series(dtype=np.int64),
+                              'Similarity': pd.Series(dtype=np.float64)})
+    return pairs, n_compared
+
+def _cluster_labels(n_rows, pairs):
+    """Connected components of the near-duplicate graph"""
+    graph = coo_matrix((np.ones(len(pairs), dtype=np.int8),
+                        (pairs['Row_A'].to_numpy(), pairs['Row_B'].to_numpy())),
+                       shape=(n_rows, n_rows))
+    _, labels = connected_components(graph, directed=False)
+    return labels
+
+def deduplicate_listings(df, exact_cols=None, block_cols=None, compare_cols=None,
+                         threshold=0.97, window=50, area_tolerance=0, drop_near=False):
+    """
+    Remove repeated listings of the same property
+
+    Exact duplicates (same values over `exact_cols`, default all but Id) are
+    found by row hashing and dropped, keeping the first. Near duplicates, the
+    same house sold or relisted with different sale fields, are found by
+    blocking (see find_near_duplicates) and grouped into clusters. By default
+    they are only reported: townhouse units of one development can share
+    every property field, lot included, so a near match is not proof of a
+    relisting. With drop_near=True only the most recent sale (YrSold,
+    MoSold) of each cluster is kept. Both steps are near linear in the
+    number of rows.
+
+    Returns (deduplicated df, summary dict); summary['clusters'] lists the
+    near-duplicate clusters.
+    """
+    start = time.perf_counter()
+    n_input = len(df)
+
+    exact = find_exact_duplicates(df, exact_cols)
+    unique_df = df[~exact]
+
+    positions = np.arange(len(unique_df))
+    pairs, n_compared = find_near_duplicates(unique_df, block_cols, compare_cols, threshold,
+                                             window, area_tolerance)
+    labels = _cluster_labels(len(unique_df), pairs)
+    cluster_sizes = np.bincount(labels)
+    in_cluster = cluster_sizes[labels] > 1
+
+    clusters = pd.DataFrame({'Cluster': pd.factorize(labels[in_cluster])[0] + 1,
+                             'Row': positions[in_cluster]})
+    if 'Id' in unique_df.columns:
+        clusters['Id'] = unique_df['Id'].to_numpy()[in_cluster]
+    if 'SalePrice' in unique_df.columns:
+        clusters['SalePrice'] = unique_df['SalePrice'].to_numpy()[in_cluster]
+
+    if len(clusters) and {'YrSold', 'MoSold'} <= set(unique_df.columns):
+        sale_month = unique_df['YrSold'].to_numpy() * 12 + unique_df['MoSold'].to_numpy()
+        clusters['Sale_Month'] = sale_month[in_cluster]
+        latest = clusters.sort_values(['Cluster', 'Sale_Month', 'Row']).groupby('Cluster')['Row'].last()
+        clusters['Kept'] = clusters['Row'].to_numpy() == latest.loc[clusters['Cluster']].to_numpy()
+        clusters = clusters.drop(columns='Sale_Month')
+    else:
+        clusters['Kept'] = ~clusters.duplicated('Cluster', keep='first')
+
+    near_drop = np.zeros(len(unique_df), dtype=bool)
+    if drop_near:
+        near_drop[clusters.loc[~clusters['Kept'], 'Row'].to_numpy()] = True
+    else:
+        # Reported only: every listing of a cluster stays in the output
+        clusters['Kept'] = True
+    result = unique_df[~near_drop]
+
+    summary = {
+        'n_input': n_input,
+        'n_exact_duplicates': int(exact.sum()),
+        'n_near_clusters': int((cluster_sizes > 1).sum()),
+        'n_near_duplicates': int(in_cluster.sum() - (cluster_sizes > 1).sum()),
+        'n_near_dropped': int(near_drop.sum()),
+        'n_output': len(result),
+        'n_pairs_compared': int(n_compared),
+        'threshold': threshold,
+        'drop_near': drop_near,
+        'block_cols': list(block_cols or BLOCK_COLUMNS),
+        'seconds': time.perf_counter() - start,
+        'clusters': clusters.sort_values(['Cluster', 'Row']).drop(columns='Row').reset_index(drop=True),
+    }
+    if 'SalePrice' in df.columns:
+        summary['price_mean_before'] = float(df['SalePrice'].mean())
+        summary['price_mean_after'] = float(result['SalePrice'].mean())
+
+    print_dedup_summary(summary)
+    return result, summary
+
+def print_dedup_summary(summary):
+    """
+    Print the deduplication counts
+    """
+    print(f"🧹 Deduplication: {summary['n_input']:,} -> {summary['n_output']:,} rows "
+          f"({summary['seconds']:.2f} s)")
+    print(f"  Exact duplicates removed: {summary['n_exact_duplicates']:,}")
+    print(f"  Near-duplicate clusters: {summary['n_near_clusters']:,} "
+          f"({summary['n_near_duplicates']:,} repeat listings, {summary['n_near_dropped']:,} dropped)")
+    print(f"  Pairs compared: {summary['n_pairs_compared']:,} "
+          f"(blocking on {' + '.join(summary['block_cols'])})")
+    if 'price_mean_before' in summary:
+        print(f"  Mean SalePrice: ${summary['price_mean_before']:,.0f} -> ${summary['price_mean_after']:,.0f}")
@@ -0,0 +1,216 @@
+import numpy as np
+
+class _BinnedCounts:
+    """
+    Fixed number of equal-width bins whose range doubles on demand
+
+    When a value falls outside the current range, adjacent bins are merged
+    pairwise and the freed half is added on the side that needs it, so the
+    counts stay exact and memory stays constant.
+    """
+
+    def __init__(self, bins, value_range=None):
+        if bins % 2:
+            bins += 1
+        self.bins = bins
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.lo, self.hi = value_range if value_range is not None else (None, None)
+        if value_range is not None and not self.hi > self.lo:
+            # Doubling a zero-width range never widens it
+            self.lo, self.hi = self._padded(min(value_range), max(value_range))
+
+    @staticmethod
+    def _padded(vmin, vmax):
+        pad = max((vmax - vmin) * 0.05, abs(vmax) * 1e-6, 1e-9)
+        return vmin - pad, vmax + pad
+
+    @property
+    def edges(self):
+        return np.linspace(self.lo, self.hi, self.bins + 1)
+
+    def _expand(self, upward):
+        span = self.hi - self.lo
+        merged = self.counts.reshape(-1, 2).sum(axis=1)
+        padding = np.zeros(self.bins // 2, dtype=np.int64)
+        if upward:
+            self.counts = np.concatenate([merged, padding])
+            self.hi = self.lo + 2 * span
+        else:
+            self.counts = np.concatenate([padding, merged])
+            self.lo = self.hi - 2 * span
+
+    def add(self, values):
+        if len(values) == 0:
+            return
+        vmin, vmax = values.min(), values.max()
+        if self.lo is None:
+            self.lo, self.hi = self._padded(vmin, vmax)
+        while vmin < self.lo:
+            self._expand(upward=False)
+        while vmax >= self.hi:
+            self._expand(upward=True)
+        idx = ((values - self.lo) / (self.hi - self.lo) * self.bins).astype(np.int64)
+        np.clip(idx, 0, self.bins - 1, out=idx)
+        self.counts += np.bincount(idx, minlength=self.bins)
+
+class StreamingDistribution:
+    """
+    Histogram, log1p histogram and moments of a column, accumulated per chunk
+
+    Memory and plotting cost depend only on the number of bins, not on the
+    number of rows seen.
+    """
+
+    def __init__(self, bins=1024, value_range=None):
+        self.raw = _BinnedCounts(bins, value_range)
+        log_range = None
+        if value_range is not None and value_range[0] > -1:
+            log_range = (np.log1p(value_range[0]), np.log1p(value_range[1]))
+        self.log = _BinnedCounts(bins, log_range)
+        self.n = 0
+        self.n_missing = 0
+        self.n_log_invalid = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._m3 = 0.0
+        self._m4 = 0.0
+
+    def update(self, values):
+        """Add a chunk of values (array-like); NaNs are counted as missing"""
+        values = np.asarray(values, dtype=np.float64)
+        finite = np.isfinite(values)
+        self.n_missing += int((~finite).sum())
+        values = values[finite]
+        if len(values) == 0:
+            return self
+
+        self.raw.add(values)
+        loggable = values > -1
+        self.n_log_invalid += int((~loggable).sum())
+        self.log.add(np.log1p(values[loggable]))
+
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self._merge_moments(values)
+        return self
+
+    def _merge_moments(self, values):
+        """Combine chunk central moments with the running ones (Pebay's formulas)"""
+        n_b = len(values)
+        mean_b = values.mean()
+        d = values - mean_b
+        m2_b = (d ** 2).sum()
+        m3_b = (d ** 3).sum()
+        m4_b = (d ** 4).sum()
+
+        n_a = self.n
+        n = n_a + n_b
+        delta = mean_b - self._mean
+        m2 = self._m2 + m2_b + delta ** 2 * n_a * n_b / n
+        m3 = (self._m3 + m3_b
+              + delta ** 3 * n_a * n_b * (n_a - n_b) / n ** 2
+              + 3 * delta * (n_a * m2_b - n_b * self._m2) / n)
+        m4 = (self._m4 + m4_b
+              + delta ** 4 * n_a * n_b * (n_a ** 2 - n_a * n_b + n_b ** 2) / n ** 3
+              + 6 * delta ** 2 * (n_a ** 2 * m2_b + n_b ** 2 * self._m2) / n ** 2
+              + 4 * delta * (n_a * m3_b - n_b * self._m3) / n)
+
+        self.n = n
+        self._mean += delta * n_b / n
+        self._m2, self._m3, self._m4 = m2, m3, m4
+
+    @property
+    def mean(self):
+        return self._mean if self.n else np.nan
+
+    @property
+    def std(self):
+        return np.sqrt(self._m2 / (self.n - 1)) if self.n > 1 else np.nan
+
+    @property
+    def skew(self):
+        """Adjusted sample skewness, matching pandas Series.skew"""
+        n = self.n
+        if n < 3 or self._m2 == 0:
+            return np.nan
+        g1 = np.sqrt(n) * self._m3 / self._m2 ** 1.5
+        return g1 * np.sqrt(n * (n - 1)) / (n - 2)
+
+    @property
+    def kurtosis(self):
+        """Adjusted excess kurtosis, matching pandas Series.kurt"""
+        n = self.n
+        if n < 4 or self._m2 == 0:
+            return np.nan
+        g2 = n * self._m4 / self._m2 ** 2 - 3
+        return (n - 1) / ((n - 2) * (n - 3)) * ((n + 1) * g2 + 6)
+
+    def quantile(self, q):
+        """Quantile interpolated within the fine histogram bins"""
+        counts = self.raw.counts
+        if counts.sum() == 0:
+            return np.nan
+        cumulative = np.concatenate([[0], np.cumsum(counts)]) / counts.sum()
+        value = np.interp(q, cumulative, self.raw.edges)
+        return float(np.clip(value, self.min, self.max))
+
+    @property
+    def median(self):
+        return self.quantile(0.5)
+
+def accumulate_distribution(chunks, column='SalePrice', bins=1024, value_range=None):
+    """
+    Build a StreamingDistribution from an iterable of dataframe chunks
+    """
+    distribution = StreamingDistribution(bins=bins, value_range=value_range)
+    for chunk in chunks:
+        distribution.update(chunk[column].to_numpy(dtype=np.float64, na_value=np.nan))
+    return distribution
+
+def rebin_counts(counts, edges, n_bins):
+    """
+    Merge fine histogram bins into at most n_bins wider bins
+    """
+    n_bins = max(1, min(n_bins, len(counts)))
+    starts = np.linspace(0, len(counts), n_bins + 1).astype(np.int64)
+    merged = np.add.reduceat(counts, starts[:-1])
+    return merged, edges[starts]
+
+def binned_kde(counts, edges, bandwidth):
+    """
+    Gaussian KDE evaluated at bin centers by FFT convolution of binned counts
+
+    Returns the density (integrating to ~1) at each bin center. The cost
+    depends on the number of bins only.
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    total = counts.sum()
+    if total == 0 or not np.isfinite(bandwidth) or bandwidth <= 0:
+        return np.zeros_like(counts)
+
+    dx = edges[1] - edges[0]
+    n_bins = len(counts)
+    reach = int(min(np.ceil(4 * bandwidth / dx), n_bins))
+    offsets = np.arange(-reach, reach + 1) * dx
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+
+    size = n_bins + len(kernel) - 1
+    fft_size = 1 << (size - 1).bit_length()
+    smoothed = np.fft.irfft(np.fft.rfft(counts, fft_size) * np.fft.rfft(kernel, fft_size), fft_size)
+    density = smoothed[reach:reach + n_bins] / total
+    return np.clip(density, 0, None)
+
+def scott_bandwidth(std, n):
+    """Scott's rule of thumb, as used by scipy.stats.gaussian_kde"""
+    return std * n ** (-1 / 5) if n > 1 else np.nan
+
+def binned_std(counts, edges):
+    """Standard deviation estimated from bin centers"""
+    centers = (edges[:-1] + edges[1:]) / 2
+    total = counts.sum()
+    if total < 2:
+        return np.nan
+    mean = (counts * centers).sum() / total
+    return np.sqrt((counts * (centers - mean) ** 2).sum() / (total - 1))
@@ -0,0 +1,434 @@
+import json
+import os
+import time
+from datetime import datetime
+import pandas as pd
+import numpy as np
+from scipy.stats import chi2, kstwobign
+from .distribution import StreamingDistribution
+from .encoding import get_categorical_columns
+
+DRIFT_NUMERIC = ['SalePrice', 'GrLivArea']
+
+# Population stability index bands: < 0.1 stable, 0.1 - 0.25 shifting, > 0.25 drifted
+PSI_WARN = 0.1
+PSI_DRIFT = 0.25
+# Effect sizes for a significant test to count as drift rather than a warning
+KS_DRIFT = 0.1
+CRAMER_V_DRIFT = 0.1
+MISSING_DRIFT_PP = 5.0
+ALPHA = 0.01
+# PSI over fewer values than this is noise (e.g. PoolQC with 7 pools)
+PSI_MIN_COUNT = 100
+
+SEVERITY_ORDER = {'drift': 0, 'warn': 1, 'skipped': 2, 'ok': 3}
+
+def _json_value(value):
+    """Plain Python value for json.dumps (NaN / inf become None)"""
+    if isinstance(value, (np.integer,)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return float(value) if np.isfinite(value) else None
+    return value
+
+def _write_text(path, text, writer=None):
+    if writer is not None:
+        writer.write_text(path, text)
+        return
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def _psi(expected, actual, floor=1e-4):
+    """Population stability index of two proportion vectors"""
+    expected = np.maximum(expected, floor)
+    actual = np.maximum(actual, floor)
+    return float(((actual - expected) * np.log(actual / expected)).sum())
+
+def _contingency_test(baseline_counts, batch_counts):
+    """
+    Two-sample chi-square test of baseline vs batch counts over the same cells
+
+    Returns (statistic, p-value, Cramer's V). Both samples are treated as
+    draws, so a large batch is not held to the baseline's sampling noise.
+    """
+    table = np.vstack([baseline_counts, batch_counts])
+    table = table[:, table.sum(axis=0) > 0]
+    if table.shape[1] < 2:
+        return 0.0, 1.0, 0.0
+    total = table.sum()
+    expected = table.sum(axis=1, keepdims=True) * table.sum(axis=0, keepdims=True) / total
+    statistic = float(((table - expected) ** 2 / expected).sum())
+    p_value = float(chi2.sf(statistic, table.shape[1] - 1))
+    return statistic, p_value, float(np.sqrt(statistic / total))
+
+def _psi_severity(psi, n_values):
+    if n_values < PSI_MIN_COUNT:
+        return 'skipped'
+    return 'drift' if psi >= PSI_DRIFT else 'warn' if psi >= PSI_WARN else 'ok'
+
+def _psi_detail(detail, severity):
+    return f"{detail} (under {PSI_MIN_COUNT} values)" if severity == 'skipped' else detail
+
+def _string_index(counts):
+    counts = counts.copy()
+    counts.index = counts.index.astype(str)
+    return counts.groupby(level=0).sum()
+
+def _histogram_edges(sketch):
+    return np.linspace(sketch['lo'], sketch['hi'], len(sketch['counts']) + 1)
+
+def _histogram_cdf(sketch, x):
+    """CDF of a numeric sketch, interpolated within its fine histogram bins"""
+    counts = sketch['counts']
+    if counts.sum() == 0:
+        return np.zeros(len(x))
+    cumulative = np.concatenate([[0], np.cumsum(counts)]) / counts.sum()
+    return np.interp(x, _histogram_edges(sketch), cumulative, left=0.0, right=1.0)
+
+# ==================== Baseline sketches ====================
+
+class DriftBaseline:
+    """
+    Compact sketches of a reference dataset for drift scoring
+
+    numeric: per column the StreamingDistribution fine histogram (lo, hi,
+    counts), moments, a few quantiles and the decile edges used for PSI.
+    categorical: level counts per column. null_counts: missing values per
+    column out of n_rows. The sketches are a few KB, so a batch is scored
+    against them without the baseline data.
+    """
+
+    def __init__(self, n_rows, null_counts, numeric, categorical, source=None, created=None):
+        self.n_rows = n_rows
+        self.null_counts = null_counts
+        self.numeric = numeric
+        self.categorical = categorical
+        self.source = source
+        self.created = created or datetime.now().isoformat(timespec='seconds')
+
+    def to_dict(self):
+        numeric = {}
+        for col, sketch in self.numeric.items():
+            numeric[col] = {key: (value.tolist() if isinstance(value, np.ndarray) else _json_value(value))
+                            for key, value in sketch.items()}
+            numeric[col]['quantiles'] = {str(q): _json_value(v) for q, v in sketch['quantiles'].items()}
+        return {
+            'source': self.source,
+            'created': self.created,
+            'n_rows': int(self.n_rows),
+            'null_counts': {col: int(n) for col, n in self.null_counts.items()},
+            'numeric': numeric,
+            'categorical': {col: {level: int(n) for level, n in counts.items()}
+                            for col, counts in self.categorical.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        numeric = {}
+        for col, sketch in data['numeric'].items():
+            sketch = dict(sketch)
+            for key in ('counts', 'psi_edges', 'psi_expected'):
+                sketch[key] = np.asarray(sketch[key], dtype=np.int64 if key == 'counts' else np.float64)
+            sketch['quantiles'] = {float(q): v for q, v in sketch['quantiles'].items()}
+            numeric[col] = sketch
+        categorical = {col: pd.Series(counts, dtype=np.int64) for col, counts in data['categorical'].items()}
+        return cls(data['n_rows'], pd.Series(data['null_counts'], dtype=np.int64), numeric, categorical,
+                   source=data.get('source'), created=data.get('created'))
+
+    def save(self, path, writer=None):
+        """Write the sketches as JSON (through an ArtifactWriter if given)"""
+        text = json.dumps(self.to_dict(), separators=(',', ':'))
+        _write_text(path, text, writer)
+        print(f"💾 Drift baseline saved: {path} ({len(text) / 1024:.1f} KB)")
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    def describe(self):
+        return (f"{self.n_rows:,} rows, {len(self.numeric)} numeric and "
+                f"{len(self.categorical)} categorical sketches")
+
+def build_drift_baseline(chunks, numeric_cols=None, categorical_cols=None, bins=1024,
+                         psi_bins=10, source=None):
+    """
+    Sketch a reference dataset (a dataframe or an iterable of chunks)
+
+    Numeric columns (default SalePrice and GrLivArea) are accumulated into
+    StreamingDistribution histograms, the same sketch behind the streamed
+    EDA distribution plots; PSI uses their decile edges. Categorical columns
+    default to the non-numeric columns of the first chunk. The null profile
+    covers every column.
+    """
+    if isinstance(chunks, pd.DataFrame):
+        chunks = [chunks]
+    numeric_cols = DRIFT_NUMERIC if numeric_cols is None else numeric_cols
+
+    n_rows = 0
+    null_counts = None
+    distributions, level_counts = {}, {}
+    for chunk in chunks:
+        if null_counts is None:
+            numeric_cols = [col for col in numeric_cols if col in chunk.columns]
+            if categorical_cols is None:
+                categorical_cols = get_categorical_columns(chunk)
+            categorical_cols = [col for col in categorical_cols if col in chunk.columns]
+            distributions = {col: StreamingDistribution(bins=bins) for col in numeric_cols}
+            level_counts = {col: pd.Series(dtype=np.int64) for col in categorical_cols}
+            null_counts = pd.Series(0, index=chunk.columns, dtype=np.int64)
+
+        n_rows += len(chunk)
+        null_counts = null_counts.add(chunk.isnull().sum(), fill_value=0).astype(np.int64)
+        for col, distribution in distributions.items():
+            distribution.update(chunk[col].to_numpy(dtype=np.float64, na_value=np.nan))
+        for col in categorical_cols:
+            level_counts[col] = level_counts[col].add(chunk[col].value_counts(), fill_value=0)
+
+    if null_counts is None:
+        raise ValueError("Cannot build a drift baseline from an empty input")
+
+    numeric = {}
+    for col, distribution in distributions.items():
+        sketch = {
+            'n': distribution.n, 'n_missing': distribution.n_missing,
+            'mean': distribution.mean, 'std': distribution.std,
+            'min': distribution.min, 'max': distribution.max,
+            'lo': distribution.raw.lo, 'hi': distribution.raw.hi,
+            'counts': distribution.raw.counts.copy(),
+            'quantiles': {q: distribution.quantile(q) for q in (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)},
+        }
+        edges = np.empty(0)
+        if distribution.n:
+            edges = np.unique([distribution.quantile(q) for q in np.linspace(0, 1, psi_bins + 1)[1:-1]])
+        sketch['psi_edges'] = edges
+        sketch['psi_expected'] = np.diff(np.concatenate([[0], _histogram_cdf(sketch, edges), [1]]))
+        numeric[col] = sketch
+
+    categorical = {col: _string_index(counts).astype(np.int64) for col, counts in level_counts.items()}
+    baseline = DriftBaseline(n_rows, null_counts, numeric, categorical, source=source)
+    print(f"📐 Drift baseline: {baseline.describe()}")
+    return baseline
+
+# ==================== Streaming scoring ====================
+
+class DriftScorer:
+    """
+    Accumulate a batch chunk by chunk and score it against a DriftBaseline
+
+    Per chunk only counts are kept: decile-bin and fine-histogram counts plus
+    running sums for numeric columns, level counts for categoricals and null
+    counts, so memory does not grow with the batch.
+    """
+
+    def __init__(self, baseline):
+        self.baseline = baseline
+        self.n_rows = 0
+        self.null_counts = pd.Series(0, index=baseline.null_counts.index, dtype=np.int64)
+        self.columns = None
+        self.numeric = {}
+        for col, sketch in baseline.numeric.items():
+            self.numeric[col] = {
+                'psi_counts': np.zeros(len(sketch['psi_edges']) + 1, dtype=np.int64),
+                # Fine bins plus one underflow and one overflow bin
+                'counts': np.zeros(len(sketch['counts']) + 2, dtype=np.int64),
+                'n': 0, 'sum': 0.0, 'sum_sq': 0.0,
+            }
+        self.level_counts = {col: pd.Series(dtype=np.int64) for col in baseline.categorical}
+
+    def update(self, chunk):
+        """Add a chunk of the batch"""
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+        self.n_rows += len(chunk)
+        present = self.null_counts.index.intersection(chunk.columns)
+        self.null_counts = self.null_counts.add(chunk[present].isnull().sum(), fill_value=0).astype(np.int64)
+
+        for col, state in self.numeric.items():
+            if col not in chunk.columns:
+                continue
+            values = chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            values = values[np.isfinite(values)]
+            sketch = self.baseline.numeric[col]
+            state['psi_counts'] += np.bincount(np.searchsorted(sketch['psi_edges'], values, side='right'),
+                                               minlength=len(state['psi_counts']))
+            if sketch['lo'] is not None:
+                fine = np.searchsorted(_histogram_edges(sketch), values, side='right')
+                state['counts'] += np.bincount(fine, minlength=len(state['counts']))
+            state['n'] += len(values)
+            state['sum'] += values.sum()
+            state['sum_sq'] += (values ** 2).sum()
+
+        for col in self.level_counts:
+            if col in chunk.columns:
+                self.level_counts[col] = self.level_counts[col].add(
+                    _string_index(chunk[col].value_counts()), fill_value=0)
+        return self
+
+    def _numeric_checks(self, col):
+        sketch, state = self.baseline.numeric[col], self.numeric[col]
+        n, m = sketch['n'], state['n']
+        if n == 0 or m == 0:
+            return [_check(col, 'PSI', severity='skipped', detail='no values to compare')]
+
+        mean = state['sum'] / m
+        std = np.sqrt(max(state['sum_sq'] / m - mean ** 2, 0) * m / max(m - 1, 1))
+        detail = (f"mean {sketch['mean']:,.0f} -> {mean:,.0f}, "
+                  f"std {sketch['std']:,.0f} -> {std:,.0f}")
+
+        psi = _psi(sketch['psi_expected'], state['psi_counts'] / m)
+        psi_severity = _psi_severity(psi, min(n, m))
+
+        # KS statistic on the fine bin edges: baseline CDF from the sketch,
+        # batch CDF from values below each edge (under/overflow included)
+        base_cdf = np.concatenate([[0], np.cumsum(sketch['counts'])]) / sketch['counts'].sum()
+        batch_cdf = np.cumsum(state['counts'])[:-1] / m
+        d = float(np.abs(base_cdf - batch_cdf).max())
+        effective_n = n * m / (n + m)
+        p_value = float(kstwobign.sf(d * np.sqrt(effective_n)))
+        ks_severity = 'ok' if p_value >= ALPHA else 'drift' if d >= KS_DRIFT else 'warn'
+
+        return [_check(col, 'PSI', psi, None, psi_severity, _psi_detail(detail, psi_severity)),
+                _check(col, 'KS', d, p_value, ks_severity, detail)]
+
+    def _categorical_checks(self, col):
+        base = self.baseline.categorical[col]
+        batch = self.level_counts[col]
+        m = batch.sum()
+        if len(base) == 0 or m == 0:
+            return [_check(col, 'PSI', severity='skipped', detail='no values to compare')]
+
+        unseen = batch.index.difference(base.index)
+        expected = base.to_numpy(dtype=np.float64)
+        observed = np.append(batch.reindex(base.index, fill_value=0).to_numpy(dtype=np.float64),
+                             batch.reindex(unseen).sum())
+        statistic, p_value, cramer_v = _contingency_test(np.append(expected, 0), observed)
+        expected_share = expected / expected.sum()
+        psi = _psi(np.append(expected_share, 0), observed / m)
+
+        top = int(np.abs(observed[:-1] / m - expected_share).argmax())
+        detail = f"{base.index[top]} {expected_share[top]:.1%} -> {observed[top] / m:.1%}"
+        if len(unseen):
+            detail += f"; {len(unseen)} unseen level(s): {', '.join(unseen[:3])}"
+
+        psi_severity = _psi_severity(psi, min(base.sum(), m))
+        chi2_severity = 'ok' if p_value >= ALPHA else 'drift' if cramer_v >= CRAMER_V_DRIFT else 'warn'
+        return [_check(col, 'PSI', psi, None, psi_severity, _psi_detail(detail, psi_severity)),
+                _check(col, 'Chi2', statistic, p_value, chi2_severity, detail)]
+
+    def _missing_check(self, col):
+        n, n_null = self.baseline.n_rows, self.baseline.null_counts[col]
+        m, m_null = self.n_rows, self.null_counts[col]
+        statistic, p_value, _ = _contingency_test(np.array([n_null, n - n_null], dtype=np.float64),
+                                                  np.array([m_null, m - m_null], dtype=np.float64))
+        base_rate, batch_rate = n_null / n, m_null / m
+        change = 100 * (batch_rate - base_rate)
+        severity = 'ok' if p_value >= ALPHA else 'drift' if abs(change) >= MISSING_DRIFT_PP else 'warn'
+        return _check(col, 'Missing_Rate', statistic, p_value, severity,
+                      f"{base_rate:.1%} -> {batch_rate:.1%} missing")
+
+    def report(self):
+        """Tidy table with one row per (column, check), most severe first"""
+        if self.n_rows == 0:
+            raise ValueError("No batch rows to score")
+        columns = set(self.columns)
+        rows = []
+        for col in self.baseline.numeric:
+            rows.extend(self._numeric_checks(col) if col in columns else
+                        [_check(col, 'PSI', severity='skipped', detail='column not in batch')])
+        for col in self.baseline.categorical:
+            rows.extend(self._categorical_checks(col) if col in columns else
+                        [_check(col, 'PSI', severity='skipped', detail='column not in batch')])
+        for col in self.baseline.null_counts.index:
+            if col in columns:
+                rows.append(self._missing_check(col))
+
+        checks = pd.DataFrame(rows, columns=['Column', 'Check', 'Statistic', 'P_Value', 'Severity', 'Detail'])
+        rank = checks['Severity'].map(SEVERITY_ORDER)
+        order = np.lexsort((-checks['Statistic'].fillna(0).to_numpy(), rank.to_numpy()))
+        return checks.iloc[order].reset_index(drop=True)
+
+def _check(column, check, statistic=np.nan, p_value=None, severity='ok', detail=''):
+    return {'Column': column, 'Check': check, 'Statistic': statistic,
+            'P_Value': np.nan if p_value is None else p_value, 'Severity': severity, 'Detail': detail}
+
+def score_drift(baseline, chunks, name='batch'):
+    """
+    Score a batch (a dataframe or an iterable of chunks) against a baseline
+
+    Returns a drift summary dict: 'checks' holds the per-column PSI, KS,
+    chi-square and missing-rate results (see DriftScorer), plus row counts
+    and the number of checks per severity.
+    """
+    if isinstance(baseline, (str, os.PathLike)):
+        baseline = DriftBaseline.load(baseline)
+    if isinstance(chunks, pd.DataFrame):
+        chunks = [chunks]
+
+    start = time.perf_counter()
+    scorer = DriftScorer(baseline)
+    for chunk in chunks:
+        scorer.update(chunk)
+    checks = scorer.report()
+
+    drift = {
+        'name': name,
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'baseline_source': baseline.source,
+        'baseline_created': baseline.created,
+        'baseline_rows': int(baseline.n_rows),
+        'batch_rows': int(scorer.n_rows),
+        'severity_counts': {severity: int((checks['Severity'] == severity).sum())
+                            for severity in SEVERITY_ORDER},
+        'seconds': time.perf_counter() - start,
+        'checks': checks,
+    }
+    print_drift_summary(drift)
+    return drift
+
+def score_drift_csv(baseline, csv_path, chunksize=100_000, **read_csv_kwargs):
+    """
+    Stream a CSV extract through score_drift without loading it whole
+
+    The baseline's categorical columns are read as category dtype, so level
+    and null counts work on codes instead of strings.
+    """
+    if isinstance(baseline, (str, os.PathLike)):
+        baseline = DriftBaseline.load(baseline)
+    dtypes = {col: 'category' for col in baseline.categorical}
+    dtypes.update(read_csv_kwargs.pop('dtype', {}))
+    chunks = pd.read_csv(csv_path, chunksize=chunksize, dtype=dtypes, **read_csv_kwargs)
+    return score_drift(baseline, chunks, name=os.path.basename(csv_path))
+
+def drift_to_dict(drift):
+    """JSON-ready copy of a drift summary (checks as a list of records)"""
+    result = {key: value for key, value in drift.items() if key != 'checks'}
+    result['seconds'] = round(drift['seconds'], 4)
+    result['checks'] = [{key: _json_value(value) for key, value in record.items()}
+                        for record in drift['checks'].to_dict('records')]
+    return result
+
+def write_drift_json(drift, path, writer=None):
+    """Write a drift summary as machine-readable JSON"""
+    _write_text(path, json.dumps(drift_to_dict(drift), indent=2), writer)
+    print(f"💾 Drift report saved: {path}")
+    return path
+
+def print_drift_summary(drift, top=10):
+    """
+    Print drift counts and the most severe checks
+    """
+    counts = drift['severity_counts']
+    status = '🚨' if counts['drift'] else '⚠️ ' if counts['warn'] else '✅'
+    print(f"{status} Drift check of {drift['name']}: {drift['batch_rows']:,} rows vs "
+          f"{drift['baseline_rows']:,} baseline rows ({drift['seconds']:.2f} s)")
+    print(f"  drift: {counts['drift']}, warn: {counts['warn']}, ok: {counts['ok']}, "
+          f"skipped: {counts['skipped']}")
+    flagged = drift['checks'][drift['checks']['Severity'].isin(['drift', 'warn'])].head(top)
+    for _, row in flagged.iterrows():
+        print(f"  - {row['Column']} [{row['Check']}] {row['Severity']}: "
+              f"{row['Statistic']:.3f}, {row['Detail']}")
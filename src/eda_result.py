@@ -0,0 +1,224 @@
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+import pandas as pd
+import numpy as np
+from .encoding import encode_categoricals, get_categorical_columns
+from .drift import drift_to_dict
+
+@dataclass
+class TargetSummary:
+    """Distribution statistics of the target column"""
+    column: str
+    count: int
+    mean: float
+    median: float
+    std: float
+    min: float
+    max: float
+    skew: float
+    kurtosis: float
+
+    @property
+    def cv(self):
+        return self.std / self.mean if self.mean else np.nan
+
+@dataclass
+class PreviewSummary:
+    """What a preview report needs from its DataSample"""
+    description: str
+    n_strata: int
+    estimates: pd.DataFrame
+
+@dataclass
+class EDAResult:
+    """
+    Everything the report outputs show, computed once from the data
+
+    The PDF, CSV exports, text summary, JSON and HTML all render from this
+    object, so no renderer touches the raw frame. Tables are small frames:
+    numeric_stats (describe() of the numeric columns), missing (the
+    check_missing_data output), correlations (the plot_correlation_analysis
+    output). dedup and drift hold the deduplicate_listings / score_drift
+    summaries when they were run.
+    """
+    n_rows: int
+    n_columns: int
+    n_numeric: int
+    n_categorical: int
+    n_category_levels: int
+    memory_mb: float
+    encoded_memory_mb: float
+    numeric_stats: pd.DataFrame
+    target: Optional[TargetSummary] = None
+    missing: Optional[pd.DataFrame] = None
+    total_missing: int = 0
+    correlations: Optional[pd.DataFrame] = None
+    new_features: list = field(default_factory=list)
+    dedup: Optional[dict] = None
+    drift: Optional[dict] = None
+    preview: Optional[PreviewSummary] = None
+    title: str = 'House Prices EDA Report'
+    created: str = field(default_factory=lambda: datetime.now().isoformat(timespec='seconds'))
+
+    @property
+    def shape(self):
+        return (self.n_rows, self.n_columns)
+
+    def to_dict(self):
+        """JSON-ready dict; frames are stored as {'columns', 'index', 'data'}"""
+        result = {
+            'title': self.title,
+            'created': self.created,
+            'n_rows': self.n_rows,
+            'n_columns': self.n_columns,
+            'n_numeric': self.n_numeric,
+            'n_categorical': self.n_categorical,
+            'n_category_levels': self.n_category_levels,
+            'memory_mb': self.memory_mb,
+            'encoded_memory_mb': self.encoded_memory_mb,
+            'numeric_stats': _frame_to_dict(self.numeric_stats),
+            'target': None if self.target is None else vars(self.target).copy(),
+            'missing': _frame_to_dict(self.missing),
+            'total_missing': self.total_missing,
+            'correlations': _frame_to_dict(self.correlations),
+            'new_features': list(self.new_features),
+            'dedup': None,
+            'drift': None if self.drift is None else drift_to_dict(self.drift),
+            'preview': None,
+        }
+        if self.dedup is not None:
+            result['dedup'] = {key: _frame_to_dict(value) if isinstance(value, pd.DataFrame) else value
+                               for key, value in self.dedup.items()}
+        if self.preview is not None:
+            result['preview'] = {'description': self.preview.description,
+                                 'n_strata': self.preview.n_strata,
+                                 'estimates': _frame_to_dict(self.preview.estimates)}
+        return _plain(result)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a result saved with to_dict / save, e.g. to re-render it"""
+        data = dict(data)
+        for key in ('numeric_stats', 'missing', 'correlations'):
+            data[key] = _frame_from_dict(data[key])
+        if data['target'] is not None:
+            data['target'] = TargetSummary(**data['target'])
+        if data['dedup'] is not None:
+            data['dedup'] = dict(data['dedup'], clusters=_frame_from_dict(data['dedup']['clusters']))
+        if data['drift'] is not None:
+            data['drift'] = dict(data['drift'], checks=pd.DataFrame(data['drift']['checks']))
+        if data['preview'] is not None:
+            preview = data['preview']
+            data['preview'] = PreviewSummary(preview['description'], preview['n_strata'],
+                                             _frame_from_dict(preview['estimates']))
+        return cls(**data)
+
+    def save(self, path, writer=None):
+        """Write the result as JSON (through an ArtifactWriter if given)"""
+        text = json.dumps(self.to_dict(), ensure_ascii=False, indent=1)
+        if writer is not None:
+            writer.write_text(path, text)
+        else:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+def _frame_to_dict(df):
+    return None if df is None else df.to_dict(orient='split')
+
+def _frame_from_dict(data):
+    return None if data is None else pd.DataFrame(**data)
+
+def _plain(value):
+    """Recursively convert numpy scalars / NaN to JSON-safe Python values"""
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return _plain(value.tolist())
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return float(value) if np.isfinite(value) else None
+    return value
+
+def summarize_eda(train_df=None, corr_df=None, missing_df=None, new_features=None,
+                  dedup_summary=None, preview=None, drift=None, target_col='SalePrice'):
+    """
+    Compute the EDAResult behind every report output in one pass
+
+    This is the only place that scans the raw frame: describe() of the
+    numeric columns, the target statistics, the missing counts (unless the
+    check_missing_data output is passed) and a single memory_usage(deep=True).
+    With preview=DataSample and no train_df the sample is summarized and its
+    bootstrap estimates are computed here.
+    """
+    if train_df is None and preview is not None:
+        train_df = preview.frame
+    if train_df is None:
+        raise ValueError("summarize_eda needs train_df or preview")
+
+    categorical_cols = get_categorical_columns(train_df)
+    numeric_cols = [col for col in train_df.columns if col not in categorical_cols]
+    codes_df, categories = encode_categoricals(train_df, categorical_cols)
+
+    if missing_df is None:
+        missing = train_df.isnull().sum()
+        missing = missing[missing > 0].sort_values(ascending=False)
+        missing_df = pd.DataFrame({
+            'Missing_Count': missing,
+            'Missing_Percent': (missing / len(train_df) * 100).round(2)
+        })
+
+    target = None
+    if target_col in train_df.columns:
+        values = train_df[target_col]
+        target = TargetSummary(
+            column=target_col,
+            count=int(values.count()),
+            mean=float(values.mean()),
+            median=float(values.median()),
+            std=float(values.std()),
+            min=float(values.min()),
+            max=float(values.max()),
+            skew=float(values.skew()),
+            kurtosis=float(values.kurt()),
+        )
+
+    preview_summary = None
+    if preview is not None:
+        preview_summary = PreviewSummary(preview.describe(), len(preview.population_counts),
+                                         preview.estimate())
+
+    return EDAResult(
+        n_rows=len(train_df),
+        n_columns=train_df.shape[1],
+        n_numeric=len(numeric_cols),
+        n_categorical=len(categorical_cols),
+        n_category_levels=sum(len(levels) for levels in categories.values()),
+        memory_mb=train_df.memory_usage(deep=True).sum() / 1024**2,
+        encoded_memory_mb=codes_df.memory_usage(index=False).sum() / 1024**2,
+        numeric_stats=train_df[numeric_cols].describe(),
+        target=target,
+        missing=missing_df,
+        total_missing=int(missing_df['Missing_Count'].sum()) if 'Missing_Count' in missing_df.columns else 0,
+        correlations=corr_df,
+        new_features=list(new_features or []),
+        dedup=dedup_summary,
+        drift=drift,
+        preview=preview_summary,
+    )
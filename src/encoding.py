@@ -0,0 +1,191 @@
+import pandas as pd
+import numpy as np
+from scipy import sparse
+
+# Shared Ex/Gd/TA/Fa/Po scale; missing means "no such facility" in the Ames data
+QUALITY_SCALE = ['None', 'Po', 'Fa', 'TA', 'Gd', 'Ex']
+
+ORDINAL_MAPS = {
+    'ExterQual': QUALITY_SCALE,
+    'ExterCond': QUALITY_SCALE,
+    'BsmtQual': QUALITY_SCALE,
+    'BsmtCond': QUALITY_SCALE,
+    'HeatingQC': QUALITY_SCALE,
+    'KitchenQual': QUALITY_SCALE,
+    'FireplaceQu': QUALITY_SCALE,
+    'GarageQual': QUALITY_SCALE,
+    'GarageCond': QUALITY_SCALE,
+    'PoolQC': QUALITY_SCALE,
+    'BsmtExposure': ['None', 'No', 'Mn', 'Av', 'Gd'],
+    'BsmtFinType1': ['None', 'Unf', 'LwQ', 'Rec', 'BLQ', 'ALQ', 'GLQ'],
+    'BsmtFinType2': ['None', 'Unf', 'LwQ', 'Rec', 'BLQ', 'ALQ', 'GLQ'],
+    'GarageFinish': ['None', 'Unf', 'RFn', 'Fin'],
+    'Functional': ['Sal', 'Sev', 'Maj2', 'Maj1', 'Mod', 'Min2', 'Min1', 'Typ'],
+    'LandSlope': ['Sev', 'Mod', 'Gtl'],
+    'LotShape': ['IR3', 'IR2', 'IR1', 'Reg'],
+    'PavedDrive': ['N', 'P', 'Y'],
+    'CentralAir': ['N', 'Y'],
+}
+
+def get_categorical_columns(df):
+    """
+    Return the non-numeric columns of a dataframe
+    """
+    return [col for col in df.columns if not pd.api.types.is_numeric_dtype(df[col])]
+
+def _code_dtype(n_levels):
+    """Smallest signed integer dtype that holds the codes plus -1 for missing"""
+    if n_levels < np.iinfo(np.int8).max:
+        return np.int8
+    if n_levels < np.iinfo(np.int16).max:
+        return np.int16
+    return np.int32
+
+def encode_categoricals(df, columns=None, ordinal_maps=ORDINAL_MAPS):
+    """
+    Encode categorical columns to compact integer codes in one pass
+
+    Columns listed in ordinal_maps get their rank on the scale (missing
+    values are treated as the 'None' level when the scale has one). All other
+    columns are factorized with sorted levels. Missing or unknown values are
+    coded as -1. Returns (codes_df, categories) where categories maps each
+    column to its list of levels.
+    """
+    if columns is None:
+        columns = get_categorical_columns(df)
+
+    codes = {}
+    categories = {}
+    for col in columns:
+        values = df[col]
+        if col in ordinal_maps:
+            levels = list(ordinal_maps[col])
+            if 'None' in levels:
+                values = values.fillna('None')
+            col_codes = pd.Categorical(values, categories=levels).codes
+        else:
+            col_codes, uniques = pd.factorize(values, sort=True)
+            levels = list(uniques)
+        codes[col] = col_codes.astype(_code_dtype(len(levels)), copy=False)
+        categories[col] = levels
+
+    codes_df = pd.DataFrame(codes, index=df.index)
+    return codes_df, categories
+
+def one_hot_sparse(codes_df, categories, columns=None):
+    """
+    Build a sparse CSR one-hot matrix from encoded codes
+
+    Missing codes (-1) produce an all-zero row segment. Returns
+    (matrix, feature_names) with feature names formatted as 'column_level'.
+    """
+    if columns is None:
+        columns = list(codes_df.columns)
+
+    n_rows = len(codes_df)
+    row_parts, col_parts, feature_names = [], [], []
+    offset = 0
+    for col in columns:
+        col_codes = codes_df[col].to_numpy()
+        present = col_codes >= 0
+        row_parts.append(np.flatnonzero(present))
+        col_parts.append(col_codes[present].astype(np.int64) + offset)
+        levels = categories[col]
+        feature_names.extend(f'{col}_{level}' for level in levels)
+        offset += len(levels)
+
+    rows = np.concatenate(row_parts) if row_parts else np.array([], dtype=np.int64)
+    cols = np.concatenate(col_parts) if col_parts else np.array([], dtype=np.int64)
+    data = np.ones(len(rows), dtype=np.uint8)
+    matrix = sparse.csr_matrix((data, (rows, cols)), shape=(n_rows, offset))
+    return matrix, feature_names
+
+def target_encode(codes, target, n_folds=5, smoothing=10.0, seed=42):
+    """
+    Out-of-fold smoothed target encoding for one column of codes
+
+    Each row is encoded with category statistics computed on the other folds
+    only, shrunk towards the out-of-fold mean by `smoothing` pseudo-counts.
+    Missing codes (-1) are treated as their own category.
+    """
+    codes = np.asarray(codes, dtype=np.int64) + 1
+    target = np.asarray(target, dtype=np.float64)
+    n_levels = int(codes.max()) + 1 if len(codes) else 1
+
+    rng = np.random.default_rng(seed)
+    folds = rng.integers(0, n_folds, size=len(codes))
+
+    total_sum = np.bincount(codes, weights=target, minlength=n_levels)
+    total_count = np.bincount(codes, minlength=n_levels).astype(np.float64)
+
+    encoded = np.empty(len(codes), dtype=np.float32)
+    for fold in range(n_folds):
+        in_fold = folds == fold
+        if not in_fold.any():
+            continue
+        fold_sum = np.bincount(codes[in_fold], weights=target[in_fold], minlength=n_levels)
+        fold_count = np.bincount(codes[in_fold], minlength=n_levels)
+        train_sum = total_sum - fold_sum
+        train_count = total_count - fold_count
+        n_train = train_count.sum()
+        prior = train_sum.sum() / n_train if n_train > 0 else target.mean()
+        smoothed = (train_sum + smoothing * prior) / (train_count + smoothing)
+        encoded[in_fold] = smoothed[codes[in_fold]]
+
+    return encoded
+
+def target_encode_columns(df, target_col='SalePrice', columns=None,
+                          n_folds=5, smoothing=10.0, seed=42):
+    """
+    Out-of-fold target encoding for several categorical columns
+
+    Rows with a missing target are encoded but do not contribute to the
+    category statistics.
+    """
+    if columns is None:
+        columns = [col for col in get_categorical_columns(df) if col != target_col]
+
+    codes_df, _ = encode_categoricals(df, columns, ordinal_maps={})
+    target = df[target_col].to_numpy(dtype=np.float64)
+    has_target = ~np.isnan(target)
+
+    encoded = {}
+    for col in columns:
+        col_codes = codes_df[col].to_numpy()
+        values = np.full(len(df), np.nan, dtype=np.float32)
+        values[has_target] = target_encode(col_codes[has_target], target[has_target],
+                                           n_folds=n_folds, smoothing=smoothing, seed=seed)
+        if not has_target.all():
+            # Unlabelled rows use statistics from all labelled rows
+            labelled = col_codes[has_target].astype(np.int64) + 1
+            n_levels = max(int(col_codes.max()) + 2, 1)
+            sums = np.bincount(labelled, weights=target[has_target], minlength=n_levels)
+            counts = np.bincount(labelled, minlength=n_levels)
+            prior = target[has_target].mean()
+            smoothed = (sums + smoothing * prior) / (counts + smoothing)
+            values[~has_target] = smoothed[col_codes[~has_target].astype(np.int64) + 1]
+        encoded[col] = values
+
+    return pd.DataFrame(encoded, index=df.index)
+
+def build_encoded_frame(df, target_col='SalePrice', ordinal_maps=ORDINAL_MAPS,
+                        n_folds=5, smoothing=10.0, seed=42):
+    """
+    Numeric view of a dataframe for correlation analysis
+
+    Numeric columns are kept, ordinal scales become their rank codes and the
+    remaining categorical columns are target encoded out-of-fold.
+    """
+    categorical = get_categorical_columns(df)
+    ordinal = [col for col in categorical if col in ordinal_maps]
+    nominal = [col for col in categorical if col not in ordinal_maps]
+
+    numeric_df = df.drop(columns=categorical)
+    ordinal_df, _ = encode_categoricals(df, ordinal, ordinal_maps=ordinal_maps)
+    parts = [numeric_df, ordinal_df.where(ordinal_df >= 0)]
+
+    if nominal and target_col in df.columns:
+        parts.append(target_encode_columns(df, target_col, nominal,
+                                           n_folds=n_folds, smoothing=smoothing, seed=seed))
+
+    return pd.concat(parts, axis=1)
@@ -0,0 +1,527 @@
+import base64
+import json
+import os
+import time
+import pandas as pd
+import numpy as np
+from .encoding import get_categorical_columns
+
+# Payload knobs and the floor each one is shrunk to when the page exceeds max_bytes
+DASHBOARD_DEFAULTS = {'bins': 40, 'top_n': 20, 'scatter_features': 6, 'max_points': 1500,
+                      'max_missing_cols': 15}
+DASHBOARD_MINIMUMS = {'bins': 10, 'top_n': 5, 'scatter_features': 1, 'max_points': 100,
+                      'max_missing_cols': 5}
+
+def _encode(values, dtype='<f4'):
+    """Little-endian typed array as base64, decoded in the page with atob + Float32Array/Uint32Array"""
+    values = np.ascontiguousarray(values, dtype=dtype)
+    return {'dtype': 'f4' if dtype == '<f4' else 'u4', 'shape': list(values.shape),
+            'b64': base64.b64encode(values.tobytes()).decode('ascii')}
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling of points sorted by x
+
+    Keeps the first and last point and, from each of n_out - 2 equal-count
+    buckets, the point forming the largest triangle with the point kept in
+    the previous bucket and the mean of the next bucket, so peaks and
+    outliers survive. Returns the positions of the kept points.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for b in range(n_out - 2):
+        start, stop = edges[b], edges[b + 1]
+        next_stop = edges[b + 2] if b + 2 < len(edges) else n
+        next_x = x[stop:next_stop].mean()
+        next_y = y[stop:next_stop].mean()
+        area = np.abs((x[previous] - next_x) * (y[start:stop] - y[previous])
+                      - (x[previous] - x[start:stop]) * (next_y - y[previous]))
+        previous = start + int(area.argmax())
+        kept[b + 1] = previous
+    return kept
+
+def _pairwise_corr(values):
+    """
+    Pearson correlation over pairwise-complete rows, as DataFrame.corr
+
+    Masked sums as matrix products: one pass over the data instead of one
+    per column pair.
+    """
+    mask = np.isfinite(values).astype(np.float64)
+    # nanmean without its warning for all-missing columns
+    means = np.where(mask > 0, values, 0.0).sum(axis=0) / np.maximum(mask.sum(axis=0), 1)
+    centered = np.where(mask > 0, values - means, 0.0)
+    n = mask.T @ mask
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sums = centered.T @ mask
+        var = (centered ** 2).T @ mask - sums ** 2 / n
+        corr = (centered.T @ centered - sums * sums.T / n) / np.sqrt(var * var.T)
+    return np.clip(np.nan_to_num(corr), -1, 1)
+
+def _rebin(counts, bins):
+    """Merge the last-axis bins of fine counts into `bins` bins"""
+    starts = np.linspace(0, counts.shape[-1], bins + 1).astype(np.int64)[:-1]
+    return np.add.reduceat(counts, starts, axis=-1)
+
+class DashboardData:
+    """
+    Aggregates behind the HTML dashboard, computed once per frame
+
+    Everything is computed at the largest settings (fine histograms, the
+    correlation matrix of the `top_n` strongest columns, sorted scatter data
+    of the `scatter_features` strongest features, group statistics and
+    missing rates); payload() then only rebins, slices and downsamples, so
+    shrinking the page to a size cap does not touch the frame again.
+    """
+
+    def __init__(self, df, target_col='SalePrice', group_col='Neighborhood', bins=40, top_n=20,
+                 scatter_features=6, max_missing_cols=15):
+        categorical_cols = set(get_categorical_columns(df))
+        numeric_cols = [col for col in df.columns if col not in categorical_cols and col != 'Id']
+        self.n_rows, self.n_columns = df.shape
+        self.target = target_col if target_col in numeric_cols else None
+        self.bins = bins
+
+        values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        present = np.isfinite(values)
+
+        self.histograms = {}
+        for j, col in enumerate(numeric_cols):
+            column = values[present[:, j], j]
+            if len(column):
+                counts, edges = np.histogram(column, bins=bins)
+                self.histograms[col] = (counts, edges[0], edges[-1], int(len(df) - len(column)))
+        if self.target not in self.histograms:
+            # No observed target values (empty frame or all missing): nothing to rank or plot against
+            self.target = None
+
+        # Rank by correlation with the target, then the full matrix of the top columns only
+        if self.target is not None:
+            t = numeric_cols.index(self.target)
+            ranking = np.zeros(len(numeric_cols))
+            for j in range(len(numeric_cols)):
+                both = present[:, j] & present[:, t]
+                if j != t and both.sum() > 1:
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        ranking[j] = np.nan_to_num(abs(np.corrcoef(values[both, j], values[both, t])[0, 1]))
+            ranking[t] = np.inf
+            order = [numeric_cols[j] for j in np.argsort(-ranking, kind='stable')[:top_n]]
+        else:
+            order = numeric_cols[:top_n]
+        positions = [numeric_cols.index(col) for col in order]
+        self.corr_columns = order
+        self.corr = _pairwise_corr(values[:, positions])
+
+        self.scatter = {}
+        if self.target is not None:
+            y = values[:, numeric_cols.index(self.target)]
+            for col in [col for col in order if col != self.target][:scatter_features]:
+                x = values[:, numeric_cols.index(col)]
+                keep = np.isfinite(x) & np.isfinite(y)
+                ordering = np.argsort(x[keep], kind='stable')
+                self.scatter[col] = (x[keep][ordering], y[keep][ordering])
+
+        self.groups = None
+        if group_col in df.columns:
+            self.groups = self._group_aggregates(df, values, present, numeric_cols, group_col,
+                                                 max_missing_cols)
+
+    def _group_aggregates(self, df, values, present, numeric_cols, group_col, max_missing_cols):
+        labels = df[group_col].astype(object).where(df[group_col].notna(), 'Missing')
+        codes, names = pd.factorize(labels)
+        counts = np.bincount(codes, minlength=len(names))
+        order = np.argsort(-counts, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        codes = rank[codes]
+        names = [str(names[k]) for k in order]
+
+        stats = {'count': counts[order].astype(np.float64)}
+        target_hist = None
+        if self.target is not None:
+            target = pd.Series(values[:, numeric_cols.index(self.target)])
+            grouped = target.groupby(codes).agg(['count', 'mean', 'median', 'std', 'min', 'max'])
+            stats = {name: grouped[name].reindex(range(len(names))).to_numpy(dtype=np.float64)
+                     for name in grouped.columns}
+            fine, lo, hi, _ = self.histograms[self.target]
+            edges = np.linspace(lo, hi, len(fine) + 1)
+            keep = np.isfinite(target.to_numpy())
+            bins = np.clip(np.searchsorted(edges, target.to_numpy()[keep], side='right') - 1, 0, len(fine) - 1)
+            target_hist = np.bincount(codes[keep] * len(fine) + bins, minlength=len(names) * len(fine))
+            target_hist = target_hist.reshape(len(names), len(fine))
+
+        # Null mask: numeric columns from the value matrix, the rest from pandas
+        other_cols = [col for col in df.columns if col not in numeric_cols]
+        nulls = np.concatenate([~present, df[other_cols].isnull().to_numpy()], axis=1)
+        null_cols = numeric_cols + other_cols
+        totals = nulls.sum(axis=0)
+        top = [j for j in np.argsort(-totals, kind='stable')[:max_missing_cols] if totals[j] > 0]
+        per_group = np.column_stack([np.bincount(codes, weights=nulls[:, j], minlength=len(names))
+                                     for j in top]) if top else np.zeros((len(names), 0))
+        missing = 100 * per_group / counts[order][:, None]
+
+        return {'column': group_col, 'names': names, 'stats': stats, 'target_hist': target_hist,
+                'missing_columns': [null_cols[j] for j in top], 'missing': missing}
+
+    def payload(self, bins=None, top_n=None, scatter_features=None, max_points=1500, max_missing_cols=None):
+        """JSON-ready payload at the given (equal or smaller) settings"""
+        # Fine bins only merge into equal-width bins when the count divides
+        bins = min(bins or self.bins, self.bins)
+        while self.bins % bins:
+            bins -= 1
+        top_n = top_n or len(self.corr_columns)
+
+        histograms = {}
+        for col, (counts, lo, hi, n_missing_values) in self.histograms.items():
+            histograms[col] = {'lo': float(lo), 'hi': float(hi), 'missing': n_missing_values,
+                               'counts': _encode(_rebin(counts, bins), '<u4')}
+
+        scatter = {}
+        for col in list(self.scatter)[:scatter_features]:
+            x, y = self.scatter[col]
+            kept = lttb(x, y, max_points)
+            scatter[col] = {'n': len(x), 'x': _encode(x[kept]), 'y': _encode(y[kept])}
+
+        payload = {
+            'n_rows': self.n_rows,
+            'n_columns': self.n_columns,
+            'target': self.target,
+            'histograms': histograms,
+            'correlation': {'columns': self.corr_columns[:top_n],
+                            'matrix': _encode(self.corr[:top_n, :top_n])},
+            'scatter': scatter,
+            'groups': None,
+        }
+        if self.groups is not None:
+            groups = self.groups
+            payload['groups'] = {
+                'column': groups['column'],
+                'names': groups['names'],
+                'stats': {name: _encode(column) for name, column in groups['stats'].items()},
+                'missing_columns': groups['missing_columns'][:max_missing_cols],
+                'missing': _encode(groups['missing'][:, :max_missing_cols]),
+            }
+            if groups['target_hist'] is not None:
+                fine, lo, hi, _ = self.histograms[self.target]
+                payload['groups']['target_hist'] = {'lo': float(lo), 'hi': float(hi),
+                                                    'counts': _encode(_rebin(groups['target_hist'], bins), '<u4')}
+        return payload
+
+def build_dashboard_payload(df, target_col='SalePrice', group_col='Neighborhood', bins=40, top_n=20,
+                            scatter_features=6, max_points=1500, max_missing_cols=15):
+    """
+    Pre-aggregated data behind the HTML dashboard
+
+    Histograms of every numeric column (`bins` bins), the correlation matrix
+    of the `top_n` columns most correlated with the target, LTTB-downsampled
+    target scatter plots of the `scatter_features` strongest features (at
+    most `max_points` points each) and per-group target statistics,
+    histograms and missing rates. Arrays are base64 typed arrays, so the
+    payload size depends on these knobs, not on the number of rows.
+    """
+    data = DashboardData(df, target_col, group_col, bins, top_n, scatter_features, max_missing_cols)
+    return data.payload(bins, top_n, scatter_features, max_points, max_missing_cols)
+
+def _shrink(settings):
+    """Halve the knob with the most room above its floor; False when all are at the floor"""
+    room = {key: settings[key] / DASHBOARD_MINIMUMS[key] for key in DASHBOARD_MINIMUMS}
+    key = max(room, key=room.get)
+    if room[key] <= 1:
+        return False
+    settings[key] = max(DASHBOARD_MINIMUMS[key], settings[key] // 2)
+    return True
+
+def create_html_dashboard(train_df, result=None, html_path=None, max_bytes=2 * 1024**2, writer=None,
+                          target_col='SalePrice', group_col='Neighborhood', **payload_kwargs):
+    """
+    Create a self-contained interactive HTML dashboard
+
+    Histograms, a correlation heatmap, LTTB-downsampled scatter plots and
+    per-group (default Neighborhood) price and missingness drill-downs, drawn
+    by inline JavaScript from the build_dashboard_payload aggregates; the
+    page loads no external resources and works offline. If the page would
+    exceed `max_bytes`, the payload knobs are halved (most scatter points
+    first) down to DASHBOARD_MINIMUMS. An EDAResult adds its overview.
+    """
+    if html_path is None:
+        html_path = '../reports/eda_dashboard.html'
+    start = time.perf_counter()
+
+    settings = {**DASHBOARD_DEFAULTS, **payload_kwargs}
+    data = DashboardData(train_df, target_col, group_col, settings['bins'], settings['top_n'],
+                         settings['scatter_features'], settings['max_missing_cols'])
+    while True:
+        payload = data.payload(**settings)
+        if result is not None:
+            payload['overview'] = {
+                'Samples': f'{result.n_rows:,}',
+                'Features': f'{result.n_columns}',
+                'Numeric / Categorical': f'{result.n_numeric} / {result.n_categorical}',
+                'Memory Usage': f'{result.memory_mb:.1f} MB',
+                'Columns with Missing Values': f'{len(result.missing) if result.missing is not None else 0}',
+            }
+            if result.preview is not None:
+                payload['overview']['Preview'] = result.preview.description
+        payload['title'] = result.title if result is not None else 'House Prices EDA Dashboard'
+        # '</' would close the script tag the payload sits in
+        text = json.dumps(payload, separators=(',', ':')).replace('</', '<\\/')
+        page = DASHBOARD_TEMPLATE.replace('__PAYLOAD__', text).encode('utf-8')
+        if len(page) <= max_bytes or not _shrink(settings):
+            break
+
+    if len(page) > max_bytes:
+        raise ValueError(f"Dashboard is {len(page) / 1024:.0f} KB at the smallest settings, "
+                         f"over max_bytes={max_bytes / 1024:.0f} KB")
+
+    directory = os.path.dirname(html_path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    if writer is not None:
+        writer.write_bytes(html_path, page, kind='html')
+    else:
+        with open(html_path, 'wb') as f:
+            f.write(page)
+    elapsed = time.perf_counter() - start
+    print(f"✅ HTML dashboard generated: {html_path} ({len(page) / 1024:.1f} KB, {elapsed:.2f} s, "
+          f"{settings['max_points']} scatter points, {settings['bins']} bins)")
+    return html_path
+
+DASHBOARD_TEMPLATE = r"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>EDA Dashboard</title>
+<style>
+body { font-family: sans-serif; margin: 1.5em auto; max-width: 1200px; color: #222; }
+h1 { margin-bottom: 0.2em; }
+.grid { display: grid; grid-template-columns: 1fr 1fr; gap: 1.5em; }
+.panel { border: 1px solid #ddd; border-radius: 6px; padding: 0.8em 1em; }
+.panel h2 { font-size: 1.05em; margin: 0 0 0.5em; }
+.wide { grid-column: 1 / 3; }
+dl { display: grid; grid-template-columns: max-content auto; gap: 0.2em 1.5em; margin: 0; }
+dt { font-weight: bold; }
+dd { margin: 0; }
+select { margin-bottom: 0.5em; }
+svg text { font-size: 10px; fill: #444; }
+table { border-collapse: collapse; font-size: 0.85em; width: 100%; }
+th, td { padding: 0.2em 0.5em; text-align: right; }
+th { cursor: pointer; border-bottom: 1px solid #999; }
+th:first-child, td:first-child { text-align: left; }
+tbody tr { cursor: pointer; }
+tbody tr:nth-child(even) { background: #f4f4f4; }
+tbody tr.selected { background: #ffe9b3; }
+#tip { position: fixed; pointer-events: none; background: rgba(30, 30, 30, 0.9); color: #fff;
+       padding: 3px 6px; border-radius: 3px; font-size: 12px; display: none; white-space: pre; }
+.note { color: #777; font-size: 0.8em; }
+</style>
+</head>
+<body>
+<h1 id="title"></h1>
+<p class="note" id="subtitle"></p>
+<div class="grid">
+  <div class="panel" id="overview-panel"><h2>Overview</h2><dl id="overview"></dl></div>
+  <div class="panel"><h2>Distribution</h2><select id="hist-select"></select><div id="hist"></div></div>
+  <div class="panel"><h2>Correlation matrix</h2><div id="corr"></div>
+    <p class="note">Click a target cell to open its scatter plot.</p></div>
+  <div class="panel"><h2>Feature vs target</h2><select id="scatter-select"></select><div id="scatter"></div></div>
+  <div class="panel wide" id="groups-panel"><h2 id="groups-title"></h2>
+    <div class="grid"><div id="group-table"></div><div><div id="group-hist"></div><div id="group-missing"></div></div></div>
+  </div>
+</div>
+<div id="tip"></div>
+<script type="application/json" id="payload">__PAYLOAD__</script>
+<script>
+const P = JSON.parse(document.getElementById('payload').textContent);
+
+function decode(a) {
+  const raw = atob(a.b64), bytes = new Uint8Array(raw.length);
+  for (let i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);
+  return a.dtype === 'f4' ? new Float32Array(bytes.buffer) : new Uint32Array(bytes.buffer);
+}
+function fmt(v) {
+  if (v === null || !isFinite(v)) return '-';
+  const a = Math.abs(v);
+  return a >= 1000 ? Math.round(v).toLocaleString() : a >= 10 ? v.toFixed(1) : v.toFixed(3);
+}
+function esc(s) {
+  return String(s).replace(/[&<>"]/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}[c]));
+}
+function svg(w, h, body) { return `<svg viewBox="0 0 ${w} ${h}" width="100%">${body}</svg>`; }
+
+const tip = document.getElementById('tip');
+document.addEventListener('mousemove', e => {
+  const t = e.target.closest('[data-tip]');
+  if (!t) { tip.style.display = 'none'; return; }
+  tip.textContent = t.dataset.tip;
+  tip.style.display = 'block';
+  tip.style.left = (e.clientX + 12) + 'px';
+  tip.style.top = (e.clientY + 12) + 'px';
+});
+
+function bars(counts, lo, hi, color, overlay) {
+  const W = 520, H = 220, L = 40, B = 24, n = counts.length, w = (W - L) / n;
+  let max = 0;
+  for (const c of counts) max = Math.max(max, c);
+  let body = '';
+  counts.forEach((c, i) => {
+    const h = max ? c / max * (H - B - 10) : 0, a = lo + (hi - lo) * i / n, b = lo + (hi - lo) * (i + 1) / n;
+    body += `<rect x="${L + i * w}" y="${H - B - h}" width="${Math.max(w - 1, 1)}" height="${h}" fill="${color}"
+      data-tip="${fmt(a)} - ${fmt(b)}: ${c.toLocaleString()}"/>`;
+  });
+  if (overlay) {
+    let omax = 0;
+    for (const c of overlay) omax = Math.max(omax, c);
+    const pts = Array.from(overlay, (c, i) => `${L + (i + 0.5) * w},${H - B - (omax ? c / omax : 0) * (H - B - 10)}`);
+    body += `<polyline points="${pts.join(' ')}" fill="none" stroke="#333" stroke-dasharray="3,2"/>`;
+  }
+  for (let k = 0; k <= 4; k++) {
+    body += `<text x="${L + (W - L) * k / 4}" y="${H - 8}" text-anchor="middle">${fmt(lo + (hi - lo) * k / 4)}</text>`;
+  }
+  body += `<text x="${L - 4}" y="14" text-anchor="end">${max.toLocaleString()}</text>`;
+  return svg(W, H, body);
+}
+
+// Overview
+document.getElementById('title').textContent = P.title;
+document.title = P.title;
+document.getElementById('subtitle').textContent =
+  `${P.n_rows.toLocaleString()} rows, ${P.n_columns} columns; pre-aggregated, scatter plots downsampled with LTTB`;
+if (P.overview) {
+  document.getElementById('overview').innerHTML =
+    Object.entries(P.overview).map(([k, v]) => `<dt>${esc(k)}</dt><dd>${esc(v)}</dd>`).join('');
+} else {
+  document.getElementById('overview-panel').style.display = 'none';
+}
+
+// Histograms
+const histSelect = document.getElementById('hist-select');
+const histNames = Object.keys(P.histograms);
+histSelect.innerHTML = histNames.map(n => `<option>${esc(n)}</option>`).join('');
+if (P.target && P.histograms[P.target]) histSelect.value = P.target;
+function drawHist() {
+  const h = P.histograms[histSelect.value];
+  document.getElementById('hist').innerHTML = bars(decode(h.counts), h.lo, h.hi, '#4a7bb7') +
+    `<p class="note">${h.missing.toLocaleString()} missing</p>`;
+}
+histSelect.onchange = drawHist;
+if (histNames.length) drawHist();
+
+// Correlation heatmap
+function corrColor(v) {
+  const t = Math.min(Math.abs(v), 1), c = Math.round(255 * (1 - t));
+  return v >= 0 ? `rgb(255,${c},${c})` : `rgb(${c},${c},255)`;
+}
+(function drawCorr() {
+  const cols = P.correlation.columns, m = decode(P.correlation.matrix), n = cols.length;
+  const L = 90, S = Math.min(22, 420 / n), W = L + n * S, H = L + n * S;
+  let body = '';
+  cols.forEach((c, i) => {
+    body += `<text x="${L - 4}" y="${L + (i + 0.7) * S}" text-anchor="end">${esc(c)}</text>`;
+    body += `<text transform="translate(${L + (i + 0.7) * S},${L - 4}) rotate(-60)">${esc(c)}</text>`;
+    cols.forEach((d, j) => {
+      const v = m[i * n + j];
+      body += `<rect x="${L + j * S}" y="${L + i * S}" width="${S - 1}" height="${S - 1}" fill="${corrColor(v)}"
+        data-row="${esc(c)}" data-col="${esc(d)}" data-tip="${esc(c)} / ${esc(d)}: ${v.toFixed(3)}"/>`;
+    });
+  });
+  const el = document.getElementById('corr');
+  el.innerHTML = svg(W, H, body);
+  el.onclick = e => {
+    const r = e.target.dataset;
+    const feature = r.row === P.target ? r.col : r.col === P.target ? r.row : null;
+    if (feature && P.scatter[feature]) { scatterSelect.value = feature; drawScatter(); }
+  };
+})();
+
+// Scatter plots
+const scatterSelect = document.getElementById('scatter-select');
+const scatterNames = Object.keys(P.scatter);
+scatterSelect.innerHTML = scatterNames.map(n => `<option>${esc(n)}</option>`).join('');
+function drawScatter() {
+  const s = P.scatter[scatterSelect.value], x = decode(s.x), y = decode(s.y);
+  const W = 520, H = 260, L = 50, B = 24;
+  let x0 = Infinity, x1 = -Infinity, y0 = Infinity, y1 = -Infinity;
+  for (let i = 0; i < x.length; i++) {
+    x0 = Math.min(x0, x[i]); x1 = Math.max(x1, x[i]); y0 = Math.min(y0, y[i]); y1 = Math.max(y1, y[i]);
+  }
+  const sx = v => L + (v - x0) / ((x1 - x0) || 1) * (W - L - 10);
+  const sy = v => H - B - (v - y0) / ((y1 - y0) || 1) * (H - B - 10);
+  let body = '';
+  for (let i = 0; i < x.length; i++) {
+    body += `<circle cx="${sx(x[i]).toFixed(1)}" cy="${sy(y[i]).toFixed(1)}" r="2.5" fill="#4a7bb7" fill-opacity="0.6"
+      data-tip="${fmt(x[i])}, ${fmt(y[i])}"/>`;
+  }
+  body += `<text x="${L}" y="${H - 8}">${fmt(x0)}</text><text x="${W - 10}" y="${H - 8}" text-anchor="end">${fmt(x1)}</text>`;
+  body += `<text x="${L - 4}" y="${H - B}" text-anchor="end">${fmt(y0)}</text><text x="${L - 4}" y="14" text-anchor="end">${fmt(y1)}</text>`;
+  document.getElementById('scatter').innerHTML = svg(W, H, body) +
+    `<p class="note">${x.length.toLocaleString()} of ${s.n.toLocaleString()} points (LTTB), ${esc(P.target)} on the y axis</p>`;
+}
+scatterSelect.onchange = drawScatter;
+if (scatterNames.length) drawScatter();
+
+// Group drill-down
+(function drawGroups() {
+  const G = P.groups;
+  if (!G) { document.getElementById('groups-panel').style.display = 'none'; return; }
+  document.getElementById('groups-title').textContent = `By ${G.column}`;
+  const stats = Object.fromEntries(Object.entries(G.stats).map(([k, v]) => [k, decode(v)]));
+  const statNames = Object.keys(stats), missing = decode(G.missing), nm = G.missing_columns.length;
+  const hist = G.target_hist ? decode(G.target_hist.counts) : null;
+  const nb = hist ? hist.length / G.names.length : 0;
+  let rows = G.names.map((name, i) => ({name, i}));
+  let sortKey = 'count', ascending = false, selected = 0;
+
+  function drawTable() {
+    rows.sort((a, b) => {
+      const d = sortKey === 'name' ? a.name.localeCompare(b.name) : stats[sortKey][a.i] - stats[sortKey][b.i];
+      return ascending ? d : -d;
+    });
+    const head = `<tr><th data-key="name">${esc(G.column)}</th>` +
+      statNames.map(k => `<th data-key="${k}">${k}</th>`).join('') + '</tr>';
+    const body = rows.map(r => `<tr data-i="${r.i}"${r.i === selected ? ' class="selected"' : ''}><td>${esc(r.name)}</td>` +
+      statNames.map(k => `<td>${fmt(stats[k][r.i])}</td>`).join('') + '</tr>').join('');
+    document.getElementById('group-table').innerHTML = `<table><thead>${head}</thead><tbody>${body}</tbody></table>`;
+  }
+  function drawDetail() {
+    const name = G.names[selected];
+    if (hist) {
+      const total = new Float64Array(nb);
+      for (let g = 0; g < G.names.length; g++) for (let b = 0; b < nb; b++) total[b] += hist[g * nb + b];
+      document.getElementById('group-hist').innerHTML = `<p class="note">${esc(P.target)} in ${esc(name)} (dashed: all)</p>` +
+        bars(hist.subarray(selected * nb, (selected + 1) * nb), G.target_hist.lo, G.target_hist.hi, '#d98b3a', total);
+    }
+    const W = 520, L = 100, S = 16;
+    let body = '';
+    G.missing_columns.forEach((c, j) => {
+      const v = missing[selected * nm + j];
+      body += `<text x="${L - 4}" y="${(j + 0.75) * S}" text-anchor="end">${esc(c)}</text>`;
+      body += `<rect x="${L}" y="${j * S + 2}" width="${(W - L - 40) * v / 100}" height="${S - 4}" fill="#b74a4a"
+        data-tip="${esc(c)}: ${v.toFixed(1)}% missing in ${esc(name)}"/>`;
+      body += `<text x="${L + (W - L - 40) * v / 100 + 4}" y="${(j + 0.75) * S}">${v.toFixed(1)}%</text>`;
+    });
+    document.getElementById('group-missing').innerHTML = nm ?
+      `<p class="note">Missing values in ${esc(name)}</p>` + svg(W, nm * S + 4, body) : '';
+  }
+  document.getElementById('group-table').onclick = e => {
+    const th = e.target.closest('th'), tr = e.target.closest('tbody tr');
+    if (th) {
+      ascending = sortKey === th.dataset.key ? !ascending : th.dataset.key === 'name';
+      sortKey = th.dataset.key;
+    } else if (tr) {
+      selected = +tr.dataset.i;
+      drawDetail();
+    }
+    drawTable();
+  };
+  drawTable();
+  drawDetail();
+})();
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,257 @@
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import pandas as pd
+import numpy as np
+from .encoding import encode_categoricals, get_categorical_columns
+
+# ==================== Strategies ====================
+# Each strategy gets float values with NaN for missing, int codes with -1 for
+# missing and the group code of every row, and returns both arrays filled.
+
+def _column_modes(codes):
+    modes = np.zeros(codes.shape[1], dtype=codes.dtype)
+    for j in range(codes.shape[1]):
+        present = codes[:, j][codes[:, j] >= 0]
+        modes[j] = np.bincount(present).argmax() if len(present) else 0
+    return modes
+
+def _fill_codes_with_mode(codes):
+    filled = codes.copy()
+    modes = _column_modes(codes)
+    rows, cols = np.nonzero(filled < 0)
+    filled[rows, cols] = modes[cols]
+    return filled
+
+def _fill_columns(values, fill):
+    filled = values.copy()
+    rows, cols = np.nonzero(np.isnan(filled))
+    filled[rows, cols] = fill[cols]
+    return filled
+
+def impute_median(values, codes, groups):
+    """Column median for numeric columns, column mode for categoricals"""
+    with np.errstate(all='ignore'):
+        medians = np.nan_to_num(np.nanmedian(values, axis=0))
+    return _fill_columns(values, medians), _fill_codes_with_mode(codes)
+
+def impute_mean(values, codes, groups):
+    """Column mean for numeric columns, column mode for categoricals"""
+    with np.errstate(all='ignore'):
+        means = np.nan_to_num(np.nanmean(values, axis=0))
+    return _fill_columns(values, means), _fill_codes_with_mode(codes)
+
+def impute_group_median(values, codes, groups):
+    """Median / mode within the row's group (e.g. Neighborhood), global fallback"""
+    frame = pd.DataFrame(values)
+    group_medians = frame.groupby(groups).transform('median').to_numpy()
+    filled = np.where(np.isnan(values), group_medians, values)
+    with np.errstate(all='ignore'):
+        filled = _fill_columns(filled, np.nan_to_num(np.nanmedian(values, axis=0)))
+
+    filled_codes = codes.copy()
+    n_groups = int(groups.max()) + 1
+    global_modes = _column_modes(codes)
+    for j in range(codes.shape[1]):
+        col = codes[:, j]
+        present = col >= 0
+        n_levels = int(col.max()) + 1 if present.any() else 1
+        counts = np.bincount(groups[present] * n_levels + col[present],
+                             minlength=n_groups * n_levels).reshape(n_groups, n_levels)
+        group_modes = np.where(counts.sum(axis=1) > 0, counts.argmax(axis=1), global_modes[j])
+        missing = ~present
+        filled_codes[missing, j] = group_modes[groups[missing]]
+    return filled, filled_codes
+
+def impute_knn(values, codes, groups, n_neighbors=5):
+    """KNNImputer on the numeric columns, column mode for categoricals"""
+    from sklearn.impute import KNNImputer
+
+    all_missing = np.isnan(values).all(axis=0)
+    filled = values.copy()
+    if (~all_missing).any():
+        filled[:, ~all_missing] = KNNImputer(n_neighbors=n_neighbors).fit_transform(values[:, ~all_missing])
+    filled[:, all_missing] = 0
+    return filled, _fill_codes_with_mode(codes)
+
+STRATEGIES = {
+    'median': impute_median,
+    'mean': impute_mean,
+    'neighborhood_median': impute_group_median,
+    'knn': impute_knn,
+}
+
+# ==================== Masks ====================
+
+def make_eval_mask(observed, rate=0.1, mode='mcar', rng=None, patterns=None):
+    """
+    Choose observed cells to hide
+
+    mode='mcar' hides each observed cell with probability `rate`.
+    mode='pattern' copies real missingness patterns (rows of `patterns`) onto
+    a `rate` fraction of rows, so co-missing columns are hidden together.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if mode == 'mcar':
+        return observed & (rng.random(observed.shape) < rate)
+    if mode == 'pattern':
+        if patterns is None or len(patterns) == 0:
+            raise ValueError("Pattern masks need at least one missingness pattern")
+        chosen = rng.random(observed.shape[0]) < rate
+        picks = rng.integers(0, len(patterns), size=chosen.sum())
+        mask = np.zeros_like(observed)
+        mask[chosen] = patterns[picks]
+        return mask & observed
+    raise ValueError(f"Unknown mask mode '{mode}', expected 'mcar' or 'pattern'")
+
+# ==================== Trials ====================
+
+_SHARED = {}
+
+def _attach_shared(spec):
+    """Process pool initializer: map the shared input buffers read-only"""
+    for name, (shm_name, shape, dtype) in spec.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        array.flags.writeable = False
+        _SHARED[name] = (shm, array)
+
+def _shared(name):
+    return _SHARED[name][1]
+
+def _run_trial(task):
+    """Mask, impute and score one (strategy, seed) pair"""
+    strategy, seed, mode, rate = task
+    values, codes, groups = _shared('values'), _shared('codes'), _shared('groups')
+    n_numeric = values.shape[1]
+
+    observed = np.concatenate([~np.isnan(values), codes >= 0], axis=1)
+    patterns = _shared('patterns') if mode == 'pattern' else None
+    mask = make_eval_mask(observed, rate, mode, np.random.default_rng(seed), patterns)
+    num_mask, cat_mask = mask[:, :n_numeric], mask[:, n_numeric:]
+
+    masked_values = np.where(num_mask, np.nan, values)
+    masked_codes = np.where(cat_mask, -1, codes)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    filled_values, filled_codes = STRATEGIES[strategy](masked_values, masked_codes, groups)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rows = []
+    for j in range(n_numeric):
+        hidden = num_mask[:, j]
+        if hidden.any():
+            error = filled_values[hidden, j] - values[hidden, j]
+            rows.append({'Column_Index': j, 'Kind': 'numeric', 'N_Masked': int(hidden.sum()),
+                         'RMSE': float(np.sqrt(np.mean(error ** 2))), 'Accuracy': np.nan})
+    for j in range(codes.shape[1]):
+        hidden = cat_mask[:, j]
+        if hidden.any():
+            correct = filled_codes[hidden, j] == codes[hidden, j]
+            rows.append({'Column_Index': n_numeric + j, 'Kind': 'categorical',
+                         'N_Masked': int(hidden.sum()), 'RMSE': np.nan,
+                         'Accuracy': float(correct.mean())})
+    for row in rows:
+        row.update({'Strategy': strategy, 'Seed': seed, 'Seconds': seconds,
+                    'Peak_MB': peak / 1024**2})
+    return rows
+
+def _share_arrays(arrays):
+    """Copy arrays into shared memory blocks; returns (spec, handles)"""
+    spec, handles = {}, []
+    for name, array in arrays.items():
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+        spec[name] = (shm.name, array.shape, array.dtype.str)
+        handles.append(shm)
+    return spec, handles
+
+def evaluate_imputation(df, strategies=None, n_seeds=5, mode='mcar', rate=0.1,
+                        numeric_cols=None, categorical_cols=None, group_col='Neighborhood',
+                        n_jobs=None, seed=42):
+    """
+    Mask-and-recover evaluation of imputation strategies
+
+    Known values are hidden (MCAR or real missingness patterns), each
+    strategy fills them for every seed, and the filled values are compared to
+    the truth: RMSE (and RMSE / column std) for numeric columns, accuracy for
+    categorical ones. Trials run in a process pool that reads the input from
+    shared memory; time and peak traced memory are recorded per trial.
+
+    Returns (results, summary): one row per strategy/seed/column, and one row
+    per strategy.
+    """
+    if strategies is None:
+        strategies = list(STRATEGIES)
+    unknown = [s for s in strategies if s not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"Unknown strategies {unknown}, expected some of {list(STRATEGIES)}")
+
+    if categorical_cols is None:
+        categorical_cols = [col for col in get_categorical_columns(df) if col != group_col]
+    if numeric_cols is None:
+        numeric_cols = [col for col in df.columns
+                        if col not in categorical_cols and col not in ('Id', 'SalePrice', group_col)
+                        and pd.api.types.is_numeric_dtype(df[col])]
+
+    values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    codes_df, _ = encode_categoricals(df, categorical_cols, ordinal_maps={})
+    codes = codes_df.to_numpy(dtype=np.int64).reshape(len(df), len(categorical_cols))
+    if group_col in df.columns:
+        groups = pd.factorize(df[group_col])[0].astype(np.int64)
+        groups[groups < 0] = groups.max() + 1
+    else:
+        groups = np.zeros(len(df), dtype=np.int64)
+
+    missing = np.concatenate([np.isnan(values), codes < 0], axis=1)
+    patterns = np.unique(missing[missing.any(axis=1)], axis=0)
+    if mode == 'pattern' and len(patterns) == 0:
+        raise ValueError("No missingness patterns in the data to preserve")
+
+    arrays = {'values': values, 'codes': codes, 'groups': groups,
+              'patterns': patterns if len(patterns) else np.zeros((1, missing.shape[1]), dtype=bool)}
+    seeds = np.random.default_rng(seed).integers(0, 2**31 - 1, size=n_seeds)
+    tasks = [(strategy, int(s), mode, rate) for strategy in strategies for s in seeds]
+
+    print(f"🧪 Evaluating {len(strategies)} strategies x {n_seeds} seeds "
+          f"({mode} mask, rate={rate}) on {len(numeric_cols)} numeric + {len(categorical_cols)} categorical columns")
+
+    spec, handles = _share_arrays(arrays)
+    try:
+        if n_jobs is not None and n_jobs > 1:
+            with ProcessPoolExecutor(max_workers=n_jobs, initializer=_attach_shared,
+                                     initargs=(spec,)) as executor:
+                trial_rows = list(executor.map(_run_trial, tasks))
+        else:
+            _attach_shared(spec)
+            trial_rows = [_run_trial(task) for task in tasks]
+    finally:
+        for name in list(_SHARED):
+            _SHARED.pop(name)[0].close()
+        for shm in handles:
+            shm.close()
+            shm.unlink()
+
+    columns = numeric_cols + categorical_cols
+    results = pd.DataFrame([row for rows in trial_rows for row in rows])
+    results['Column'] = [columns[i] for i in results['Column_Index']]
+    stds = pd.Series(np.nanstd(values, axis=0), index=numeric_cols)
+    results['NRMSE'] = results['RMSE'] / results['Column'].map(stds)
+    results = results[['Strategy', 'Seed', 'Column', 'Kind', 'N_Masked', 'RMSE', 'NRMSE',
+                       'Accuracy', 'Seconds', 'Peak_MB']]
+
+    per_trial = results.groupby(['Strategy', 'Seed']).agg(
+        Mean_NRMSE=('NRMSE', 'mean'), Mean_Accuracy=('Accuracy', 'mean'),
+        Seconds=('Seconds', 'first'), Peak_MB=('Peak_MB', 'first'))
+    summary = per_trial.groupby('Strategy').agg(
+        Mean_NRMSE=('Mean_NRMSE', 'mean'), Mean_Accuracy=('Mean_Accuracy', 'mean'),
+        Mean_Seconds=('Seconds', 'mean'), Peak_MB=('Peak_MB', 'max'))
+    summary = summary.sort_values('Mean_NRMSE').reset_index()
+
+    print("✅ Imputation evaluation completed")
+    return results, summary
@@ -0,0 +1,403 @@
+import ctypes
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import time
+import weakref
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+# ==================== Fingerprints ====================
+
+class UnhashableArgument(TypeError):
+    """An argument could not be fingerprinted; the call is not memoized"""
+
+def _checksum(values):
+    """
+    Position-weighted 64-bit checksum of a numeric array, one pass at memory
+    speed: any change of a single element changes it
+    """
+    flat = np.ascontiguousarray(values).reshape(-1)
+    if flat.dtype.itemsize != 8:
+        flat = np.frombuffer(flat.tobytes() + b'\0' * (-flat.nbytes % 8), dtype=np.uint64)
+    else:
+        flat = flat.view(np.uint64)
+    total = np.uint64(len(flat))
+    block = 1 << 16
+    with np.errstate(over='ignore'):
+        for start in range(0, len(flat), block):
+            positions = np.arange(start, min(start + block, len(flat)), dtype=np.uint64)
+            weights = (positions * np.uint64(0x9E3779B97F4A7C15)) | np.uint64(1)
+            total += (flat[start:start + block] * weights).sum(dtype=np.uint64)
+    return int(total)
+
+def _object_pointers(values):
+    """
+    Checksum of the object pointers of an object array
+
+    Catches in-place writes to text columns (loc assignment, fillna with
+    inplace=True) without hashing any strings; equal strings in a reloaded
+    frame have different pointers, so this is only compared for the same
+    frame object.
+    """
+    values = np.ascontiguousarray(values)
+    if values.size == 0:
+        return 0
+    buffer = (ctypes.c_uint64 * values.size).from_address(values.ctypes.data)
+    return _checksum(np.frombuffer(buffer, dtype=np.uint64))
+
+def _is_numeric(series):
+    return (pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_datetime64_any_dtype(series.dtype)
+            or isinstance(series.dtype, pd.CategoricalDtype))
+
+def _text_guard(series):
+    """Changes whenever a text column is written to"""
+    array = series.array
+    if isinstance(array, pd.arrays.NumpyExtensionArray):
+        return _object_pointers(np.asarray(array))
+    # Other arrays (Arrow strings, periods, intervals ...) can also be written
+    # to in place but expose no object pointers, so their content is hashed
+    return _checksum(pd.util.hash_array(np.asarray(array, dtype=object)))
+
+def _numeric_part(df, columns):
+    h = hashlib.sha1()
+    for col in columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            h.update(pd.util.hash_array(np.asarray(series.cat.categories, dtype=object)).tobytes())
+            values = series.cat.codes.to_numpy()
+        elif isinstance(series.dtype, np.dtype):
+            values = series.to_numpy()
+        else:
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        h.update(_checksum(values).to_bytes(8, 'little'))
+    return h.digest()
+
+def _text_part(df, columns, exact, block_rows, sample_blocks):
+    """
+    Content hash of the text columns, over all row blocks (exact) or over
+    the first, last and `sample_blocks` evenly spaced blocks
+    """
+    n_blocks = max(1, -(-len(df) // block_rows))
+    part = df[columns]
+    if not exact and n_blocks > sample_blocks + 2:
+        blocks = np.unique(np.r_[0, np.linspace(1, n_blocks - 2, sample_blocks).astype(int), n_blocks - 1])
+        rows = (blocks[:, None] * block_rows + np.arange(block_rows)).ravel()
+        part = part.iloc[rows[rows < len(df)]]
+    return hashlib.sha1(pd.util.hash_pandas_object(part, index=False).to_numpy().tobytes()).digest()
+
+# Frame objects fingerprinted before: id -> (weakref, text pointers, text part, exact)
+_SEEN = {}
+
+def fingerprint_frame(df, exact=False, block_rows=4096, sample_blocks=16):
+    """
+    Cheap content fingerprint of a DataFrame
+
+    Shape, column names, dtypes and the index are always included, numeric
+    columns are checksummed in full (one pass at memory speed) and text
+    columns are hashed block-wise: all row blocks with exact=True, otherwise
+    a sample of blocks. For a frame object seen before, the object pointers
+    of its text columns show whether it was written to in place; if so the
+    text columns are hashed exactly, so in-place mutation always changes the
+    fingerprint.
+    """
+    numeric = [col for col in df.columns if _is_numeric(df[col])]
+    text = [col for col in df.columns if col not in numeric]
+
+    h = hashlib.sha1()
+    h.update(repr((df.shape, list(df.columns), [str(t) for t in df.dtypes])).encode())
+    if isinstance(df.index, pd.RangeIndex):
+        h.update(repr(df.index).encode())
+    else:
+        h.update(pd.util.hash_pandas_object(df.index, index=False).to_numpy().tobytes())
+    h.update(_numeric_part(df, numeric))
+
+    guard = (tuple(text), tuple(_text_guard(df[col]) for col in text))
+    seen = _SEEN.get(id(df))
+    same_object = seen is not None and seen[0]() is df
+    if same_object and seen[1] == guard and (seen[3] or not exact):
+        text_part = seen[2]
+    else:
+        # A frame seen before whose text columns changed is hashed exactly,
+        # since the changed rows may be outside the sampled blocks
+        exact_text = exact or same_object
+        text_part = _text_part(df, text, exact_text, block_rows, sample_blocks) if text else b''
+        _SEEN[id(df)] = (weakref.ref(df, lambda _, key=id(df): _SEEN.pop(key, None)),
+                         guard, text_part, exact_text)
+    h.update(text_part)
+    return h.hexdigest()
+
+def fingerprint(value, exact=False):
+    """
+    Fingerprint of a function argument
+
+    DataFrames and Series use fingerprint_frame; arrays are hashed in full;
+    containers and plain objects are fingerprinted field by field; anything
+    else must be picklable.
+    """
+    if isinstance(value, pd.DataFrame):
+        return 'frame:' + fingerprint_frame(value, exact)
+    if isinstance(value, pd.Series):
+        # A temporary frame has no identity to guard, so hash it exactly
+        return 'series:' + fingerprint_frame(value.to_frame(), exact=True)
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return 'array:' + hashlib.sha1(pd.util.hash_array(value.ravel()).tobytes()
+                                           + repr(value.shape).encode()).hexdigest()
+        return 'array:' + hashlib.sha1(np.ascontiguousarray(value).tobytes()
+                                       + repr((value.shape, value.dtype.str)).encode()).hexdigest()
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return f'{type(value).__name__}(' + ','.join(fingerprint(v, exact) for v in value) + ')'
+    if isinstance(value, dict):
+        return 'dict(' + ','.join(f'{fingerprint(k, exact)}:{fingerprint(v, exact)}'
+                                  for k, v in sorted(value.items(), key=lambda item: repr(item[0]))) + ')'
+    if hasattr(value, '__dict__') and not callable(value):
+        return f'{type(value).__qualname__}' + fingerprint(vars(value), exact)
+    try:
+        return 'pickle:' + hashlib.sha1(pickle.dumps(value)).hexdigest()
+    except Exception as e:
+        raise UnhashableArgument(f"Cannot fingerprint {type(value).__name__}: {e}")
+
+# ==================== Cache ====================
+
+def _nbytes(value):
+    """Approximate memory held by a cached result"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v) for v in value)
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    try:
+        return len(pickle.dumps(value))
+    except Exception:
+        return 1024
+
+def _copy_on_write():
+    """Whether pandas copy-on-write is active (always from pandas 3)"""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    try:
+        return pd.get_option('mode.copy_on_write') is True
+    except Exception:
+        return False
+
+def _copy_result(value):
+    """
+    Copy of a cached result for the caller, so writes to it cannot reach the cache
+
+    Frames are copied shallowly under copy-on-write (a write through the
+    copy copies the shared buffer first) and deeply otherwise; arrays are
+    always copied.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=not _copy_on_write())
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy_result(v) for v in value)
+    if isinstance(value, list):
+        return [_copy_result(v) for v in value]
+    if isinstance(value, dict):
+        return {key: _copy_result(v) for key, v in value.items()}
+    return value
+
+class MemoCache:
+    """
+    In-memory LRU of results with a byte budget
+
+    When an entry is evicted and spill_dir is set it is pickled to disk
+    (atomic rename) and loaded back on the next hit, so results also survive
+    a kernel restart.
+    """
+
+    def __init__(self, max_bytes=512 * 1024**2, spill_dir=None):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.stats = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0, 'spills': 0}
+
+    def _spill_path(self, key):
+        return os.path.join(self.spill_dir, f'{key}.pkl')
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return True, self.entries[key][0]
+        if self.spill_dir and os.path.exists(self._spill_path(key)):
+            try:
+                with open(self._spill_path(key), 'rb') as f:
+                    value = pickle.load(f)
+            except Exception:
+                return False, None
+            self.stats['disk_hits'] += 1
+            self.put(key, value, spill=False)
+            return True, value
+        self.stats['misses'] += 1
+        return False, None
+
+    def put(self, key, value, spill=True):
+        size = _nbytes(value)
+        if key in self.entries:
+            self.bytes -= self.entries.pop(key)[1]
+        self.entries[key] = (value, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            old_key, (old_value, old_size) = self.entries.popitem(last=False)
+            self.bytes -= old_size
+            self.stats['evictions'] += 1
+            if spill and self.spill_dir:
+                self._spill(old_key, old_value)
+        if self.bytes > self.max_bytes and spill and self.spill_dir:
+            # A single entry over budget goes straight to disk
+            self.entries.pop(key)
+            self.bytes -= size
+            self._spill(key, value)
+
+    def _spill(self, key, value):
+        os.makedirs(self.spill_dir, exist_ok=True)
+        path = self._spill_path(key)
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+            self.stats['spills'] += 1
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def clear(self, disk=False):
+        self.entries.clear()
+        self.bytes = 0
+        if disk and self.spill_dir and os.path.isdir(self.spill_dir):
+            for name in os.listdir(self.spill_dir):
+                if name.endswith('.pkl'):
+                    os.remove(os.path.join(self.spill_dir, name))
+
+MEMO_CACHE = MemoCache()
+
+def configure_memo_cache(max_bytes=None, spill_dir=None):
+    """
+    Set the byte budget and/or the spill directory of the shared cache
+    """
+    if max_bytes is not None:
+        MEMO_CACHE.max_bytes = max_bytes
+    if spill_dir is not None:
+        MEMO_CACHE.spill_dir = spill_dir
+    return MEMO_CACHE
+
+def clear_memo_cache(disk=False):
+    MEMO_CACHE.clear(disk)
+
+def memo_cache_info():
+    """
+    Hit/miss counters, entry count and bytes held by the shared cache
+    """
+    return {**MEMO_CACHE.stats, 'entries': len(MEMO_CACHE.entries),
+            'bytes': MEMO_CACHE.bytes, 'max_bytes': MEMO_CACHE.max_bytes,
+            'spill_dir': MEMO_CACHE.spill_dir}
+
+# ==================== Decorator ====================
+
+def _code_bytes(code):
+    """Bytecode and constants of a code object and the functions nested in it"""
+    consts = [c for c in code.co_consts if not hasattr(c, 'co_code')]
+    nested = b''.join(_code_bytes(c) for c in code.co_consts if hasattr(c, 'co_code'))
+    return code.co_code + repr(consts).encode() + nested
+
+@functools.lru_cache(maxsize=None)
+def _source_digest(directory):
+    """Digest of every .py file under a package directory"""
+    h = hashlib.sha1()
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith('.py'):
+                path = os.path.join(root, name)
+                h.update(os.path.relpath(path, directory).encode())
+                with open(path, 'rb') as f:
+                    h.update(f.read())
+    return h.digest()
+
+def _code_digest(func):
+    """
+    Digest of the code a cached result depends on
+
+    The function's own bytecode plus the source of every module in its
+    top-level package, so editing a helper it calls (get_categorical_columns,
+    a _compute_* function) invalidates results spilled to disk too. A
+    function outside a package hashes its module file, or only its bytecode
+    when it has none (defined in a notebook).
+    """
+    h = hashlib.sha1(_code_bytes(func.__code__))
+    root = sys.modules.get(func.__module__.split('.')[0])
+    module = sys.modules.get(func.__module__)
+    root_file = getattr(root, '__file__', None)
+    module_file = getattr(module, '__file__', None)
+    if root_file and os.path.basename(root_file) == '__init__.py':
+        h.update(_source_digest(os.path.dirname(os.path.abspath(root_file))))
+    elif module_file and os.path.exists(module_file):
+        with open(module_file, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+def memoize(func=None, *, exact=False, cache=None, verbose=True):
+    """
+    Memoize a function on the content of its arguments
+
+    The key combines the function's qualified name and code digest (its
+    bytecode and the source of its package, see _code_digest) with the
+    fingerprints of all arguments (see fingerprint_frame; exact=True hashes
+    every text row). Results are handed out as copies (see _copy_result), so
+    callers cannot alter the cache.
+    Setting `enabled = False` on the wrapper or passing _memo=False bypasses
+    the cache.
+
+    Only memoize pure computations: a hit skips the function body, so
+    prints, display() calls and figures it would create are lost. Cache the
+    statistics and draw or print in an uncached wrapper.
+    """
+    if func is None:
+        return functools.partial(memoize, exact=exact, cache=cache, verbose=verbose)
+
+    code_digest = _code_digest(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, _memo=True, **kwargs):
+        store = cache if cache is not None else MEMO_CACHE
+        if not _memo or not wrapper.enabled:
+            return func(*args, **kwargs)
+        try:
+            start = time.perf_counter()
+            key = hashlib.sha1('|'.join([
+                func.__module__, func.__qualname__, code_digest,
+                fingerprint(args, exact), fingerprint(kwargs, exact)
+            ]).encode()).hexdigest()
+            hash_seconds = time.perf_counter() - start
+        except UnhashableArgument:
+            return func(*args, **kwargs)
+
+        found, value = store.get(key)
+        if found:
+            if verbose:
+                print(f"♻️ {func.__name__}: cached result (fingerprint {hash_seconds * 1000:.0f} ms)")
+            return _copy_result(value)
+        value = func(*args, **kwargs)
+        store.put(key, value)
+        return _copy_result(value)
+
+    wrapper.enabled = True
+    wrapper.uncached = func
+    return wrapper
@@ -0,0 +1,178 @@
+from .pdf_writer import PdfDocument, PdfImage, text_width
+
+class ReportComposer:
+    """
+    Flowing layout on top of PdfDocument
+
+    Content is appended top to bottom; a new page starts automatically when
+    the next block does not fit, and tables repeat their header row on every
+    page they span. Only charts are rendered by matplotlib (via add_figure).
+    """
+
+    def __init__(self, title=None, margin=54, image_dpi=110):
+        self.doc = PdfDocument(title=title)
+        self.margin = margin
+        self.image_dpi = image_dpi
+        self.page = None
+        self.y = 0
+        self.new_page()
+
+    @property
+    def width(self):
+        return self.page.width - 2 * self.margin
+
+    @property
+    def left(self):
+        return self.margin
+
+    def new_page(self):
+        """Start a new page and move the cursor to the top margin"""
+        self.page = self.doc.add_page()
+        self.y = self.page.height - self.margin
+        return self.page
+
+    def ensure_space(self, height):
+        """Break the page if fewer than `height` points remain"""
+        if self.y - height < self.margin:
+            self.new_page()
+
+    def at_page_top(self):
+        return self.y >= self.page.height - self.margin
+
+    def spacer(self, height):
+        self.y -= height
+        if self.y < self.margin:
+            self.new_page()
+
+    def text(self, text, size=10, bold=False, italic=False, indent=0, align='left',
+             leading=1.45):
+        """Add a paragraph, wrapped to the text width"""
+        max_width = self.width - indent
+        for line in wrap_text(text, size, max_width, bold):
+            self.ensure_space(size * leading)
+            self.y -= size * leading
+            if align == 'center':
+                x = self.left + self.width / 2
+            else:
+                x = self.left + indent
+            self.page.text(x, self.y, line, size=size, bold=bold, italic=italic, align=align)
+
+    def title(self, text):
+        if not self.at_page_top():
+            self.spacer(8)
+        self.ensure_space(60)
+        self.text(text, size=16, bold=True)
+        self.spacer(10)
+
+    def section(self, text):
+        self.ensure_space(40)
+        self.spacer(6)
+        self.text(text, size=12, bold=True)
+        self.spacer(2)
+
+    def bullets(self, items, size=10, marker='- '):
+        for item in items:
+            self.text(f'{marker}{item}', size=size, indent=18)
+
+    def table(self, header, rows, size=8, col_widths=None, align=None, zebra=True):
+        """
+        Add a table; rows flow across pages with the header repeated
+
+        col_widths are relative weights; by default they follow the widest
+        cell of each column. Cells that do not fit are truncated with '...'.
+        """
+        n_cols = len(header)
+        rows = [[str(cell) for cell in row] for row in rows]
+        if align is None:
+            align = ['left'] + ['right'] * (n_cols - 1)
+        if col_widths is None:
+            col_widths = [
+                max([text_width(header[j], size, bold=True)] +
+                    [text_width(row[j], size) for row in rows]) + 8
+                for j in range(n_cols)
+            ]
+        scale = self.width / sum(col_widths)
+        widths = [w * scale for w in col_widths]
+        row_height = size * 1.6
+
+        def draw_row(cells, bold, shade):
+            self.y -= row_height
+            if shade:
+                self.page.rect(self.left, self.y - size * 0.45, self.width, row_height,
+                               fill_gray=0.94)
+            x = self.left
+            for cell, width, cell_align in zip(cells, widths, align):
+                cell = fit_text(cell, size, width - 6, bold)
+                if cell_align == 'right':
+                    self.page.text(x + width - 3, self.y, cell, size=size, bold=bold, align='right')
+                else:
+                    self.page.text(x + 3, self.y, cell, size=size, bold=bold)
+                x += width
+
+        def draw_header():
+            draw_row(header, True, False)
+            self.page.line(self.left, self.y - size * 0.45,
+                           self.left + self.width, self.y - size * 0.45)
+
+        self.ensure_space(row_height * 3)
+        draw_header()
+        for index, row in enumerate(rows):
+            if self.y - row_height < self.margin:
+                self.new_page()
+                draw_header()
+            draw_row(row, False, zebra and index % 2 == 1)
+        self.spacer(size)
+
+    def image(self, image, width=None):
+        """Add a PdfImage scaled to `width` points (default: full text width)"""
+        width = min(width or self.width, self.width)
+        height = width * image.height / image.width
+        max_height = self.page.height - 2 * self.margin
+        if height > max_height:
+            width, height = width * max_height / height, max_height
+        self.ensure_space(height + 6)
+        self.y -= height
+        x = self.left + (self.width - width) / 2
+        self.page.image(image, x, self.y, width, height)
+        self.spacer(6)
+
+    def add_figure(self, fig, width=None, dpi=None):
+        """Rasterize a matplotlib chart and add it"""
+        self.image(PdfImage.from_figure(fig, dpi=dpi or self.image_dpi), width)
+
+    def add_page_numbers(self, size=8):
+        n_pages = len(self.doc.pages)
+        for number, page in enumerate(self.doc.pages, start=1):
+            page.text(page.width / 2, self.margin / 2, f'Page {number} of {n_pages}',
+                      size=size, align='center', gray=0.4)
+
+    def to_bytes(self):
+        return self.doc.to_bytes()
+
+def wrap_text(text, size, max_width, bold=False):
+    """
+    Greedy word wrap using Helvetica metrics
+    """
+    lines = []
+    for paragraph in str(text).split('\n'):
+        words = paragraph.split(' ')
+        current = ''
+        for word in words:
+            candidate = f'{current} {word}' if current else word
+            if current and text_width(candidate, size, bold) > max_width:
+                lines.append(current)
+                current = word
+            else:
+                current = candidate
+        lines.append(fit_text(current, size, max_width, bold))
+    return lines
+
+def fit_text(text, size, max_width, bold=False):
+    """
+    Truncate text with '...' so it fits in max_width points
+    """
+    if text_width(text, size, bold) <= max_width:
+        return text
+    while text and text_width(text + '...', size, bold) > max_width:
+        text = text[:-1]
+    return text + '...'
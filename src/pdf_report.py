@@ -1,240 +1,330 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
 import os
 from datetime import datetime
-import seaborn as sns
+import time
+from .eda_result import summarize_eda
+from .pdf_composer import ReportComposer
+from .render_profiles import get_render_profile
 
-def create_pdf_report(train_df, corr_df, missing_df, new_features=None):
+def create_pdf_report(train_df=None, corr_df=None, missing_df=None, new_features=None, writer=None,
+                      profile='screen', figures=None, pdf_path=None, dedup_summary=None,
+                      preview=None, drift=None, result=None):
     """
     Create PDF EDA report
+
+    The pages render from an EDAResult: pass result= to reuse one (the CSV,
+    text, JSON and HTML outputs render from the same object), otherwise it
+    is computed here from the frames with summarize_eda. Text, tables and
+    charts are composed straight into PDF with flowing layout and
+    pagination; matplotlib is only involved for the charts passed in
+    `figures` (e.g. {'price_distribution': fig, 'correlation': fig}), which
+    are rasterized at the render profile's DPI. If an ArtifactWriter is
+    given, the file write overlaps with whatever the caller does next.
+    dedup_summary (from deduplicate_listings) adds a deduplication page.
+    With preview=DataSample the report is marked as a preview and gets a
+    page of sample estimates with error bars. drift (from score_drift) adds a
+    drift report page.
     """
-    reports_dir = '../reports'
+    if pdf_path is None:
+        reports_dir = '../reports'
+        pdf_path = f'{reports_dir}/eda_report.pdf'
+    reports_dir = os.path.dirname(pdf_path) or '.'
     if not os.path.exists(reports_dir):
         os.makedirs(reports_dir)
-    
-    pdf_path = f'{reports_dir}/eda_report.pdf'
-    
-    with PdfPages(pdf_path) as pdf:
-        create_cover_page(pdf)
-        create_executive_summary(pdf, train_df, corr_df, missing_df)
-        create_data_overview(pdf, train_df)
-        create_missing_analysis(pdf, missing_df)
-        create_target_analysis(pdf, train_df)
-        create_correlation_analysis(pdf, corr_df)
-        
-        if new_features:
-            create_feature_engineering_page(pdf, new_features)
-        
-        create_conclusions_page(pdf)
-    
-    print(f"✅ PDF report generated: {pdf_path}")
+
+    if result is None:
+        result = summarize_eda(train_df, corr_df, missing_df, new_features,
+                               dedup_summary=dedup_summary, preview=preview, drift=drift)
+    figures = figures or {}
+    settings = get_render_profile(profile)
+    start = time.perf_counter()
+
+    report = ReportComposer(title=result.title, image_dpi=settings['dpi'])
+    create_cover_page(report, result.preview)
+    create_executive_summary(report, result)
+    create_data_overview(report, result)
+    if result.preview is not None:
+        create_preview_page(report, result.preview)
+    if result.dedup is not None:
+        create_dedup_page(report, result.dedup)
+    create_missing_analysis(report, result.missing)
+    create_target_analysis(report, result.target, figures.get('price_distribution'))
+    create_correlation_analysis(report, result.correlations, figures.get('correlation'))
+    if result.drift is not None:
+        create_drift_page(report, result.drift)
+
+    if result.new_features:
+        create_feature_engineering_page(report, result.new_features)
+
+    create_conclusions_page(report)
+    report.add_page_numbers()
+    data = report.to_bytes()
+
+    elapsed = time.perf_counter() - start
+
+    if writer is not None:
+        writer.write_bytes(pdf_path, data, kind='pdf')
+        print(f"✅ PDF report queued: {pdf_path} ({len(data) / 1024:.1f} KB, {elapsed:.2f} s)")
+        return pdf_path
+
+    with open(pdf_path, 'wb') as f:
+        f.write(data)
+    print(f"✅ PDF report generated: {pdf_path} ({len(data) / 1024:.1f} KB, {elapsed:.2f} s)")
     return pdf_path
 
-def create_cover_page(pdf):
+def create_cover_page(report, preview=None):
     """Create cover page"""
-    fig, ax = plt.subplots(figsize=(8.5, 11))
-    ax.axis('off')
-    
-    ax.text(0.5, 0.7, 'HOUSE PRICES EDA REPORT', 
-            ha='center', va='center', fontsize=18, fontweight='bold')
-    ax.text(0.5, 0.6, 'Exploratory Data Analysis', 
-            ha='center', va='center', fontsize=14)
-    
-    ax.text(0.5, 0.4, 'Kaggle House Prices Competition', 
-            ha='center', va='center', fontsize=12)
-    
+    report.spacer(180)
+    report.text('HOUSE PRICES EDA REPORT', size=18, bold=True, align='center')
+    report.spacer(40)
+    report.text('Exploratory Data Analysis', size=14, align='center')
+    if preview is not None:
+        report.spacer(12)
+        report.text(f'PREVIEW on {preview.description}', size=11, italic=True, align='center')
+
+    report.spacer(120)
+    report.text('Kaggle House Prices Competition', size=12, align='center')
+
     current_date = datetime.now().strftime('%Y-%m-%d')
-    ax.text(0.5, 0.2, f'Generated: {current_date}', 
-            ha='center', va='center', fontsize=10)
-    
-    pdf.savefig(fig, bbox_inches='tight')
-    plt.close()
+    report.spacer(120)
+    report.text(f'Generated: {current_date}', size=10, align='center')
 
-def create_executive_summary(pdf, train_df, corr_df, missing_df):
+def create_executive_summary(report, result):
     """Create executive summary page"""
-    fig, ax = plt.subplots(figsize=(8.5, 11))
-    ax.axis('off')
-    
-    y_position = 0.9
-    line_height = 0.05
-    
-    ax.text(0.1, y_position, 'EXECUTIVE SUMMARY', fontsize=16, fontweight='bold')
-    y_position -= line_height * 2
-    
+    report.new_page()
+    report.title('EXECUTIVE SUMMARY')
+
     # Data overview
-    if train_df is not None:
-        ax.text(0.1, y_position, 'DATA OVERVIEW:', fontsize=12, fontweight='bold')
-        y_position -= line_height
-        ax.text(0.15, y_position, f'Samples: {train_df.shape[0]:,}', fontsize=10)
-        y_position -= line_height
-        ax.text(0.15, y_position, f'Features: {train_df.shape[1]}', fontsize=10)
-        y_position -= line_height
-        if 'SalePrice' in train_df.columns:
-            ax.text(0.15, y_position, f'Price Range: ${train_df["SalePrice"].min():,} - ${train_df["SalePrice"].max():,}', fontsize=10)
-            y_position -= line_height
-        y_position -= line_height
-    
+    report.section('DATA OVERVIEW:')
+    overview = [
+        f'Samples: {result.n_rows:,}',
+        f'Features: {result.n_columns}'
+    ]
+    if result.target is not None:
+        overview.append(f'Price Range: ${result.target.min:,.0f} - ${result.target.max:,.0f}')
+    report.bullets(overview, marker='')
+
     # Missing values
+    missing_df = result.missing
     if missing_df is not None and len(missing_df) > 0:
-        ax.text(0.1, y_position, 'DATA QUALITY:', fontsize=12, fontweight='bold')
-        y_position -= line_height
-        ax.text(0.15, y_position, f'Columns with Missing Values: {len(missing_df)}', fontsize=10)
-        y_position -= line_height
+        report.section('DATA QUALITY:')
+        quality = [f'Columns with Missing Values: {len(missing_df)}']
         if 'Missing_Percent' in missing_df.columns:
             highest_missing = missing_df.iloc[0]['Missing_Percent']
-            ax.text(0.15, y_position, f'Highest Missing: {missing_df.index[0]} ({highest_missing}%)', fontsize=10)
-            y_position -= line_height
-        y_position -= line_height
-    
+            quality.append(f'Highest Missing: {missing_df.index[0]} ({highest_missing}%)')
+        report.bullets(quality, marker='')
+
     # Key findings
+    corr_df = result.correlations
     if corr_df is not None and len(corr_df) > 1:
-        ax.text(0.1, y_position, 'KEY FINDINGS:', fontsize=12, fontweight='bold')
-        y_position -= line_height
+        report.section('KEY FINDINGS:')
         top_features = corr_df.iloc[1:4]
-        for _, row in top_features.iterrows():
-            ax.text(0.15, y_position, f'{row["Feature"]}: Correlation {row["Correlation"]:.3f}', fontsize=10)
-            y_position -= line_height
-        y_position -= line_height
-    
+        report.bullets([f'{row["Feature"]}: Correlation {row["Correlation"]:.3f}'
+                        for _, row in top_features.iterrows()], marker='')
+
     # Conclusions
-    ax.text(0.1, y_position, 'CONCLUSIONS:', fontsize=12, fontweight='bold')
-    y_position -= line_height
-    conclusions = [
+    report.section('CONCLUSIONS:')
+    report.bullets([
         "Target variable is right-skewed, log transform recommended",
         "Strong correlated features identified for modeling",
         "Missing values need to be handled"
-    ]
-    for conclusion in conclusions:
-        ax.text(0.15, y_position, f'- {conclusion}', fontsize=10)
-        y_position -= line_height
-    
-    pdf.savefig(fig, bbox_inches='tight')
-    plt.close()
-
-def create_data_overview(pdf, train_df):
+    ])
+
+def create_data_overview(report, result):
     """Create data overview page"""
-    fig, ax = plt.subplots(figsize=(8.5, 11))
-    ax.axis('off')
-    
-    y_position = 0.9
-    
-    ax.text(0.1, y_position, 'DATASET OVERVIEW', fontsize=16, fontweight='bold')
-    y_position -= 0.08
-    
-    if train_df is not None:
-        ax.text(0.1, y_position, 'BASIC INFORMATION:', fontsize=12, fontweight='bold')
-        y_position -= 0.05
-        
-        info_text = [
-            f"Data Shape: {train_df.shape}",
-            f"Numeric Features: {len(train_df.select_dtypes(include=['number']).columns)}",
-            f"Categorical Features: {len(train_df.select_dtypes(include=['object']).columns)}",
-            f"Memory Usage: {train_df.memory_usage(deep=True).sum() / 1024**2:.1f} MB"
-        ]
-        
-        for text in info_text:
-            ax.text(0.15, y_position, f'- {text}', fontsize=10)
-            y_position -= 0.04
-        
-        y_position -= 0.02
-        
-        if 'SalePrice' in train_df.columns:
-            ax.text(0.1, y_position, 'TARGET STATISTICS:', fontsize=12, fontweight='bold')
-            y_position -= 0.05
-            
-            price_stats = train_df['SalePrice'].describe()
-            stats_text = [
-                f"Mean: ${price_stats['mean']:,.0f}",
-                f"Median: ${price_stats['50%']:,.0f}",
-                f"Standard Deviation: ${price_stats['std']:,.0f}",
-                f"Skewness: {train_df['SalePrice'].skew():.3f}"
-            ]
-            
-            for text in stats_text:
-                ax.text(0.15, y_position, f'- {text}', fontsize=10)
-                y_position -= 0.04
-    
-    pdf.savefig(fig, bbox_inches='tight')
-    plt.close()
-
-def create_missing_analysis(pdf, missing_df):
+    report.new_page()
+    report.title('DATASET OVERVIEW')
+
+    report.section('BASIC INFORMATION:')
+    report.bullets([
+        f"Data Shape: {result.shape}",
+        f"Numeric Features: {result.n_numeric}",
+        f"Categorical Features: {result.n_categorical} ({result.n_category_levels} levels)",
+        f"Memory Usage: {result.memory_mb:.1f} MB",
+        f"Encoded Categorical Memory: {result.encoded_memory_mb:.2f} MB"
+    ])
+
+    if result.target is not None:
+        report.section('TARGET STATISTICS:')
+        report.bullets([
+            f"Mean: ${result.target.mean:,.0f}",
+            f"Median: ${result.target.median:,.0f}",
+            f"Standard Deviation: ${result.target.std:,.0f}",
+            f"Skewness: {result.target.skew:.3f}"
+        ])
+
+def create_dedup_page(report, dedup_summary, max_rows=60):
+    """Create deduplication summary page"""
+    report.new_page()
+    report.title('DEDUPLICATION')
+
+    report.section('SUMMARY:')
+    summary = [
+        f"Input Rows: {dedup_summary['n_input']:,}",
+        f"Exact Duplicates Removed: {dedup_summary['n_exact_duplicates']:,}",
+        f"Near-Duplicate Clusters: {dedup_summary['n_near_clusters']:,} "
+        f"({dedup_summary['n_near_duplicates']:,} repeat listings)",
+        f"Repeat Listings Dropped: {dedup_summary['n_near_dropped']:,}",
+        f"Output Rows: {dedup_summary['n_output']:,}",
+    ]
+    if 'price_mean_before' in dedup_summary:
+        summary.append(f"Mean SalePrice: ${dedup_summary['price_mean_before']:,.0f} -> "
+                       f"${dedup_summary['price_mean_after']:,.0f}")
+    report.bullets(summary)
+
+    drop_near = dedup_summary.get('drop_near', dedup_summary['n_near_dropped'] > 0)
+    report.section('METHOD:')
+    report.bullets([
+        "Exact duplicates: 64-bit row hashes over all columns except Id",
+        f"Near duplicates: blocking on {' + '.join(dedup_summary['block_cols'])}, "
+        f"{dedup_summary['n_pairs_compared']:,} pairs compared",
+        f"Same property if at least {dedup_summary['threshold']:.0%} of the property fields agree; "
+        + ("the most recent sale is kept" if drop_near else "reported only, no listing dropped")
+    ])
+
+    clusters = dedup_summary['clusters']
+    if len(clusters) > 0:
+        report.section('NEAR-DUPLICATE CLUSTERS:')
+        shown = clusters.head(max_rows)
+        rows = []
+        for _, row in shown.iterrows():
+            rows.append([
+                str(row['Cluster']),
+                str(row['Id']) if 'Id' in row else 'N/A',
+                f"${row['SalePrice']:,.0f}" if 'SalePrice' in row else 'N/A',
+                ('Kept' if row['Kept'] else 'Dropped') if drop_near else 'Reported'
+            ])
+        report.table(['Cluster', 'Id', 'SalePrice', 'Status'], rows)
+        if len(clusters) > max_rows:
+            report.text(f'{len(clusters) - max_rows:,} more listings not shown', size=9, italic=True)
+
+def create_preview_page(report, preview):
+    """Create preview sample estimates page"""
+    report.new_page()
+    report.title('PREVIEW SAMPLE ESTIMATES')
+
+    report.section('SAMPLE:')
+    report.bullets([
+        f"Rows: {preview.description}",
+        f"Strata: {preview.n_strata}",
+        "Error bars: stratified bootstrap, 95% percentile intervals"
+    ])
+
+    estimates = preview.estimates
+    means = estimates[estimates['Statistic'] == 'Mean'].set_index('Column')
+    medians = estimates[estimates['Statistic'] == 'Median'].set_index('Column')
+
+    report.section('ESTIMATED MEANS AND MEDIANS:')
+    rows = []
+    for col, row in means.iterrows():
+        rows.append([
+            col,
+            f"{row['Estimate']:,.2f}",
+            f"± {row['Std_Error']:,.2f}",
+            f"{row['Low']:,.1f} - {row['High']:,.1f}",
+            f"{medians.loc[col, 'Estimate']:,.1f}"
+        ])
+    report.table(['Column', 'Mean', 'Std Error', '95% CI', 'Median'], rows,
+                 col_widths=[3, 2, 2, 3, 2])
+
+def create_drift_page(report, drift, max_rows=40):
+    """Create drift report page"""
+    report.new_page()
+    report.title('DRIFT REPORT')
+
+    counts = drift['severity_counts']
+    report.section('SUMMARY:')
+    report.bullets([
+        f"Batch: {drift['name']} ({drift['batch_rows']:,} rows)",
+        f"Baseline: {drift['baseline_source'] or 'training data'} ({drift['baseline_rows']:,} rows, "
+        f"sketched {drift['baseline_created']})",
+        f"Drift: {counts['drift']}, Warnings: {counts['warn']}, OK: {counts['ok']}, "
+        f"Skipped: {counts['skipped']}",
+    ])
+
+    report.section('METHOD:')
+    report.bullets([
+        "Numeric columns: PSI over baseline deciles and KS against the baseline histogram",
+        "Categorical columns: PSI and chi-square against baseline level frequencies",
+        "Missing rates: chi-square of the batch null count against the baseline rate",
+        "PSI >= 0.25 or a significant test with a large effect is drift; weaker signals are warnings"
+    ])
+
+    checks = drift['checks']
+    shown = checks[checks['Severity'] != 'ok']
+    if len(shown) == 0:
+        shown = checks
+    report.section('CHECKS:')
+    rows = []
+    for _, row in shown.head(max_rows).iterrows():
+        rows.append([
+            row['Column'],
+            row['Check'],
+            f"{row['Statistic']:.3f}" if pd.notna(row['Statistic']) else '-',
+            f"{row['P_Value']:.2g}" if pd.notna(row['P_Value']) else '-',
+            row['Severity'].upper(),
+            row['Detail']
+        ])
+    report.table(['Column', 'Check', 'Statistic', 'p-value', 'Severity', 'Detail'], rows,
+                 col_widths=[2, 1.5, 1.3, 1.2, 1.2, 5],
+                 align=['left', 'left', 'right', 'right', 'left', 'left'])
+    if len(shown) > max_rows:
+        report.text(f'{len(shown) - max_rows:,} more checks not shown', size=9, italic=True)
+
+def create_missing_analysis(report, missing_df):
     """Create missing values analysis page"""
-    fig, ax = plt.subplots(figsize=(8.5, 11))
-    ax.axis('off')
-    
-    y_position = 0.9
-    
-    ax.text(0.1, y_position, 'MISSING VALUES ANALYSIS', fontsize=16, fontweight='bold')
-    y_position -= 0.08
-    
+    report.new_page()
+    report.title('MISSING VALUES ANALYSIS')
+
     if missing_df is not None and len(missing_df) > 0:
-        ax.text(0.1, y_position, 'SUMMARY:', fontsize=12, fontweight='bold')
-        y_position -= 0.05
-        
+        report.section('SUMMARY:')
+
         total_missing = missing_df['Missing_Count'].sum() if 'Missing_Count' in missing_df.columns else 'N/A'
         avg_missing = missing_df['Missing_Percent'].mean() if 'Missing_Percent' in missing_df.columns else 'N/A'
-        
-        summary_text = [
+
+        report.bullets([
             f"Columns with Missing Values: {len(missing_df)}",
             f"Total Missing Values: {total_missing}",
             f"Average Missing %: {avg_missing:.1f}%" if isinstance(avg_missing, (int, float)) else f"Average Missing %: {avg_missing}"
-        ]
-        
-        for text in summary_text:
-            ax.text(0.15, y_position, f'- {text}', fontsize=10)
-            y_position -= 0.04
-        
-        y_position -= 0.02
-        
-        ax.text(0.1, y_position, 'TOP MISSING COLUMNS:', fontsize=12, fontweight='bold')
-        y_position -= 0.05
-        
-        top_missing = missing_df.head(8)
-        for idx, (col_name, row) in enumerate(top_missing.iterrows()):
-            if y_position < 0.1:
-                break
-            missing_value = row['Missing_Percent'] if 'Missing_Percent' in row else 'N/A'
-            ax.text(0.15, y_position, f'{idx+1}. {col_name}: {missing_value}%', fontsize=9)
-            y_position -= 0.035
+        ])
+
+        report.section('MISSING COLUMNS:')
+        has_error = 'Std_Error' in missing_df.columns
+        rows = []
+        for idx, (col_name, row) in enumerate(missing_df.iterrows()):
+            cells = [
+                f'{idx+1}. {col_name}',
+                f"{int(row['Missing_Count']):,}" if 'Missing_Count' in row else 'N/A',
+                f"{row['Missing_Percent']}%" if 'Missing_Percent' in row else 'N/A'
+            ]
+            if has_error:
+                cells.append(f"± {row['Std_Error']}%")
+            rows.append(cells)
+        if has_error:
+            report.table(['Column', 'Est. Missing Count', 'Missing %', 'Std Error'], rows,
+                         col_widths=[3, 1, 1, 1])
+        else:
+            report.table(['Column', 'Missing Count', 'Missing %'], rows, col_widths=[3, 1, 1])
     else:
-        ax.text(0.1, y_position, 'NO MISSING VALUES FOUND', fontsize=12)
-    
-    pdf.savefig(fig, bbox_inches='tight')
-    plt.close()
+        report.text('NO MISSING VALUES FOUND', size=12)
 
-def create_target_analysis(pdf, train_df):
+def create_target_analysis(report, target, price_figure=None):
     """Create target variable analysis page"""
-    fig, ax = plt.subplots(figsize=(8.5, 11))
-    ax.axis('off')
-    
-    y_position = 0.9
-    
-    ax.text(0.1, y_position, 'TARGET VARIABLE ANALYSIS', fontsize=16, fontweight='bold')
-    y_position -= 0.08
-    
-    if train_df is not None and 'SalePrice' in train_df.columns:
-        ax.text(0.1, y_position, 'STATISTICS:', fontsize=12, fontweight='bold')
-        y_position -= 0.05
-        
-        stats = train_df['SalePrice'].describe()
-        analysis_text = [
-            f"Skewness: {train_df['SalePrice'].skew():.3f}",
-            f"Kurtosis: {train_df['SalePrice'].kurt():.3f}",
-            f"Coefficient of Variation: {stats['std']/stats['mean']:.3f}",
+    report.new_page()
+    report.title('TARGET VARIABLE ANALYSIS')
+
+    if target is not None:
+        report.section('STATISTICS:')
+        report.bullets([
+            f"Skewness: {target.skew:.3f}",
+            f"Kurtosis: {target.kurtosis:.3f}",
+            f"Coefficient of Variation: {target.cv:.3f}",
             "Recommendation: Log transformation"
-        ]
-        
-        for text in analysis_text:
-            ax.text(0.15, y_position, f'- {text}', fontsize=10)
-            y_position -= 0.04
-        
-        y_position -= 0.02
-        
-        ax.text(0.1, y_position, 'DISTRIBUTION NOTES:', fontsize=12, fontweight='bold')
-        y_position -= 0.05
-        
-        if train_df['SalePrice'].skew() > 1:
+        ])
+
+        report.section('DISTRIBUTION NOTES:')
+
+        if target.skew > 1:
             distribution_notes = [
                 "Distribution is right-skewed",
                 "Few high-priced houses pull mean upward",
@@ -246,124 +336,78 @@ def create_target_analysis(pdf, train_df):
                 "Suitable for linear models",
                 "Watch for outliers"
             ]
-        
-        for note in distribution_notes:
-            ax.text(0.15, y_position, f'- {note}', fontsize=10)
-            y_position -= 0.04
-    
-    pdf.savefig(fig, bbox_inches='tight')
-    plt.close()
-
-def create_correlation_analysis(pdf, corr_df):
+
+        report.bullets(distribution_notes)
+
+    if price_figure is not None:
+        report.spacer(12)
+        report.add_figure(price_figure)
+
+def create_correlation_analysis(report, corr_df, correlation_figure=None):
     """Create correlation analysis page"""
-    fig, ax = plt.subplots(figsize=(8.5, 11))
-    ax.axis('off')
-    
-    y_position = 0.9
-    
-    ax.text(0.1, y_position, 'CORRELATION ANALYSIS', fontsize=16, fontweight='bold')
-    y_position -= 0.08
-    
+    report.new_page()
+    report.title('CORRELATION ANALYSIS')
+
     if corr_df is not None and len(corr_df) > 1:
         strong_corr = corr_df[corr_df['Correlation'].abs() > 0.5]
         moderate_corr = corr_df[(corr_df['Correlation'].abs() > 0.3) & (corr_df['Correlation'].abs() <= 0.5)]
-        
-        ax.text(0.1, y_position, 'CORRELATION STRENGTH:', fontsize=12, fontweight='bold')
-        y_position -= 0.05
-        
-        strength_text = [
+
+        report.section('CORRELATION STRENGTH:')
+        report.bullets([
             f"Strong (>0.5): {len(strong_corr)} features",
             f"Moderate (0.3-0.5): {len(moderate_corr)} features",
             f"Weak (<0.3): {len(corr_df) - len(strong_corr) - len(moderate_corr)} features"
-        ]
-        
-        for text in strength_text:
-            ax.text(0.15, y_position, f'- {text}', fontsize=10)
-            y_position -= 0.04
-        
-        y_position -= 0.02
-        
-        ax.text(0.1, y_position, 'TOP FEATURES:', fontsize=12, fontweight='bold')
-        y_position -= 0.05
-        
-        top_features = corr_df.iloc[1:6]
-        for idx, (_, row) in enumerate(top_features.iterrows()):
-            if y_position < 0.1:
-                break
-            correlation_strength = "Very Strong" if abs(row['Correlation']) > 0.7 else "Strong" if abs(row['Correlation']) > 0.5 else "Moderate"
-            ax.text(0.15, y_position, f'{idx+1}. {row["Feature"]}: {row["Correlation"]:.3f}', fontsize=10)
-            y_position -= 0.035
-            ax.text(0.17, y_position, f'({correlation_strength})', fontsize=9, style='italic')
-            y_position -= 0.025
-    
-    pdf.savefig(fig, bbox_inches='tight')
-    plt.close()
-
-def create_feature_engineering_page(pdf, new_features):
+        ])
+
+        if correlation_figure is not None:
+            report.spacer(12)
+            report.add_figure(correlation_figure)
+
+        report.section('FEATURES BY CORRELATION:')
+        has_interval = 'Correlation_Low' in corr_df.columns
+        rows = []
+        for idx, (_, row) in enumerate(corr_df.iloc[1:].iterrows()):
+            correlation = row['Correlation']
+            correlation_strength = "Very Strong" if abs(correlation) > 0.7 else "Strong" if abs(correlation) > 0.5 else "Moderate" if abs(correlation) > 0.3 else "Weak"
+            cells = [f'{idx+1}. {row["Feature"]}', f'{correlation:.3f}', correlation_strength]
+            if has_interval:
+                cells.insert(2, f"{row['Correlation_Low']:.3f} - {row['Correlation_High']:.3f}")
+            rows.append(cells)
+        if has_interval:
+            report.table(['Feature', 'Correlation', '95% CI', 'Strength'], rows, col_widths=[3, 1, 2, 1])
+        else:
+            report.table(['Feature', 'Correlation', 'Strength'], rows, col_widths=[3, 1, 1])
+
+def create_feature_engineering_page(report, new_features):
     """Create feature engineering page"""
-    fig, ax = plt.subplots(figsize=(8.5, 11))
-    ax.axis('off')
-    
-    y_position = 0.9
-    
-    ax.text(0.1, y_position, 'FEATURE ENGINEERING', fontsize=16, fontweight='bold')
-    y_position -= 0.08
-    
+    report.new_page()
+    report.title('FEATURE ENGINEERING')
+
     if new_features:
-        ax.text(0.1, y_position, 'NEW FEATURES:', fontsize=12, fontweight='bold')
-        y_position -= 0.05
-        
-        for feature in new_features:
-            if y_position < 0.1:
-                break
-            ax.text(0.15, y_position, f'- {feature}', fontsize=10)
-            y_position -= 0.035
-    
-    pdf.savefig(fig, bbox_inches='tight')
-    plt.close()
-
-def create_conclusions_page(pdf):
+        report.section('NEW FEATURES:')
+        report.bullets(new_features)
+
+def create_conclusions_page(report):
     """Create conclusions page"""
-    fig, ax = plt.subplots(figsize=(8.5, 11))
-    ax.axis('off')
-    
-    y_position = 0.9
-    
-    ax.text(0.1, y_position, 'CONCLUSIONS AND RECOMMENDATIONS', fontsize=16, fontweight='bold')
-    y_position -= 0.08
-    
-    ax.text(0.1, y_position, 'MAIN CONCLUSIONS:', fontsize=12, fontweight='bold')
-    y_position -= 0.05
-    
-    conclusions = [
+    report.new_page()
+    report.title('CONCLUSIONS AND RECOMMENDATIONS')
+
+    report.section('MAIN CONCLUSIONS:')
+    report.bullets([
         "Good data quality with some missing values",
         "Target variable needs log transformation",
         "Strong features identified for modeling",
         "Feature engineering can improve performance"
-    ]
-    
-    for conclusion in conclusions:
-        ax.text(0.15, y_position, f'- {conclusion}', fontsize=10)
-        y_position -= 0.04
-    
-    y_position -= 0.02
-    
-    ax.text(0.1, y_position, 'NEXT STEPS:', fontsize=12, fontweight='bold')
-    y_position -= 0.05
-    
-    next_steps = [
+    ])
+
+    report.section('NEXT STEPS:')
+    report.bullets([
         "1. Advanced feature engineering",
         "2. Handle categorical variables",
         "3. Build predictive models",
         "4. Model evaluation and tuning",
         "5. Results interpretation"
-    ]
-    
-    for step in next_steps:
-        ax.text(0.15, y_position, step, fontsize=10)
-        y_position -= 0.035
-    
-    ax.text(0.1, 0.1, 'Report completed', fontsize=10, style='italic')
-    
-    pdf.savefig(fig, bbox_inches='tight')
-    plt.close()
\ No newline at end of file
+    ], marker='')
+
+    report.spacer(24)
+    report.text('Report completed', size=10, italic=True)
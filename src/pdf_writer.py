@@ -0,0 +1,211 @@
+import io
+import zlib
+
+# Helvetica advance widths (1/1000 em) for ASCII 32-126, from the Adobe core font metrics
+_HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 222, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    222, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+_HELVETICA_BOLD_WIDTHS = [
+    278, 333, 474, 556, 556, 889, 722, 278, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    278, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+]
+_DEFAULT_WIDTH = 556
+
+# (bold, italic) -> (resource name, base font); the oblique faces share upright metrics
+_FONTS = {
+    (False, False): ('F1', 'Helvetica'),
+    (True, False): ('F2', 'Helvetica-Bold'),
+    (False, True): ('F3', 'Helvetica-Oblique'),
+    (True, True): ('F4', 'Helvetica-BoldOblique'),
+}
+
+LETTER = (612, 792)
+
+def text_width(text, size, bold=False):
+    """
+    Width in points of a string set in Helvetica at the given size
+    """
+    widths = _HELVETICA_BOLD_WIDTHS if bold else _HELVETICA_WIDTHS
+    total = 0
+    for char in text:
+        code = ord(char)
+        total += widths[code - 32] if 32 <= code <= 126 else _DEFAULT_WIDTH
+    return total * size / 1000
+
+def _escape(text):
+    """Encode to WinAnsi and escape PDF string delimiters"""
+    raw = text.encode('cp1252', errors='replace')
+    return raw.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+class PdfImage:
+    """
+    RGB raster image stored deflate-compressed, ready to embed in a PdfDocument
+    """
+
+    def __init__(self, width, height, rgb_bytes):
+        if len(rgb_bytes) != width * height * 3:
+            raise ValueError(f"Expected {width * height * 3} RGB bytes, got {len(rgb_bytes)}")
+        self.width = width
+        self.height = height
+        self.data = zlib.compress(rgb_bytes, 6)
+
+    @classmethod
+    def from_figure(cls, fig, dpi=110):
+        """Rasterize a matplotlib figure (white background, alpha dropped)"""
+        import numpy as np
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        # Draw on the Agg canvas and take the size from its buffer: the raster
+        # size is not always round(inches * dpi), and savefig.bbox would crop
+        canvas = fig.canvas if isinstance(fig.canvas, FigureCanvasAgg) else FigureCanvasAgg(fig)
+        original_dpi, original_facecolor = fig.dpi, fig.get_facecolor()
+        try:
+            fig.dpi = dpi
+            fig.set_facecolor('white')
+            canvas.draw()
+            rgba = np.asarray(canvas.buffer_rgba())
+            height, width = rgba.shape[:2]
+            rgb = np.ascontiguousarray(rgba[:, :, :3]).tobytes()
+        finally:
+            fig.dpi = original_dpi
+            fig.set_facecolor(original_facecolor)
+        return cls(width, height, rgb)
+
+class PdfPage:
+    """
+    One page of a PdfDocument; coordinates are points from the bottom-left corner
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self._ops = []
+        self.images = []
+
+    def text(self, x, y, text, size=10, bold=False, italic=False, align='left', gray=0.0):
+        """Draw one line of text with its baseline at y"""
+        if align == 'center':
+            x -= text_width(text, size, bold) / 2
+        elif align == 'right':
+            x -= text_width(text, size, bold)
+        font, _ = _FONTS[(bool(bold), bool(italic))]
+        self._ops.append(b'BT %.3f g /%s %.2f Tf %.2f %.2f Td (%s) Tj ET'
+                         % (gray, font.encode(), size, x, y, _escape(text)))
+
+    def line(self, x1, y1, x2, y2, width=0.5, gray=0.0):
+        """Draw a straight line"""
+        self._ops.append(b'%.3f G %.2f w %.2f %.2f m %.2f %.2f l S'
+                         % (gray, width, x1, y1, x2, y2))
+
+    def rect(self, x, y, width, height, fill_gray=0.9):
+        """Draw a filled rectangle with its lower-left corner at (x, y)"""
+        self._ops.append(b'%.3f g %.2f %.2f %.2f %.2f re f'
+                         % (fill_gray, x, y, width, height))
+
+    def image(self, image, x, y, width, height):
+        """Place a PdfImage scaled into the given box"""
+        if image not in self.images:
+            self.images.append(image)
+        name = b'Im%d' % (self.images.index(image) + 1)
+        self._ops.append(b'q %.2f 0 0 %.2f %.2f %.2f cm /%s Do Q'
+                         % (width, height, x, y, name))
+
+    def content(self):
+        return b'\n'.join(self._ops)
+
+class PdfDocument:
+    """
+    Minimal PDF writer using the standard Helvetica faces and RGB images
+
+    No fonts are embedded and text never goes through matplotlib, so a text
+    page costs a few hundred bytes and microseconds to produce.
+    """
+
+    def __init__(self, page_size=LETTER, title=None):
+        self.page_size = page_size
+        self.title = title
+        self.pages = []
+
+    def add_page(self):
+        page = PdfPage(*self.page_size)
+        self.pages.append(page)
+        return page
+
+    def to_bytes(self):
+        """Serialize the document"""
+        objects = []
+
+        def add(body):
+            objects.append(body)
+            return len(objects)
+
+        catalog_id = add(None)
+        pages_id = add(None)
+        font_ids = {}
+        for name, base_font in _FONTS.values():
+            font_ids[name] = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /%s '
+                                 b'/Encoding /WinAnsiEncoding >>' % base_font.encode())
+        font_resources = b' '.join(b'/%s %d 0 R' % (name.encode(), obj_id)
+                                   for name, obj_id in font_ids.items())
+
+        image_ids = {}
+        page_ids = []
+        for page in self.pages:
+            xobjects = []
+            for index, image in enumerate(page.images, start=1):
+                if id(image) not in image_ids:
+                    image_ids[id(image)] = add(
+                        b'<< /Type /XObject /Subtype /Image /Width %d /Height %d '
+                        b'/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /FlateDecode '
+                        b'/Length %d >>\nstream\n%s\nendstream'
+                        % (image.width, image.height, len(image.data), image.data))
+                xobjects.append(b'/Im%d %d 0 R' % (index, image_ids[id(image)]))
+            resources = b'/Font << %s >>' % font_resources
+            if xobjects:
+                resources += b' /XObject << %s >>' % b' '.join(xobjects)
+
+            data = zlib.compress(page.content())
+            content_id = add(b'<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream'
+                             % (len(data), data))
+            page_ids.append(add(
+                b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] '
+                b'/Resources << %s >> /Contents %d 0 R >>'
+                % (pages_id, page.width, page.height, resources, content_id)))
+
+        kids = b' '.join(b'%d 0 R' % page_id for page_id in page_ids)
+        objects[pages_id - 1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(page_ids))
+        objects[catalog_id - 1] = b'<< /Type /Catalog /Pages %d 0 R >>' % pages_id
+        info_id = None
+        if self.title:
+            info_id = add(b'<< /Title (%s) >>' % _escape(self.title))
+
+        out = io.BytesIO()
+        out.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        offsets = []
+        for obj_id, body in enumerate(objects, start=1):
+            offsets.append(out.tell())
+            out.write(b'%d 0 obj\n%s\nendobj\n' % (obj_id, body))
+
+        xref_offset = out.tell()
+        out.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+        for offset in offsets:
+            out.write(b'%010d 00000 n \n' % offset)
+        trailer = b'<< /Size %d /Root %d 0 R' % (len(objects) + 1, catalog_id)
+        if info_id is not None:
+            trailer += b' /Info %d 0 R' % info_id
+        out.write(b'trailer\n%s >>\nstartxref\n%d\n%%%%EOF\n' % (trailer, xref_offset))
+        return out.getvalue()
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+        return path
@@ -0,0 +1,127 @@
+import io
+import os
+import time
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.collections import Collection
+from matplotlib.image import AxesImage
+
+# dpi: raster resolution; tight_bbox: allow the extra draw for bbox_inches='tight'
+# when the layout is not already fixed; rasterize_dense: rasterize artists with
+# many elements in vector output
+RENDER_PROFILES = {
+    'draft': {'dpi': 72, 'tight_bbox': False, 'rasterize_dense': True},
+    'screen': {'dpi': 110, 'tight_bbox': False, 'rasterize_dense': True},
+    'print': {'dpi': 300, 'tight_bbox': True, 'rasterize_dense': True},
+}
+
+VECTOR_FORMATS = ('pdf', 'svg', 'eps', 'ps')
+
+def get_render_profile(profile='screen'):
+    """
+    Return the settings of a render profile (a name or a settings dict)
+    """
+    if isinstance(profile, dict):
+        return {**RENDER_PROFILES['screen'], **profile}
+    if profile not in RENDER_PROFILES:
+        raise ValueError(f"Unknown render profile '{profile}', "
+                         f"expected one of {list(RENDER_PROFILES)}")
+    return RENDER_PROFILES[profile]
+
+def rasterize_dense_artists(fig, min_elements=500):
+    """
+    Mark images and large collections (heatmap cells, missingness matrix
+    segments, big scatters) as rasterized so vector output stays small
+    """
+    count = 0
+    for ax in fig.axes:
+        for artist in ax.get_children():
+            if isinstance(artist, AxesImage):
+                dense = True
+            elif isinstance(artist, Collection):
+                dense = len(artist.get_paths()) >= min_elements or len(artist.get_offsets()) >= min_elements
+            else:
+                dense = False
+            if dense and not artist.get_rasterized():
+                artist.set_rasterized(True)
+                count += 1
+    return count
+
+def render_figure(fig, fmt='png', profile='screen', fixed_layout=False):
+    """
+    Render a figure to bytes with a render profile
+
+    Returns (data, seconds).
+    """
+    settings = get_render_profile(profile)
+    if settings['rasterize_dense'] and fmt in VECTOR_FORMATS:
+        rasterize_dense_artists(fig)
+
+    savefig_kwargs = {'format': fmt, 'dpi': settings['dpi']}
+    if settings['tight_bbox'] and not fixed_layout:
+        savefig_kwargs['bbox_inches'] = 'tight'
+
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    fig.savefig(buffer, **savefig_kwargs)
+    return buffer.getvalue(), time.perf_counter() - start
+
+def save_figure(fig, path, profile='screen', fixed_layout=False, writer=None, close=True):
+    """
+    Save a figure with a render profile and return size/time stats
+
+    fixed_layout=True means the caller already ran tight_layout (or similar),
+    so the extra draw for bbox_inches='tight' is skipped. With an
+    ArtifactWriter the file write happens in the background.
+    """
+    fmt = os.path.splitext(path)[1].lstrip('.').lower() or 'png'
+    data, seconds = render_figure(fig, fmt, profile, fixed_layout)
+    if close:
+        plt.close(fig)
+
+    if writer is not None:
+        writer.write_bytes(path, data, kind='figure')
+    else:
+        with open(path, 'wb') as f:
+            f.write(data)
+
+    settings = get_render_profile(profile)
+    return {
+        'Path': path,
+        'Profile': profile if isinstance(profile, str) else 'custom',
+        'DPI': settings['dpi'],
+        'Bytes': len(data),
+        'Render_Seconds': seconds,
+    }
+
+def benchmark_render_profiles(fig, fmt='png', profiles=None, fixed_layout=False):
+    """
+    Render a figure with each profile and report file size and render time
+    """
+    if profiles is None:
+        profiles = list(RENDER_PROFILES)
+
+    rows = []
+    for profile in profiles:
+        data, seconds = render_figure(fig, fmt, profile, fixed_layout)
+        rows.append({
+            'Profile': profile,
+            'DPI': get_render_profile(profile)['dpi'],
+            'Format': fmt,
+            'Bytes': len(data),
+            'Render_Seconds': seconds,
+        })
+    return pd.DataFrame(rows)
+
+def print_render_stats(stats):
+    """
+    Print file size and render time per saved figure
+    """
+    stats = pd.DataFrame(stats)
+    print(f"🖼️ Rendered figures: {len(stats)}")
+    for _, row in stats.iterrows():
+        print(f"  {row['Path']} [{row['Profile']}, {row['DPI']} dpi]: "
+              f"{row['Bytes'] / 1024:.1f} KB in {row['Render_Seconds'] * 1000:.0f} ms")
+    if len(stats):
+        print(f"  Total: {stats['Bytes'].sum() / 1024**2:.2f} MB, "
+              f"{stats['Render_Seconds'].sum():.2f} s rendering")
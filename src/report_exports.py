@@ -0,0 +1,203 @@
+import html
+import os
+import pandas as pd
+
+STRENGTH_LABELS = [(0.7, '極強'), (0.5, '強')]
+
+def correlation_strength(correlation):
+    """Strength label of a correlation as used in the CSV and text reports"""
+    for threshold, label in STRENGTH_LABELS:
+        if abs(correlation) > threshold:
+            return label
+    return '中等'
+
+def _write_csv(df, path, writer=None, index=False):
+    if writer is not None:
+        writer.write_csv(df, path, index=index, encoding='utf-8-sig')
+    else:
+        df.to_csv(path, index=index, encoding='utf-8-sig')
+    print(f"✅ 已儲存: {os.path.basename(path)}")
+
+def _write_text(text, path, writer=None):
+    if writer is not None:
+        writer.write_text(path, text)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+    print(f"✅ 已儲存: {os.path.basename(path)}")
+
+def save_analysis_results(result, reports_dir='../reports', writer=None):
+    """
+    Write the CSV tables of an EDAResult
+
+    correlation_analysis.csv, top_correlations.csv, missing_value_report.csv,
+    numeric_statistics.csv and new_features.csv (utf-8-sig, so Excel reads
+    the Chinese headers).
+    """
+    os.makedirs(reports_dir, exist_ok=True)
+    corr_df = result.correlations
+    if corr_df is not None:
+        correlations = pd.DataFrame({'特徵': corr_df['Feature'].to_numpy(),
+                                     '相關係數': corr_df['Correlation'].to_numpy()})
+        _write_csv(correlations, f'{reports_dir}/correlation_analysis.csv', writer)
+        top = correlations.rename(columns={'特徵': '特徵名稱'})
+        top['相關強度'] = top['相關係數'].map(correlation_strength)
+        _write_csv(top, f'{reports_dir}/top_correlations.csv', writer)
+    if result.missing is not None:
+        _write_csv(result.missing, f'{reports_dir}/missing_value_report.csv', writer, index=True)
+    _write_csv(result.numeric_stats, f'{reports_dir}/numeric_statistics.csv', writer, index=True)
+    if result.new_features:
+        _write_csv(pd.DataFrame({'新特徵': result.new_features}), f'{reports_dir}/new_features.csv', writer)
+
+def render_summary_text(result):
+    """Text summary report of an EDAResult"""
+    lines = [
+        "=" * 60,
+        "🏠 房屋價格 EDA 分析報告",
+        "=" * 60,
+        f"生成時間: {result.created.replace('T', ' ')}",
+        "",
+        "📊 資料基本資訊:",
+        f"  • 資料形狀: {result.shape}",
+        f"  • 數值特徵: {result.n_numeric}",
+        f"  • 類別特徵: {result.n_categorical}",
+    ]
+    if result.target is not None:
+        lines.append(f"  • 目標變數範圍: ${result.target.min:,.0f} - ${result.target.max:,.0f}")
+
+    missing_df = result.missing
+    if missing_df is not None:
+        lines += [
+            "",
+            "🕳️ 缺失值分析:",
+            f"  • 有缺失值的欄位: {len(missing_df)} 個",
+            f"  • 總缺失值數量: {result.total_missing}",
+        ]
+        for col, row in missing_df.head(3).iterrows():
+            lines.append(f"  • {col}: {row['Missing_Percent']}% 缺失")
+
+    corr_df = result.correlations
+    if corr_df is not None and len(corr_df) > 1:
+        lines += ["", "📈 重要特徵發現:"]
+        for _, row in corr_df.iloc[1:6].iterrows():
+            lines.append(f"  • {row['Feature']}: {row['Correlation']:.3f} "
+                         f"({correlation_strength(row['Correlation'])})")
+
+    if result.new_features:
+        lines += ["", "🛠️ 特徵工程:", f"  • 新增特徵數量: {len(result.new_features)}"]
+        lines += [f"  • {feature}" for feature in result.new_features[:5]]
+        if len(result.new_features) > 5:
+            lines.append(f"  • ... 還有 {len(result.new_features) - 5} 個特徵")
+
+    if result.drift is not None:
+        counts = result.drift['severity_counts']
+        lines += [
+            "",
+            "📡 資料漂移:",
+            f"  • {result.drift['name']}: 漂移 {counts['drift']}, 警告 {counts['warn']}, 正常 {counts['ok']}",
+        ]
+
+    lines += [
+        "",
+        "💡 後續建議:",
+        "  1. 進行進階特徵工程與選擇",
+        "  2. 處理類別變數編碼",
+        "  3. 建立預測模型",
+        "  4. 模型評估與超參數調優",
+        "",
+        "=" * 60,
+    ]
+    return '\n'.join(lines)
+
+def generate_summary_report(result, reports_dir='../reports', writer=None):
+    """Write eda_summary_report.txt"""
+    os.makedirs(reports_dir, exist_ok=True)
+    path = f'{reports_dir}/eda_summary_report.txt'
+    _write_text(render_summary_text(result), path, writer)
+    return path
+
+def _html_table(df, index=True, float_format='{:,.3f}'.format):
+    return df.to_html(index=index, border=0, classes='table', float_format=float_format, na_rep='-')
+
+def render_html(result):
+    """Self-contained HTML page of an EDAResult (tables only, no scripts)"""
+    sections = []
+
+    overview = [
+        ('Samples', f'{result.n_rows:,}'),
+        ('Features', f'{result.n_columns}'),
+        ('Numeric / Categorical', f'{result.n_numeric} / {result.n_categorical}'),
+        ('Memory Usage', f'{result.memory_mb:.1f} MB'),
+        ('Columns with Missing Values', f'{len(result.missing) if result.missing is not None else 0}'),
+    ]
+    if result.target is not None:
+        overview.append(('Price Range', f'${result.target.min:,.0f} - ${result.target.max:,.0f}'))
+    if result.preview is not None:
+        overview.append(('Preview', result.preview.description))
+    sections.append('<h2>Overview</h2><dl>' + ''.join(
+        f'<dt>{html.escape(name)}</dt><dd>{html.escape(value)}</dd>' for name, value in overview) + '</dl>')
+
+    if result.target is not None:
+        target = pd.Series({'Mean': result.target.mean, 'Median': result.target.median,
+                            'Std': result.target.std, 'Skewness': result.target.skew,
+                            'Kurtosis': result.target.kurtosis}, name=result.target.column)
+        sections.append(f'<h2>Target: {html.escape(result.target.column)}</h2>'
+                        + _html_table(target.to_frame()))
+    if result.missing is not None and len(result.missing) > 0:
+        sections.append('<h2>Missing Values</h2>' + _html_table(result.missing))
+    if result.correlations is not None:
+        sections.append('<h2>Correlation with Target</h2>' + _html_table(result.correlations, index=False))
+    if result.dedup is not None:
+        dedup = pd.Series({key: value for key, value in result.dedup.items()
+                           if isinstance(value, (int, float))}, name='Value')
+        sections.append('<h2>Deduplication</h2>' + _html_table(dedup.to_frame()))
+    if result.drift is not None:
+        checks = result.drift['checks']
+        sections.append(f"<h2>Drift: {html.escape(result.drift['name'])}</h2>"
+                        + _html_table(checks[checks['Severity'] != 'ok'], index=False))
+    if result.new_features:
+        sections.append('<h2>New Features</h2><ul>' + ''.join(
+            f'<li>{html.escape(feature)}</li>' for feature in result.new_features) + '</ul>')
+    sections.append('<h2>Numeric Statistics</h2>' + _html_table(result.numeric_stats))
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(result.title)}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em auto; max-width: 1100px; color: #222; }}
+dl {{ display: grid; grid-template-columns: max-content auto; gap: 0.3em 1.5em; }}
+dt {{ font-weight: bold; }}
+dd {{ margin: 0; }}
+.table {{ border-collapse: collapse; font-size: 0.85em; display: block; overflow-x: auto; }}
+.table th, .table td {{ padding: 0.25em 0.6em; text-align: right; }}
+.table tr:nth-child(even) {{ background: #f2f2f2; }}
+</style>
+</head>
+<body>
+<h1>{html.escape(result.title)}</h1>
+<p>Generated: {html.escape(result.created.replace('T', ' '))}</p>
+{''.join(sections)}
+</body>
+</html>
+"""
+
+def export_eda_result(result, reports_dir='../reports', writer=None,
+                      formats=('csv', 'txt', 'json', 'html')):
+    """
+    Render an EDAResult to the report formats next to the PDF
+
+    csv: save_analysis_results, txt: eda_summary_report.txt, json:
+    eda_result.json (reloadable with EDAResult.load), html: eda_report.html.
+    """
+    os.makedirs(reports_dir, exist_ok=True)
+    if 'csv' in formats:
+        save_analysis_results(result, reports_dir, writer)
+    if 'txt' in formats:
+        generate_summary_report(result, reports_dir, writer)
+    if 'json' in formats:
+        result.save(f'{reports_dir}/eda_result.json', writer)
+        print("✅ 已儲存: eda_result.json")
+    if 'html' in formats:
+        _write_text(render_html(result), f'{reports_dir}/eda_report.html', writer)
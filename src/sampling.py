@@ -0,0 +1,253 @@
+import pandas as pd
+import numpy as np
+
+class DataSample:
+    """
+    A (stratified) random sample of a larger dataset
+
+    frame holds the sampled rows (original row labels kept), strata the
+    stratum of each row and population_counts the number of rows per stratum
+    in the full data, so every row carries the weight
+    population_count / sample_count of its stratum. Statistics estimated
+    from the sample get error bars from a stratified bootstrap.
+    """
+
+    def __init__(self, frame, strata, population_counts, stratify=None, seed=42):
+        self.frame = frame
+        self.strata = np.asarray(strata)
+        self.population_counts = population_counts
+        self.stratify = stratify
+        self.seed = seed
+
+        sample_counts = pd.Series(self.strata).value_counts()
+        weights = population_counts.reindex(sample_counts.index) / sample_counts
+        self.weights = pd.Series(self.strata).map(weights).to_numpy(dtype=np.float64)
+
+    @property
+    def n(self):
+        return len(self.frame)
+
+    @property
+    def n_population(self):
+        return int(self.population_counts.sum())
+
+    def bootstrap_indices(self, n_bootstrap=200, seed=None):
+        """
+        Row positions of `n_bootstrap` stratified bootstrap replicates (B x n)
+
+        Rows are resampled with replacement within their stratum, so every
+        replicate keeps the stratum sizes of the sample.
+        """
+        rng = np.random.default_rng(self.seed if seed is None else seed)
+        indices = np.empty((n_bootstrap, self.n), dtype=np.int64)
+        for stratum in np.unique(self.strata):
+            positions = np.flatnonzero(self.strata == stratum)
+            draws = rng.integers(0, len(positions), size=(n_bootstrap, len(positions)))
+            indices[:, positions] = positions[draws]
+        return indices
+
+    def bootstrap_weights(self, n_bootstrap=200, seed=None):
+        """Row weights of the stratified bootstrap replicates (B x n)"""
+        indices = self.bootstrap_indices(n_bootstrap, seed)
+        offsets = np.arange(n_bootstrap)[:, None] * self.n
+        counts = np.bincount((indices + offsets).ravel(), minlength=n_bootstrap * self.n)
+        return counts.reshape(n_bootstrap, self.n) * self.weights
+
+    def estimate(self, columns=None, n_bootstrap=200, confidence=0.95):
+        """
+        Population estimates with bootstrap standard errors
+
+        For every numeric column: Mean, Std, Median and Missing_Percent, with
+        Std_Error and a percentile confidence interval (Low, High).
+        """
+        if columns is None:
+            columns = [col for col in self.frame.columns
+                       if pd.api.types.is_numeric_dtype(self.frame[col]) and col != 'Id']
+
+        values = self.frame[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        replicates = self.bootstrap_weights(n_bootstrap)
+        all_weights = np.vstack([self.weights, replicates])
+
+        point, boot = [], []
+        for stats in _weighted_column_stats(values, all_weights):
+            point.append(stats[0])
+            boot.append(stats[1:])
+
+        alpha = (1 - confidence) / 2
+        rows = []
+        for j, col in enumerate(columns):
+            for k, name in enumerate(['Mean', 'Std', 'Median', 'Missing_Percent']):
+                estimates = boot[j][:, k]
+                rows.append({
+                    'Column': col,
+                    'Statistic': name,
+                    'Estimate': point[j][k],
+                    'Std_Error': np.nanstd(estimates, ddof=1),
+                    'Low': np.nanquantile(estimates, alpha),
+                    'High': np.nanquantile(estimates, 1 - alpha),
+                })
+        return pd.DataFrame(rows)
+
+    def estimate_missing(self, n_bootstrap=200, confidence=0.95):
+        """
+        Estimated missing percent of every column with bootstrap error bars
+        """
+        missing = self.frame.isnull().to_numpy(dtype=np.float64)
+        weights = np.vstack([self.weights, self.bootstrap_weights(n_bootstrap)])
+        percents = 100 * (weights @ missing) / weights.sum(axis=1)[:, None]
+        alpha = (1 - confidence) / 2
+        return pd.DataFrame({
+            'Missing_Percent': percents[0],
+            'Std_Error': percents[1:].std(axis=0, ddof=1),
+            'Low': np.quantile(percents[1:], alpha, axis=0),
+            'High': np.quantile(percents[1:], 1 - alpha, axis=0),
+        }, index=self.frame.columns)
+
+    def describe(self):
+        return (f"{self.n:,} of {self.n_population:,} rows"
+                f"{f' stratified by {self.stratify}' if self.stratify else ''} (seed {self.seed})")
+
+def _weighted_column_stats(values, weights):
+    """
+    Yield, per column, a (1 + B) x 4 array of weighted mean, std, median and
+    missing percent for every weight vector (row of `weights`)
+    """
+    for j in range(values.shape[1]):
+        column = values[:, j]
+        present = ~np.isnan(column)
+        total = weights.sum(axis=1)
+        observed = weights[:, present]
+        observed_total = observed.sum(axis=1)
+        stats = np.full((len(weights), 4), np.nan)
+        stats[:, 3] = np.clip(100 * (1 - observed_total / total), 0, 100)
+        if present.any():
+            x = column[present]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = observed @ x / observed_total
+                variance = observed @ x ** 2 / observed_total - mean ** 2
+            stats[:, 0] = mean
+            stats[:, 1] = np.sqrt(np.maximum(variance, 0))
+
+            order = np.argsort(x, kind='stable')
+            cumulative = np.cumsum(observed[:, order], axis=1)
+            middle = np.argmax(cumulative >= observed_total[:, None] / 2, axis=1)
+            stats[:, 2] = x[order][middle]
+        yield stats
+
+# ==================== Reservoir sampling ====================
+
+def _stratum_labels(chunk, stratify):
+    codes, uniques = pd.factorize(chunk[stratify])
+    levels = np.append(np.asarray(uniques, dtype=object).astype(str), 'Missing').astype(object)
+    return levels[codes]
+
+def _per_label(values, labels, default):
+    """Look up a per-label Series for every row label"""
+    codes, uniques = pd.factorize(labels)
+    return values.reindex(uniques).fillna(default).to_numpy(dtype=np.float64)[codes]
+
+def _keep_smallest_keys(keys, labels, capacity):
+    """Positions of the `capacity` smallest keys within each label"""
+    codes = pd.factorize(labels)[0]
+    order = np.lexsort((keys, codes))
+    sorted_codes = codes[order]
+    starts = np.r_[0, np.flatnonzero(sorted_codes[1:] != sorted_codes[:-1]) + 1]
+    run_lengths = np.diff(np.r_[starts, len(order)])
+    rank = np.arange(len(order)) - np.repeat(starts, run_lengths)
+    return order[rank < np.broadcast_to(capacity, keys.shape)[order]]
+
+def reservoir_sample(chunks, n=10_000, stratify=None, n_strata=10, min_per_stratum=2,
+                     oversample=4, seed=42):
+    """
+    Single-pass (stratified) random sample from an iterable of dataframes
+
+    Every row gets a uniform random key and the reservoir keeps the rows with
+    the smallest keys, which is a uniform sample without replacement however
+    the input is chunked. Chunk rows whose key cannot enter the reservoir are
+    dropped before any copying, so the pass costs little more than reading.
+
+    stratify=None samples uniformly. A categorical column (e.g.
+    'Neighborhood') keeps a reservoir per level and allocates `n`
+    proportionally, with at least `min_per_stratum` rows per level. A numeric
+    column (e.g. 'SalePrice') is split into `n_strata` quantile bins, with
+    bin edges taken from an `oversample` times larger uniform reservoir.
+    The same seed and input give the same sample.
+    """
+    rng = np.random.default_rng(seed)
+    reservoir, reservoir_keys, reservoir_labels = None, np.empty(0), np.empty(0, dtype=object)
+    population = pd.Series(dtype=np.int64)
+    numeric = None
+
+    for chunk in chunks:
+        keys = rng.random(len(chunk))
+        if stratify is None:
+            labels = np.full(len(chunk), 'All', dtype=object)
+        else:
+            if numeric is None:
+                numeric = pd.api.types.is_numeric_dtype(chunk[stratify])
+            if numeric:
+                labels = np.where(chunk[stratify].isna(), 'Missing', 'All').astype(object)
+            else:
+                labels = _stratum_labels(chunk, stratify)
+        population = population.add(pd.Series(labels).value_counts(), fill_value=0)
+
+        if numeric:
+            capacity = pd.Series(float(n * oversample), index=population.index)
+        else:
+            # Room for twice the running proportional share of each level
+            capacity = np.ceil(2 * n * population / population.sum()) + min_per_stratum
+        if reservoir is not None:
+            # Only rows below the current cut-off of their stratum can enter
+            cutoff = pd.Series(reservoir_keys).groupby(reservoir_labels).agg(['max', 'size'])
+            cutoff = cutoff['max'].where(cutoff['size'] >= capacity.reindex(cutoff.index), 1.0)
+            candidate = keys < _per_label(cutoff, labels, 1.0)
+            chunk, keys, labels = chunk[candidate], keys[candidate], labels[candidate]
+            chunk = pd.concat([reservoir, chunk])
+            keys = np.concatenate([reservoir_keys, keys])
+            labels = np.concatenate([reservoir_labels, labels])
+
+        keep = _keep_smallest_keys(keys, labels, _per_label(capacity, labels, n))
+        reservoir, reservoir_keys, reservoir_labels = chunk.iloc[keep], keys[keep], labels[keep]
+
+    if reservoir is None:
+        raise ValueError("Cannot sample from an empty input")
+
+    if numeric:
+        # Equal-frequency bins from the oversampled reservoir
+        values = reservoir[stratify].to_numpy(dtype=np.float64, na_value=np.nan)
+        present = reservoir_labels != 'Missing'
+        edges = np.unique(np.nanquantile(values[present], np.linspace(0, 1, n_strata + 1)))
+        bins = np.clip(np.searchsorted(edges, values[present], side='right') - 1, 0, len(edges) - 2)
+        reservoir_labels = reservoir_labels.copy()
+        reservoir_labels[present] = [f'Q{b + 1}' for b in bins]
+        n_observed = population.get('All', 0)
+        shares = pd.Series(reservoir_labels[present]).value_counts() / present.sum()
+        population = pd.concat([shares * n_observed, population.drop('All', errors='ignore')])
+
+    # Proportional allocation with a floor for small strata
+    allocation = np.maximum(np.round(n * population / population.sum()), min_per_stratum)
+    allocation = np.minimum(allocation, population)
+    keep = _keep_smallest_keys(reservoir_keys, reservoir_labels,
+                               _per_label(allocation, reservoir_labels, 0))
+    keep = keep[np.argsort(reservoir.index.to_numpy()[keep], kind='stable')]
+    return DataSample(reservoir.iloc[keep], reservoir_labels[keep], population.astype(np.float64),
+                      stratify=stratify, seed=seed)
+
+def sample_dataframe(df, n=10_000, stratify=None, seed=42, **kwargs):
+    """
+    Stratified / uniform sample of an in-memory dataframe (see reservoir_sample)
+    """
+    if n >= len(df):
+        strata = np.full(len(df), 'All', dtype=object)
+        return DataSample(df, strata, pd.Series({'All': float(len(df))}), seed=seed)
+    return reservoir_sample([df], n, stratify, seed=seed, **kwargs)
+
+def print_preview_estimates(estimates, statistic='Mean', top=15):
+    """
+    Print sample estimates with their error bars
+    """
+    rows = estimates[estimates['Statistic'] == statistic].head(top)
+    print(f"🔎 Preview estimates ({statistic}, ± 1 std error):")
+    for _, row in rows.iterrows():
+        print(f"  {row['Column']}: {row['Estimate']:,.2f} ± {row['Std_Error']:,.2f} "
+              f"[{row['Low']:,.2f}, {row['High']:,.2f}]")
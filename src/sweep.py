@@ -0,0 +1,290 @@
+import time
+import pandas as pd
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Settings used by the pipeline today
+SWEEP_DEFAULTS = {
+    'missing_threshold': 80,
+    'top_n': 15,
+    'iqr_multiplier': 1.5,
+    'knn_k': 5,
+}
+
+DEFAULT_GRIDS = {
+    'missing_threshold': np.arange(5, 100, 5),
+    'top_n': np.arange(3, 41),
+    'iqr_multiplier': np.round(np.arange(0.5, 5.01, 0.25), 2),
+    'knn_k': np.arange(1, 31),
+}
+
+OUTLIER_FEATURES = ['GrLivArea', 'TotalBsmtSF', 'LotArea']
+KNN_COLUMNS = ['LotFrontage', 'MasVnrArea', 'GarageYrBlt']
+KNN_FEATURES = [
+    'LotArea', 'OverallQual', 'OverallCond', 'YearBuilt',
+    'YearRemodAdd', 'TotalBsmtSF', '1stFlrSF', '2ndFlrSF',
+    'GrLivArea', 'GarageArea', 'WoodDeckSF', 'OpenPorchSF'
+]
+
+# Held-out queries are matched against the donors in blocks: at most this
+# many queries and this many distance cells (float64) at a time
+KNN_QUERY_BLOCK = 256
+KNN_DISTANCE_CELLS = 2**24
+
+class SweepStats:
+    """
+    Sufficient statistics for sweeping the cleaning thresholds
+
+    Computed once from the data; every grid point is then evaluated from
+    these arrays (binary searches and prefix sums), without touching the
+    dataframe again:
+    - missing percents per column, sorted, with cumulative cell counts
+    - correlations with the target in ranking order, with 2D prefix sums of
+      the absolute feature-feature correlations
+    - per-column quartiles and sorted values, and for every row the smallest
+      IQR multiplier at which it stops being flagged
+    - for each KNN column, the max_k nearest donors of held-out values
+      (found block by block, see KNN_QUERY_BLOCK) and the running means of
+      their values (the prediction for every k)
+    """
+
+    def __init__(self, df, target_col='SalePrice', outlier_cols=None, knn_cols=None,
+                 knn_features=None, max_k=30, mask_rate=0.2, max_queries=1000, seed=42):
+        timings = {}
+        start = time.perf_counter()
+        self._missing_stats(df)
+        timings['missing_threshold'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self._correlation_stats(df, target_col)
+        timings['top_n'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self._outlier_stats(df, outlier_cols or [c for c in OUTLIER_FEATURES if c in df.columns])
+        timings['iqr_multiplier'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self._neighbor_stats(df, knn_cols or [c for c in KNN_COLUMNS if c in df.columns],
+                             knn_features or [c for c in KNN_FEATURES if c in df.columns],
+                             max_k, mask_rate, max_queries, seed)
+        timings['knn_k'] = time.perf_counter() - start
+        self.precompute_seconds = timings
+
+    def _missing_stats(self, df):
+        missing = df.isnull().sum()
+        pct = (missing / len(df) * 100).sort_values()
+        self.missing_columns = pct.index.to_numpy()
+        self.missing_pct = pct.to_numpy()
+        self.missing_cum = np.r_[0, np.cumsum(missing[pct.index].to_numpy())]
+        self.n_rows = len(df)
+
+    def _correlation_stats(self, df, target_col):
+        corr = df.corr(numeric_only=True)
+        ranking = corr[target_col].sort_values(ascending=False)
+        features = ranking.index[1:]
+        self.corr_features = features.to_numpy()
+        self.corr_with_target = ranking.iloc[1:].to_numpy()
+        abs_corr = corr.loc[features, features].abs().fillna(0).to_numpy()
+        self.corr_prefix = np.pad(abs_corr.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0)))
+        self.corr_diagonal = np.r_[0, np.cumsum(np.diag(abs_corr))]
+
+    def _outlier_stats(self, df, columns):
+        self.outlier_cols = list(columns)
+        self.sorted_values, self.quartiles = {}, {}
+        excess = np.zeros(len(df))
+        for col in columns:
+            values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            # Same quantile definition as detect_outliers_iqr
+            q1, q3 = df[col].quantile(0.25), df[col].quantile(0.75)
+            iqr = q3 - q1
+            self.sorted_values[col] = np.sort(values[~np.isnan(values)])
+            self.quartiles[col] = (q1, q3, iqr)
+            if iqr > 0:
+                # Row is an outlier for every multiplier below this value
+                with np.errstate(invalid='ignore'):
+                    distance = np.fmax((q1 - values) / iqr, (values - q3) / iqr)
+                excess = np.fmax(excess, np.nan_to_num(distance, nan=0.0))
+        self.row_excess = np.sort(excess)
+
+    def _neighbor_stats(self, df, columns, features, max_k, mask_rate, max_queries, seed):
+        from sklearn.metrics.pairwise import nan_euclidean_distances
+
+        rng = np.random.default_rng(seed)
+        # KNNImputer measures distance over every column it is fit on
+        knn_frame_cols = list(dict.fromkeys(list(columns) + list(features)))
+        X = df[knn_frame_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        self.knn_cols, self.max_k = [], max_k
+        self.knn_predictions, self.knn_truth, self.knn_scale = {}, {}, {}
+        for col in columns:
+            y = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            observed = np.flatnonzero(~np.isnan(y))
+            n_queries = min(max_queries, int(len(observed) * mask_rate))
+            if n_queries == 0 or len(observed) - n_queries < max_k:
+                continue
+            queries = rng.choice(observed, size=n_queries, replace=False)
+            donors = np.setdiff1d(observed, queries)
+
+            held_out = X[queries].copy()
+            held_out[:, knn_frame_cols.index(col)] = np.nan
+            donor_X = X[donors]
+            # Only the max_k nearest donors of each query are kept, so the
+            # distance matrix never exceeds one block of queries
+            block = max(1, min(KNN_QUERY_BLOCK, KNN_DISTANCE_CELLS // len(donors)))
+            nearest = np.empty((n_queries, max_k), dtype=np.int64)
+            for start in range(0, n_queries, block):
+                distances = nan_euclidean_distances(held_out[start:start + block], donor_X)
+                candidates = np.argpartition(distances, max_k - 1, axis=1)[:, :max_k]
+                order = np.take_along_axis(distances, candidates, axis=1).argsort(axis=1, kind='stable')
+                nearest[start:start + block] = np.take_along_axis(candidates, order, axis=1)
+
+            # Uniform-weight KNN prediction for every k at once
+            neighbor_values = y[donors][nearest]
+            self.knn_predictions[col] = np.cumsum(neighbor_values, axis=1) / np.arange(1, max_k + 1)
+            self.knn_truth[col] = y[queries]
+            self.knn_scale[col] = np.nanstd(y)
+            self.knn_cols.append(col)
+
+def sweep_missing_threshold(stats, thresholds):
+    """
+    Columns dropped by remove_high_missing_columns(threshold) and what is left
+    """
+    rows = []
+    n_columns = len(stats.missing_pct)
+    total_missing = stats.missing_cum[-1]
+    total_observed = n_columns * stats.n_rows - total_missing
+    for threshold in thresholds:
+        kept = np.searchsorted(stats.missing_pct, threshold, side='right')
+        kept_missing = stats.missing_cum[kept]
+        kept_observed = kept * stats.n_rows - kept_missing
+        rows += [
+            ('missing_threshold', threshold, 'Columns_Dropped', n_columns - kept),
+            ('missing_threshold', threshold, 'Missing_Cells_Left_Pct',
+             100 * kept_missing / max(kept * stats.n_rows, 1)),
+            ('missing_threshold', threshold, 'Observed_Values_Kept_Pct',
+             100 * kept_observed / max(total_observed, 1)),
+        ]
+    return rows
+
+def sweep_top_n(stats, values):
+    """
+    Strength and redundancy of the features shown by plot_correlation_analysis(top_n)
+    """
+    rows = []
+    for top_n in values:
+        k = int(min(max(top_n - 1, 1), len(stats.corr_features)))
+        selected = stats.corr_with_target[:k]
+        block_sum = stats.corr_prefix[k, k] - stats.corr_diagonal[k]
+        redundancy = block_sum / (k * (k - 1)) if k > 1 else np.nan
+        rows += [
+            ('top_n', top_n, 'Min_Correlation', selected.min()),
+            ('top_n', top_n, 'Mean_Abs_Correlation', np.abs(selected).mean()),
+            ('top_n', top_n, 'Mean_Redundancy', redundancy),
+        ]
+    return rows
+
+def sweep_iqr_multiplier(stats, multipliers):
+    """
+    Outliers flagged by detect_outliers_iqr with multiplier instead of 1.5
+    """
+    rows = []
+    for multiplier in multipliers:
+        for col in stats.outlier_cols:
+            q1, q3, iqr = stats.quartiles[col]
+            values = stats.sorted_values[col]
+            below = np.searchsorted(values, q1 - multiplier * iqr, side='left')
+            above = len(values) - np.searchsorted(values, q3 + multiplier * iqr, side='right')
+            rows.append(('iqr_multiplier', multiplier, f'Outliers_{col}', below + above))
+        flagged = len(stats.row_excess) - np.searchsorted(stats.row_excess, multiplier, side='right')
+        rows.append(('iqr_multiplier', multiplier, 'Rows_Flagged_Pct',
+                     100 * flagged / max(len(stats.row_excess), 1)))
+    return rows
+
+def sweep_knn_k(stats, ks):
+    """
+    Held-out imputation error of KNNImputer(n_neighbors=k) per KNN column
+    """
+    rows = []
+    for k in ks:
+        k = int(min(k, stats.max_k))
+        nrmse = []
+        for col in stats.knn_cols:
+            errors = stats.knn_predictions[col][:, k - 1] - stats.knn_truth[col]
+            rmse = np.sqrt(np.nanmean(errors ** 2))
+            rows.append(('knn_k', k, f'RMSE_{col}', rmse))
+            nrmse.append(rmse / stats.knn_scale[col])
+        rows.append(('knn_k', k, 'Mean_NRMSE', np.mean(nrmse) if nrmse else np.nan))
+    return rows
+
+SWEEPS = {
+    'missing_threshold': sweep_missing_threshold,
+    'top_n': sweep_top_n,
+    'iqr_multiplier': sweep_iqr_multiplier,
+    'knn_k': sweep_knn_k,
+}
+
+def run_sweep(df=None, grids=None, stats=None, **stats_kwargs):
+    """
+    Evaluate grids of cleaning thresholds from precomputed statistics
+
+    grids maps a parameter ('missing_threshold', 'top_n', 'iqr_multiplier',
+    'knn_k') to the values to try (default: DEFAULT_GRIDS). Pass a SweepStats
+    to reuse the precomputation across calls.
+
+    Returns (results, stats): a tidy table with one row per Parameter /
+    Setting / Metric and the SweepStats.
+    """
+    if stats is None:
+        stats = SweepStats(df, **stats_kwargs)
+    if grids is None:
+        grids = DEFAULT_GRIDS
+    unknown = [name for name in grids if name not in SWEEPS]
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters {unknown}, expected some of {list(SWEEPS)}")
+
+    rows, timings = [], []
+    for name, values in grids.items():
+        start = time.perf_counter()
+        rows += SWEEPS[name](stats, values)
+        seconds = time.perf_counter() - start
+        timings.append((name, len(values), stats.precompute_seconds[name], seconds))
+
+    results = pd.DataFrame(rows, columns=['Parameter', 'Setting', 'Metric', 'Value'])
+    results['Default'] = [SWEEP_DEFAULTS.get(p) == s for p, s in zip(results['Parameter'], results['Setting'])]
+
+    print("🎛️ Threshold sweep:")
+    for name, n_points, precompute, seconds in timings:
+        print(f"  {name}: {n_points} settings, precompute {precompute * 1000:.0f} ms, "
+              f"{seconds / max(n_points, 1) * 1000:.2f} ms per setting")
+    return results, stats
+
+def plot_sweep_sensitivity(results, figsize=(14, 10)):
+    """
+    One panel per swept parameter: every metric against the setting (metrics
+    scaled to their own range), with the current default marked
+    """
+    parameters = list(dict.fromkeys(results['Parameter']))
+    n_cols = 2
+    n_rows = -(-len(parameters) // n_cols)
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=figsize, squeeze=False)
+
+    for ax, parameter in zip(axes.ravel(), parameters):
+        subset = results[results['Parameter'] == parameter]
+        for metric, group in subset.groupby('Metric', sort=False):
+            values = group['Value'].to_numpy(dtype=np.float64)
+            low, high = np.nanmin(values), np.nanmax(values)
+            scaled = (values - low) / (high - low) if high > low else np.zeros_like(values)
+            ax.plot(group['Setting'], scaled, marker='o', markersize=3,
+                    label=f'{metric} [{low:,.3g} - {high:,.3g}]')
+        if parameter in SWEEP_DEFAULTS:
+            ax.axvline(SWEEP_DEFAULTS[parameter], color='gray', linestyle='--', alpha=0.7,
+                       label=f'Default ({SWEEP_DEFAULTS[parameter]})')
+        ax.set_title(parameter)
+        ax.set_xlabel('Setting')
+        ax.set_ylabel('Scaled metric')
+        ax.legend(fontsize=7)
+
+    for ax in axes.ravel()[len(parameters):]:
+        ax.axis('off')
+
+    plt.tight_layout()
+    return fig
@@ -0,0 +1,279 @@
+import pandas as pd
+import numpy as np
+from .encoding import QUALITY_SCALE
+
+# ==================== Ames schema ====================
+# Numeric specs: min/max bounds (inclusive), integer-valued, nullable.
+# Categorical specs: allowed levels (observed levels plus the ones listed in
+# the Kaggle data description), nullable.
+
+_AREA = {'kind': 'numeric', 'min': 0, 'integer': False, 'nullable': True}
+_COUNT = {'kind': 'numeric', 'min': 0, 'max': 20, 'integer': True, 'nullable': True}
+_YEAR = {'kind': 'numeric', 'min': 1800, 'max': 2100, 'integer': True, 'nullable': True}
+_SCORE = {'kind': 'numeric', 'min': 1, 'max': 10, 'integer': True, 'nullable': False}
+_QUALITY = {'kind': 'categorical', 'levels': QUALITY_SCALE[1:], 'nullable': True}
+
+AMES_SCHEMA = {
+    'Id': {'kind': 'numeric', 'min': 1, 'integer': True, 'nullable': False},
+    'MSSubClass': {'kind': 'numeric', 'min': 20, 'max': 190, 'integer': True, 'nullable': False},
+    'MSZoning': {'kind': 'categorical', 'levels': ['A', 'C (all)', 'FV', 'I', 'RH', 'RL', 'RP', 'RM'], 'nullable': True},
+    'LotFrontage': _AREA,
+    'LotArea': {**_AREA, 'nullable': False},
+    'Street': {'kind': 'categorical', 'levels': ['Grvl', 'Pave'], 'nullable': False},
+    'Alley': {'kind': 'categorical', 'levels': ['Grvl', 'Pave'], 'nullable': True},
+    'LotShape': {'kind': 'categorical', 'levels': ['IR1', 'IR2', 'IR3', 'Reg'], 'nullable': False},
+    'LandContour': {'kind': 'categorical', 'levels': ['Bnk', 'HLS', 'Low', 'Lvl'], 'nullable': False},
+    'Utilities': {'kind': 'categorical', 'levels': ['AllPub', 'NoSewr', 'NoSeWa', 'ELO'], 'nullable': True},
+    'LotConfig': {'kind': 'categorical', 'levels': ['Corner', 'CulDSac', 'FR2', 'FR3', 'Inside'], 'nullable': False},
+    'LandSlope': {'kind': 'categorical', 'levels': ['Gtl', 'Mod', 'Sev'], 'nullable': False},
+    'Neighborhood': {'kind': 'categorical', 'levels': [
+        'Blmngtn', 'Blueste', 'BrDale', 'BrkSide', 'ClearCr', 'CollgCr', 'Crawfor', 'Edwards',
+        'Gilbert', 'IDOTRR', 'MeadowV', 'Mitchel', 'NAmes', 'NPkVill', 'NWAmes', 'NoRidge',
+        'NridgHt', 'OldTown', 'SWISU', 'Sawyer', 'SawyerW', 'Somerst', 'StoneBr', 'Timber',
+        'Veenker'], 'nullable': False},
+    'Condition1': {'kind': 'categorical', 'levels': ['Artery', 'Feedr', 'Norm', 'PosA', 'PosN', 'RRAe', 'RRAn', 'RRNe', 'RRNn'], 'nullable': False},
+    'Condition2': {'kind': 'categorical', 'levels': ['Artery', 'Feedr', 'Norm', 'PosA', 'PosN', 'RRAe', 'RRAn', 'RRNe', 'RRNn'], 'nullable': False},
+    'BldgType': {'kind': 'categorical', 'levels': ['1Fam', '2fmCon', 'Duplex', 'Twnhs', 'TwnhsE', 'TwnhsI'], 'nullable': False},
+    'HouseStyle': {'kind': 'categorical', 'levels': ['1.5Fin', '1.5Unf', '1Story', '2.5Fin', '2.5Unf', '2Story', 'SFoyer', 'SLvl'], 'nullable': False},
+    'OverallQual': _SCORE,
+    'OverallCond': _SCORE,
+    'YearBuilt': {**_YEAR, 'nullable': False},
+    'YearRemodAdd': _YEAR,
+    'RoofStyle': {'kind': 'categorical', 'levels': ['Flat', 'Gable', 'Gambrel', 'Hip', 'Mansard', 'Shed'], 'nullable': False},
+    'RoofMatl': {'kind': 'categorical', 'levels': ['ClyTile', 'CompShg', 'Membran', 'Metal', 'Roll', 'Tar&Grv', 'WdShake', 'WdShngl'], 'nullable': False},
+    'Exterior1st': {'kind': 'categorical', 'levels': [
+        'AsbShng', 'AsphShn', 'BrkComm', 'BrkFace', 'CBlock', 'CemntBd', 'HdBoard', 'ImStucc',
+        'MetalSd', 'Other', 'Plywood', 'PreCast', 'Stone', 'Stucco', 'VinylSd', 'Wd Sdng',
+        'WdShing'], 'nullable': True},
+    'Exterior2nd': {'kind': 'categorical', 'levels': [
+        'AsbShng', 'AsphShn', 'Brk Cmn', 'BrkFace', 'CBlock', 'CmentBd', 'HdBoard', 'ImStucc',
+        'MetalSd', 'Other', 'Plywood', 'PreCast', 'Stone', 'Stucco', 'VinylSd', 'Wd Sdng',
+        'Wd Shng'], 'nullable': True},
+    'MasVnrType': {'kind': 'categorical', 'levels': ['BrkCmn', 'BrkFace', 'CBlock', 'None', 'Stone'], 'nullable': True},
+    'MasVnrArea': _AREA,
+    'ExterQual': {**_QUALITY, 'nullable': False},
+    'ExterCond': {**_QUALITY, 'nullable': False},
+    'Foundation': {'kind': 'categorical', 'levels': ['BrkTil', 'CBlock', 'PConc', 'Slab', 'Stone', 'Wood'], 'nullable': False},
+    'BsmtQual': _QUALITY,
+    'BsmtCond': _QUALITY,
+    'BsmtExposure': {'kind': 'categorical', 'levels': ['Av', 'Gd', 'Mn', 'No'], 'nullable': True},
+    'BsmtFinType1': {'kind': 'categorical', 'levels': ['ALQ', 'BLQ', 'GLQ', 'LwQ', 'Rec', 'Unf'], 'nullable': True},
+    'BsmtFinSF1': _AREA,
+    'BsmtFinType2': {'kind': 'categorical', 'levels': ['ALQ', 'BLQ', 'GLQ', 'LwQ', 'Rec', 'Unf'], 'nullable': True},
+    'BsmtFinSF2': _AREA,
+    'BsmtUnfSF': _AREA,
+    'TotalBsmtSF': _AREA,
+    'Heating': {'kind': 'categorical', 'levels': ['Floor', 'GasA', 'GasW', 'Grav', 'OthW', 'Wall'], 'nullable': False},
+    'HeatingQC': {**_QUALITY, 'nullable': False},
+    'CentralAir': {'kind': 'categorical', 'levels': ['N', 'Y'], 'nullable': False},
+    'Electrical': {'kind': 'categorical', 'levels': ['FuseA', 'FuseF', 'FuseP', 'Mix', 'SBrkr'], 'nullable': True},
+    '1stFlrSF': {**_AREA, 'nullable': False},
+    '2ndFlrSF': {**_AREA, 'nullable': False},
+    'LowQualFinSF': {**_AREA, 'nullable': False},
+    'GrLivArea': {**_AREA, 'min': 1, 'nullable': False},
+    'BsmtFullBath': _COUNT,
+    'BsmtHalfBath': _COUNT,
+    'FullBath': {**_COUNT, 'nullable': False},
+    'HalfBath': {**_COUNT, 'nullable': False},
+    'BedroomAbvGr': {**_COUNT, 'nullable': False},
+    'KitchenAbvGr': {**_COUNT, 'nullable': False},
+    'KitchenQual': _QUALITY,
+    'TotRmsAbvGrd': {**_COUNT, 'max': 30, 'nullable': False},
+    'Functional': {'kind': 'categorical', 'levels': ['Maj1', 'Maj2', 'Min1', 'Min2', 'Mod', 'Sal', 'Sev', 'Typ'], 'nullable': True},
+    'Fireplaces': {**_COUNT, 'nullable': False},
+    'FireplaceQu': _QUALITY,
+    'GarageType': {'kind': 'categorical', 'levels': ['2Types', 'Attchd', 'Basment', 'BuiltIn', 'CarPort', 'Detchd'], 'nullable': True},
+    'GarageYrBlt': _YEAR,
+    'GarageFinish': {'kind': 'categorical', 'levels': ['Fin', 'RFn', 'Unf'], 'nullable': True},
+    'GarageCars': _COUNT,
+    'GarageArea': _AREA,
+    'GarageQual': _QUALITY,
+    'GarageCond': _QUALITY,
+    'PavedDrive': {'kind': 'categorical', 'levels': ['N', 'P', 'Y'], 'nullable': False},
+    'WoodDeckSF': {**_AREA, 'nullable': False},
+    'OpenPorchSF': {**_AREA, 'nullable': False},
+    'EnclosedPorch': {**_AREA, 'nullable': False},
+    '3SsnPorch': {**_AREA, 'nullable': False},
+    'ScreenPorch': {**_AREA, 'nullable': False},
+    'PoolArea': {**_AREA, 'nullable': False},
+    'PoolQC': _QUALITY,
+    'Fence': {'kind': 'categorical', 'levels': ['GdPrv', 'GdWo', 'MnPrv', 'MnWw'], 'nullable': True},
+    'MiscFeature': {'kind': 'categorical', 'levels': ['Elev', 'Gar2', 'Othr', 'Shed', 'TenC'], 'nullable': True},
+    'MiscVal': {**_AREA, 'nullable': False},
+    'MoSold': {'kind': 'numeric', 'min': 1, 'max': 12, 'integer': True, 'nullable': False},
+    'YrSold': {**_YEAR, 'nullable': False},
+    'SaleType': {'kind': 'categorical', 'levels': ['COD', 'CWD', 'Con', 'ConLD', 'ConLI', 'ConLw', 'New', 'Oth', 'VWD', 'WD'], 'nullable': True},
+    'SaleCondition': {'kind': 'categorical', 'levels': ['Abnorml', 'AdjLand', 'Alloca', 'Family', 'Normal', 'Partial'], 'nullable': False},
+    'SalePrice': {'kind': 'numeric', 'min': 1, 'integer': False, 'nullable': False},
+}
+
+# (left, operator, right): rows where the comparison is False are violations;
+# rows where either side is missing are skipped
+AMES_CROSS_RULES = [
+    ('YrSold', '>=', 'YearBuilt'),
+    ('YearRemodAdd', '>=', 'YearBuilt'),
+    ('GarageYrBlt', '>=', 'YearBuilt'),
+    ('TotalBsmtSF', '>=', 'BsmtUnfSF'),
+    ('GrLivArea', '>=', '1stFlrSF'),
+]
+
+_OPERATORS = {
+    '>=': np.greater_equal,
+    '>': np.greater,
+    '<=': np.less_equal,
+    '<': np.less,
+    '==': np.equal,
+}
+
+# ==================== Rule evaluation ====================
+
+class _ViolationCollector:
+    """Counts violations per (column, rule) and keeps the first few row labels"""
+
+    def __init__(self, max_examples):
+        self.max_examples = max_examples
+        self.entries = {}
+
+    def add(self, column, rule, index, values, count=None):
+        count = len(index) if count is None else count
+        if count == 0:
+            return
+        key = (column, rule)
+        if key not in self.entries:
+            self.entries[key] = {'Column': column, 'Rule': rule, 'N_Violations': 0,
+                                 'Row_Index': [], 'Examples': []}
+        entry = self.entries[key]
+        entry['N_Violations'] += count
+        room = self.max_examples - len(entry['Row_Index'])
+        if room > 0:
+            entry['Row_Index'].extend(index[:room].tolist())
+            entry['Examples'].extend(values[:room].tolist())
+
+    def report(self):
+        report = pd.DataFrame(list(self.entries.values()),
+                              columns=['Column', 'Rule', 'N_Violations', 'Row_Index', 'Examples'])
+        return report.sort_values('N_Violations', ascending=False).reset_index(drop=True)
+
+def _check_chunk(df, schema, cross_rules, collector, require_target, target_col):
+    """Evaluate all schema rules on one frame"""
+    index = df.index.to_numpy()
+
+    for col, spec in schema.items():
+        if col not in df.columns and (col != target_col or require_target):
+            collector.add(col, 'missing_column', np.array([]), np.array([]), count=1)
+
+    numeric_cols = [col for col, spec in schema.items()
+                    if spec['kind'] == 'numeric' and col in df.columns]
+    if numeric_cols:
+        raw = df[numeric_cols]
+        # Only columns that did not parse as numbers need coercion
+        # Column-major so per-column writes and slices are contiguous
+        block = np.empty((len(df), len(numeric_cols)), dtype=np.float64, order='F')
+        raw_missing = np.empty(block.shape, dtype=bool, order='F')
+        for j, col in enumerate(numeric_cols):
+            values = raw[col]
+            if pd.api.types.is_numeric_dtype(values):
+                block[:, j] = values.to_numpy(dtype=np.float64, na_value=np.nan)
+                raw_missing[:, j] = np.isnan(block[:, j])
+            else:
+                block[:, j] = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+                raw_missing[:, j] = values.isna().to_numpy()
+        coerced_missing = np.isnan(block)
+
+        lo = np.array([schema[c].get('min', -np.inf) for c in numeric_cols], dtype=np.float64)
+        hi = np.array([schema[c].get('max', np.inf) for c in numeric_cols], dtype=np.float64)
+        integer = np.array([schema[c].get('integer', False) for c in numeric_cols])
+        nullable = np.array([schema[c].get('nullable', True) for c in numeric_cols])
+
+        with np.errstate(invalid='ignore'):
+            checks = {
+                'non_numeric': coerced_missing & ~raw_missing,
+                'null': raw_missing & ~nullable,
+                'below_min': block < lo,
+                'above_max': block > hi,
+                'non_integer': (block != np.floor(block)) & ~coerced_missing & integer,
+            }
+        for rule, failed in checks.items():
+            for j in np.flatnonzero(failed.any(axis=0)):
+                rows = np.flatnonzero(failed[:, j])
+                col = numeric_cols[j]
+                examples = raw[col].iloc[rows[:collector.max_examples]].to_numpy(dtype=object)
+                collector.add(col, rule, index[rows], examples)
+
+    for col, spec in schema.items():
+        if spec['kind'] != 'categorical' or col not in df.columns:
+            continue
+        # One hashing pass per column (none for category dtype); the level
+        # check runs on the uniques only
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+        else:
+            codes, uniques = pd.factorize(values)
+        missing = codes < 0
+        bad_unique = ~pd.Index(uniques).isin(spec['levels'])
+        if bad_unique.any():
+            unknown = np.zeros(len(codes), dtype=bool)
+            unknown[~missing] = bad_unique[codes[~missing]]
+            rows = np.flatnonzero(unknown)
+            examples = np.asarray(uniques, dtype=object)[codes[rows[:collector.max_examples]]]
+            collector.add(col, 'unknown_level', index[rows], examples)
+        if not spec.get('nullable', True) and missing.any():
+            collector.add(col, 'null', index[missing],
+                          np.full(min(missing.sum(), collector.max_examples), None, dtype=object))
+
+    for left, op, right in cross_rules:
+        if left not in df.columns or right not in df.columns:
+            continue
+        a = pd.to_numeric(df[left], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        b = pd.to_numeric(df[right], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        comparable = ~np.isnan(a) & ~np.isnan(b)
+        failed = comparable & ~_OPERATORS[op](a, b, where=comparable, out=np.ones(len(a), dtype=bool))
+        pairs = np.array([f'{x:g} vs {y:g}' for x, y in
+                          zip(a[failed][:collector.max_examples], b[failed][:collector.max_examples])],
+                         dtype=object)
+        collector.add(f'{left}/{right}', f'{left} {op} {right}', index[failed], pairs)
+
+def validate_dataframe(df, schema=AMES_SCHEMA, cross_rules=AMES_CROSS_RULES,
+                       require_target=True, target_col='SalePrice', max_examples=5):
+    """
+    Check a dataframe against a column schema with vectorized rules
+
+    Returns one row per (column, rule) that failed, with the violation count,
+    the first `max_examples` row labels and offending values. An empty frame
+    means the data passed.
+    """
+    collector = _ViolationCollector(max_examples)
+    _check_chunk(df, schema, cross_rules, collector, require_target, target_col)
+    return collector.report()
+
+def validate_chunks(chunks, schema=AMES_SCHEMA, cross_rules=AMES_CROSS_RULES,
+                    require_target=True, target_col='SalePrice', max_examples=5):
+    """
+    Streaming variant of validate_dataframe over an iterable of chunks
+
+    Row labels come from the chunk index, which pd.read_csv(chunksize=...)
+    numbers continuously across chunks.
+    """
+    collector = _ViolationCollector(max_examples)
+    missing_reported = False
+    for chunk in chunks:
+        rules = schema
+        if missing_reported:
+            # Column presence only needs reporting once
+            rules = {col: spec for col, spec in schema.items() if col in chunk.columns}
+        _check_chunk(chunk, rules, cross_rules, collector, require_target, target_col)
+        missing_reported = True
+    return collector.report()
+
+def print_validation_report(report, name='dataset'):
+    """
+    Print a compact summary of a validation report
+    """
+    if len(report) == 0:
+        print(f"✅ {name}: all schema checks passed")
+        return
+    print(f"⚠️  {name}: {report['N_Violations'].sum()} violations in {len(report)} checks")
+    for _, row in report.iterrows():
+        print(f"  - {row['Column']} [{row['Rule']}]: {row['N_Violations']} rows, "
+              f"e.g. rows {row['Row_Index']} -> {row['Examples']}")
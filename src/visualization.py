@@ -2,39 +2,110 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 import pandas as pd
+from .encoding import build_encoded_frame
+from .association import compute_feature_associations
+from .distribution import (StreamingDistribution, rebin_counts, binned_kde,
+                           scott_bandwidth, binned_std)
+from .memoize import memoize
 
-def plot_price_distribution(df, price_col='SalePrice', figsize=(12, 5)):
+@memoize
+def _price_distribution(df, price_col):
+    """Binned distribution of a column, cached; the figure is drawn on every call"""
+    return StreamingDistribution().update(df[price_col].to_numpy(dtype=np.float64, na_value=np.nan))
+
+def plot_price_distribution(df=None, price_col='SalePrice', figsize=(12, 5),
+                            distribution=None, display_bins=50, preview=None):
     """
     Plot price distribution
+
+    Works from binned counts: pass a StreamingDistribution accumulated over
+    chunks (see accumulate_distribution), or a dataframe which is binned in
+    one pass. The KDE is an FFT convolution over the bins, so render time
+    does not depend on the number of rows. With preview=DataSample the
+    sample is plotted and the confidence interval of the mean is shaded.
     """
+    if preview is not None:
+        df = preview.frame
+    if distribution is None:
+        distribution = _price_distribution(df, price_col)
+    
     fig, axes = plt.subplots(1, 2, figsize=figsize)
     
     # Original distribution
-    sns.histplot(df[price_col], kde=True, ax=axes[0], color='skyblue')
-    axes[0].axvline(df[price_col].mean(), color='red', linestyle='--', alpha=0.7, label='Mean')
-    axes[0].axvline(df[price_col].median(), color='green', linestyle='--', alpha=0.7, label='Median')
-    axes[0].set_title(f'{price_col} Distribution\nSkewness: {df[price_col].skew():.3f}')
+    _plot_binned(axes[0], distribution.raw.counts, distribution.raw.edges,
+                 scott_bandwidth(distribution.std, distribution.n), display_bins, 'skyblue')
+    if preview is None:
+        axes[0].axvline(distribution.mean, color='red', linestyle='--', alpha=0.7, label='Mean')
+        axes[0].axvline(distribution.median, color='green', linestyle='--', alpha=0.7, label='Median')
+    title = f'{price_col} Distribution\nSkewness: {distribution.skew:.3f}'
+    if preview is not None:
+        # Lines and band are the weighted population estimates, not the
+        # plain sample statistics, so the mean line sits inside its CI
+        estimates = preview.estimate([price_col]).set_index('Statistic')
+        mean, median = estimates.loc['Mean'], estimates.loc['Median']
+        axes[0].axvline(mean['Estimate'], color='red', linestyle='--', alpha=0.7, label='Mean (est.)')
+        axes[0].axvline(median['Estimate'], color='green', linestyle='--', alpha=0.7, label='Median (est.)')
+        axes[0].axvspan(mean['Low'], mean['High'], color='red', alpha=0.15, label='Mean 95% CI (est.)')
+        title = f'{price_col} Distribution (preview: {preview.n:,} of {preview.n_population:,})\nSkewness: {distribution.skew:.3f}'
+    axes[0].set_title(title)
+    axes[0].set_xlabel(price_col)
     axes[0].legend()
     
     # Log transformed distribution
-    sns.histplot(np.log1p(df[price_col]), kde=True, ax=axes[1], color='lightcoral')
+    log_counts, log_edges = distribution.log.counts, distribution.log.edges
+    log_bandwidth = scott_bandwidth(binned_std(log_counts, log_edges), log_counts.sum())
+    _plot_binned(axes[1], log_counts, log_edges, log_bandwidth, display_bins, 'lightcoral')
     axes[1].set_title(f'{price_col} Log-Transformed')
+    axes[1].set_xlabel(price_col)
     
     plt.tight_layout()
     return fig
 
-def plot_correlation_analysis(df, target_col='SalePrice', top_n=15, figsize=(14, 10)):
+def _plot_binned(ax, counts, edges, bandwidth, display_bins, color):
+    """Draw a histogram with KDE overlay from fine binned counts"""
+    # Trim empty tails so the display bins cover the observed range
+    nonzero = np.flatnonzero(counts)
+    if len(nonzero):
+        counts = counts[nonzero[0]:nonzero[-1] + 1]
+        edges = edges[nonzero[0]:nonzero[-1] + 2]
+    
+    display_counts, display_edges = rebin_counts(counts, edges, display_bins)
+    ax.stairs(display_counts, display_edges, fill=True, color=color, alpha=0.6)
+    ax.stairs(display_counts, display_edges, color=color)
+    
+    density = binned_kde(counts, edges, bandwidth)
+    centers = (edges[:-1] + edges[1:]) / 2
+    widths = np.diff(display_edges)
+    ax.plot(centers, density * counts.sum() * np.median(widths), color=color)
+    ax.set_ylabel('Count')
+
+def plot_correlation_analysis(df, target_col='SalePrice', top_n=15, figsize=(14, 10),
+                              include_categorical=False, method='pearson', preview=None,
+                              **association_kwargs):
     """
     Correlation analysis and visualization
+
+    With include_categorical=True, quality scales are ranked by their ordinal
+    codes and other categorical columns by out-of-fold target encoding.
+    With method='association', features are ranked by the mixed-type
+    association score from compute_feature_associations (eta for
+    categoricals, Pearson for numeric columns).
+
+    With preview=DataSample the analysis runs on the preview sample and the
+    bars get bootstrap error bars (Correlation_Low / Correlation_High in the
+    returned dataframe).
     """
-    # Calculate correlations
-    corr_with_target = df.corr(numeric_only=True)[target_col].sort_values(ascending=False)
+    corr_with_target, bounds, corr_matrix = _correlation_stats(
+        df, target_col, top_n, include_categorical, method, preview, **association_kwargs)
     
     # Create correlation dataframe
     corr_df = pd.DataFrame({
         'Feature': corr_with_target.head(top_n).index,
         'Correlation': corr_with_target.head(top_n).values
     })
+    if bounds is not None:
+        corr_df['Correlation_Low'] = corr_df['Feature'].map(bounds['Low']).to_numpy()
+        corr_df['Correlation_High'] = corr_df['Feature'].map(bounds['High']).to_numpy()
     
     # Plot correlation bar chart
     fig, axes = plt.subplots(1, 2, figsize=figsize)
@@ -43,7 +114,13 @@ def plot_correlation_analysis(df, target_col='SalePrice', top_n=15, figsize=(14,
     top_corr = corr_with_target.head(top_n).iloc[1:]  # Exclude target variable itself
     colors = ['green' if x > 0.6 else 'blue' for x in top_corr.values]
     
-    axes[0].barh(range(len(top_corr)), top_corr.values, color=colors, alpha=0.7)
+    xerr = None
+    if bounds is not None:
+        top_bounds = bounds.reindex(top_corr.index)
+        xerr = np.vstack([top_corr.values - top_bounds['Low'].to_numpy(),
+                          top_bounds['High'].to_numpy() - top_corr.values]).clip(min=0)
+    axes[0].barh(range(len(top_corr)), top_corr.values, color=colors, alpha=0.7,
+                 xerr=xerr, ecolor='gray', capsize=3)
     axes[0].set_yticks(range(len(top_corr)))
     axes[0].set_yticklabels(top_corr.index)
     axes[0].set_xlabel('Correlation Coefficient')
@@ -54,13 +131,67 @@ def plot_correlation_analysis(df, target_col='SalePrice', top_n=15, figsize=(14,
         axes[0].text(v + 0.01, i, f'{v:.3f}', va='center')
     
     # Heatmap
-    top_features = corr_with_target.head(top_n).index
-    corr_matrix = df[top_features].corr()
-    
     mask = np.triu(np.ones_like(corr_matrix, dtype=bool))
     sns.heatmap(corr_matrix, mask=mask, annot=True, cmap='coolwarm', center=0, 
                 fmt='.2f', square=True, ax=axes[1], cbar_kws={"shrink": .8})
     axes[1].set_title(f'Top {top_n} Features Correlation Heatmap')
     
     plt.tight_layout()
-    return fig, corr_df
\ No newline at end of file
+    return fig, corr_df
+
+@memoize
+def _correlation_stats(df, target_col, top_n, include_categorical, method, preview,
+                       **association_kwargs):
+    """
+    Correlations behind plot_correlation_analysis, cached; the figure is
+    drawn on every call
+
+    Returns (correlation with the target, error bar bounds or None,
+    correlation matrix of the top_n features).
+    """
+    bounds = None
+    if preview is not None:
+        df = preview.frame
+    if method == 'association':
+        associations = compute_feature_associations(df, target_col, preview=preview,
+                                                    **association_kwargs)
+        corr_with_target = pd.concat([
+            pd.Series({target_col: 1.0}),
+            associations.set_index('Feature')['Correlation']
+        ])
+        if 'Association_Low' in associations.columns:
+            sign = np.sign(associations['Correlation']).replace(0, 1)
+            low, high = sign * associations['Association_Low'], sign * associations['Association_High']
+            bounds = pd.DataFrame({'Low': np.minimum(low, high), 'High': np.maximum(low, high)})
+            bounds.index = associations['Feature']
+        df = build_encoded_frame(df, target_col)
+    else:
+        if include_categorical:
+            df = build_encoded_frame(df, target_col)
+        
+        # Calculate correlations
+        corr_with_target = df.corr(numeric_only=True)[target_col].sort_values(ascending=False)
+        if preview is not None:
+            bounds = _bootstrap_correlation_bounds(df, corr_with_target.head(top_n).index[1:],
+                                                   target_col, preview)
+    
+    top_features = corr_with_target.head(top_n).index
+    return corr_with_target, bounds, df[top_features].corr()
+
+def _bootstrap_correlation_bounds(df, features, target_col, preview, n_bootstrap=200,
+                                  confidence=0.95):
+    """Percentile intervals of the correlation with the target over the
+    stratified bootstrap replicates of a preview sample"""
+    X = df[list(features)].to_numpy(dtype=np.float64, na_value=np.nan)
+    y = df[target_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    estimates = np.empty((n_bootstrap, X.shape[1]))
+    for b, idx in enumerate(preview.bootstrap_indices(n_bootstrap)):
+        Xb, yb = X[idx], y[idx]
+        for j in range(X.shape[1]):
+            valid = ~(np.isnan(Xb[:, j]) | np.isnan(yb))
+            with np.errstate(invalid='ignore', divide='ignore'):
+                estimates[b, j] = np.corrcoef(Xb[valid, j], yb[valid])[0, 1] if valid.sum() > 2 else np.nan
+    alpha = (1 - confidence) / 2
+    return pd.DataFrame({'Low': np.nanquantile(estimates, alpha, axis=0),
+                         'High': np.nanquantile(estimates, 1 - alpha, axis=0)},
+                        index=list(features))
\ No newline at end of file